@@ -4,14 +4,72 @@
 # that might use standard library modules (like socket, threading).
 import eventlet
 eventlet.monkey_patch()
+from eventlet.hubs import trampoline
 
-from flask import Flask, request, jsonify
-from flask_socketio import SocketIO, emit
+from flask import Flask, Response, request, jsonify, stream_with_context, url_for
+from flask_socketio import SocketIO, ConnectionRefusedError, emit, join_room, leave_room, rooms
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from socketio import PubSubManager, KafkaManager, KombuManager, RedisManager, ZmqManager
+from sqlalchemy import case, delete, event, exists, insert, inspect, literal, null, select, text, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, aliased, joinedload, subqueryload
+from sqlalchemy.schema import CreateTable
 import os
+import click
+import csv
+import functools
+import gzip
+import heapq
+import json
+import math
 import random
+import sys
+import threading
+import time
+import uuid
+from itertools import chain, islice
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, date
+from select import select as wait_readable
+import zlib
+from collections import OrderedDict, deque
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    from psycopg2 import sql as pg_sql
+except ImportError: # Only needed for PostgreSQL databases / message queues
+    psycopg2 = None
+
+def wait_cooperatively(conn, timeout=None):
+    """psycopg2 wait callback that yields to other green threads while a query
+    waits on the server. psycopg2 is a C extension, so eventlet.monkey_patch()
+    cannot make its socket I/O cooperative; without this one slow query stalls
+    every request and Socket.IO client of the worker."""
+    while True:
+        state = conn.poll()
+        if state == psycopg2.extensions.POLL_OK:
+            return
+        if state == psycopg2.extensions.POLL_READ:
+            trampoline(conn.fileno(), read=True)
+        elif state == psycopg2.extensions.POLL_WRITE:
+            trampoline(conn.fileno(), write=True)
+        else:
+            raise psycopg2.OperationalError(f"Bad result from poll: {state!r}")
+
+if psycopg2 is not None:
+    psycopg2.extensions.set_wait_callback(wait_cooperatively)
+
+try:
+    import msgpack
+except ImportError: # Only needed for /snapshot?format=msgpack
+    msgpack = None
+
+try:
+    import brotli
+except ImportError: # /snapshot falls back to gzip
+    brotli = None
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -29,13 +87,202 @@ app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     "pool_pre_ping": True,  # Test connections before use
     "pool_recycle": 3600,   # Recycle connections after 1 hour (common for cloud DBs)
     "pool_timeout": 30,     # Max wait for a connection from the pool (seconds)
+    # Every request is a green thread (up to gunicorn's --worker-connections, 1000 by
+    # default, most of them idle Socket.IO clients), but only the ones inside a query
+    # need a connection. The pool caps those at DB_POOL_SIZE + DB_MAX_OVERFLOW per
+    # worker; further requests wait up to pool_timeout instead of opening a connection
+    # each and exhausting the server's max_connections.
+    "pool_size": int(os.environ.get('DB_POOL_SIZE', 10)),
+    "max_overflow": int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+}
+# How often (seconds) a worker re-checks its cached meet state against the database
+# for writes made by other workers. 0 checks on every read; -1 never checks, which
+# is only safe with a single worker process.
+app.config['MEET_STATE_REVALIDATE_SECONDS'] = float(os.environ.get('MEET_STATE_REVALIDATE_SECONDS', 1.0))
+# Number of platforms lifting in parallel. Each platform (1..MEET_PLATFORMS) has its own
+# meet state row, active lift, lifting queue and Socket.IO room.
+app.config['MEET_PLATFORMS'] = int(os.environ.get('MEET_PLATFORMS', 1))
+# How often (seconds) cached GET responses re-check the change log for writes made by
+# other workers (own writes are seen immediately). 0 checks on every request.
+app.config['RESPONSE_CACHE_REVALIDATE_SECONDS'] = float(os.environ.get('RESPONSE_CACHE_REVALIDATE_SECONDS', 1.0))
+# Create, migrate and seed the database on a worker's first use when the schema is
+# missing or behind. Turn off where `flask --app app init-db` runs as a release step.
+app.config['AUTO_INIT_DB'] = os.environ.get('AUTO_INIT_DB', '1') != '0'
+# Warm a worker up (schema check, cache restore) right after create_app() instead of
+# on its first request.
+app.config['WARM_UP_ON_START'] = os.environ.get('WARM_UP_ON_START', '1') != '0'
+# Seconds between snapshots of the in-memory caches (lifting queue, meet states,
+# leaderboard). A starting worker restores the latest one and replays the change log
+# after it instead of reloading every table. 0 disables taking snapshots.
+app.config['CACHE_SNAPSHOT_SECONDS'] = float(os.environ.get('CACHE_SNAPSHOT_SECONDS', 60))
+# Longest change-log tail replayed on top of a snapshot; beyond it the caches load from scratch.
+app.config['CACHE_REPLAY_LIMIT'] = int(os.environ.get('CACHE_REPLAY_LIMIT', 10000))
+# Name of the meet a new database starts with (later meets are created with POST /meets).
+app.config['MEET_NAME'] = os.environ.get('MEET_NAME', 'Meet 1')
+# Competition day (YYYY-MM-DD) that lifter ages, and so age classes, are computed for
+# when the active meet has no meet_date. Unset uses the current date.
+app.config['MEET_DATE'] = (datetime.strptime(os.environ['MEET_DATE'], '%Y-%m-%d').date()
+                           if os.environ.get('MEET_DATE') else None)
+# Seconds a lifter has after an attempt is decided to declare their next one. 0 disables.
+app.config['ATTEMPT_DECLARATION_SECONDS'] = float(os.environ.get('ATTEMPT_DECLARATION_SECONDS', 60))
+# Message queue that carries Socket.IO events between worker processes, so an emit
+# from one worker reaches displays connected to any other. Unset keeps events
+# in-process, which is only correct with a single worker. A postgresql:// URL uses
+# LISTEN/NOTIFY on that server (the meet database itself works); redis://, amqp://,
+# kafka:// and zmq+tcp:// URLs use the matching python-socketio backend, which needs
+# its client package (redis, kombu, kafka-python, pyzmq) installed.
+app.config['SOCKETIO_MESSAGE_QUEUE'] = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+app.config['SOCKETIO_CHANNEL'] = os.environ.get('SOCKETIO_CHANNEL', 'flask-socketio')
+# Per-event batching windows in milliseconds ("event=ms,event=ms"). Emits of a batched
+# event within the window are collapsed into one message per room. Its payload is the
+# usual single object when the window saw one entity, else the list of payloads
+# (merged per entity id), so listeners of a batched event must accept both.
+app.config['SOCKETIO_BATCH_MS'] = {
+    event.strip(): float(ms)
+    for event, _, ms in (item.partition('=') for item in
+                         os.environ.get('SOCKETIO_BATCH_MS', 'lifter_updated=50,leaderboard_updated=100').split(','))
+    if event.strip()
 }
+# Socket.IO emits waiting for the background sender (see EmitQueue). When this many
+# are pending, the emitting request sends the oldest one itself. 0 emits inline.
+app.config['SOCKETIO_EMIT_QUEUE_SIZE'] = int(os.environ.get('SOCKETIO_EMIT_QUEUE_SIZE', 1000))
+# Built-in metrics (GET /metrics). 0 turns counting off.
+app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', '1') != '0'
+# Requests slower than this (ms) are counted and logged, and kept with their stack
+# samples while the profiler is on.
+app.config['SLOW_REQUEST_MS'] = float(os.environ.get('SLOW_REQUEST_MS', 500))
+# Sampling profiler for slow requests; also switched at runtime with POST /metrics/profiler.
+app.config['PROFILER_ENABLED'] = os.environ.get('PROFILER_ENABLED', '0') == '1'
+app.config['PROFILER_INTERVAL_MS'] = float(os.environ.get('PROFILER_INTERVAL_MS', 5))
 db = SQLAlchemy(app)
 
+# --- Socket.IO Message Queue ---
+
+class CacheCoherentManager:
+    """
+    Mixin for the pub/sub client managers. Every state change is broadcast, so an
+    event published by another worker tells this worker which of its in-process
+    caches are stale (see apply_foreign_event).
+    """
+    def _handle_emit(self, message):
+        if message.get('host_id') != self.host_id:
+            try:
+                apply_foreign_event(message.get('event'), message.get('data'), message.get('room'))
+            except Exception:
+                app.logger.exception("Cannot apply %r from another worker; dropping the caches", message.get('event'))
+                invalidate_meet_caches()
+                table_revisions.invalidate()
+        super()._handle_emit(message)
+
+
+class PostgresNotifyManager(CacheCoherentManager, PubSubManager):
+    """
+    Socket.IO client manager that shares events between workers through
+    PostgreSQL LISTEN/NOTIFY. NOTIFY payloads are capped at 8000 bytes, so
+    messages are JSON-encoded and sent as "<message id>:<index>:<count>:<chunk>"
+    notifications in one transaction and reassembled by the listeners.
+    """
+    name = 'postgresql'
+    chunk_size = 7900
+
+    def __init__(self, url, channel='flask-socketio', write_only=False, logger=None):
+        if psycopg2 is None:
+            raise RuntimeError("PostgreSQL message queue requires psycopg2 (pip install psycopg2-binary)")
+        _, rest = url.split('://', 1)
+        self.dsn = 'postgresql://' + rest # libpq does not understand SQLAlchemy's "+driver" suffix
+        self._conn = None
+        self._publish_lock = threading.Lock()
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+
+    def _publish(self, data):
+        payload = json.dumps(data, separators=(',', ':')) # ASCII only, so chunk_size characters fit in 8000 bytes
+        chunks = [payload[i:i + self.chunk_size] for i in range(0, len(payload), self.chunk_size)]
+        message_id = uuid.uuid4().hex
+        with self._publish_lock:
+            for retry in (True, False):
+                try:
+                    if self._conn is None or self._conn.closed:
+                        self._conn = psycopg2.connect(self.dsn)
+                    with self._conn, self._conn.cursor() as cursor:
+                        for index, chunk in enumerate(chunks):
+                            cursor.execute("SELECT pg_notify(%s, %s)",
+                                           (self.channel, f"{message_id}:{index}:{len(chunks)}:{chunk}"))
+                    return
+                except psycopg2.Error as e:
+                    self._conn = None
+                    self._get_logger().error(f"Cannot publish to PostgreSQL ({e})... "
+                                             f"{'retrying' if retry else 'giving up'}")
+
+    def _listen(self):
+        while True:
+            conn = None
+            partial = {}
+            try:
+                conn = psycopg2.connect(self.dsn)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(pg_sql.SQL("LISTEN {}").format(pg_sql.Identifier(self.channel)))
+                while True:
+                    if not wait_readable([conn], [], [], 5)[0]:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        message_id, index, count, chunk = conn.notifies.pop(0).payload.split(':', 3)
+                        if count == '1':
+                            yield json.loads(chunk)
+                            continue
+                        parts = partial.setdefault(message_id, {})
+                        parts[int(index)] = chunk
+                        if len(parts) == int(count):
+                            del partial[message_id]
+                            yield json.loads(''.join(parts[i] for i in range(len(parts))))
+            except psycopg2.Error as e:
+                self._get_logger().error(f"PostgreSQL listener failed ({e}), reconnecting in 1s")
+                time.sleep(1)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+
+class CoherentRedisManager(CacheCoherentManager, RedisManager):
+    pass
+
+
+class CoherentKafkaManager(CacheCoherentManager, KafkaManager):
+    pass
+
+
+class CoherentZmqManager(CacheCoherentManager, ZmqManager):
+    pass
+
+
+class CoherentKombuManager(CacheCoherentManager, KombuManager):
+    pass
+
+
+def create_client_manager(url, channel):
+    """Picks the Socket.IO client manager for a message queue URL (None = in-process)."""
+    if not url:
+        return None
+    if url.startswith(('postgres://', 'postgresql://', 'postgresql+')):
+        manager_class = PostgresNotifyManager
+    elif url.startswith(('redis://', 'rediss://')):
+        manager_class = CoherentRedisManager
+    elif url.startswith('kafka://'):
+        manager_class = CoherentKafkaManager
+    elif url.startswith('zmq'):
+        manager_class = CoherentZmqManager
+    else:
+        manager_class = CoherentKombuManager
+    return manager_class(url, channel=channel)
+
+
 # Initialize SocketIO with explicit CORS configuration for ANY origin.
 # !!! IMPORTANT: This is for debugging purposes ONLY. For production,
 # !!! you should restrict this to your actual frontend URL(s).
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*",
+                    client_manager=create_client_manager(app.config['SOCKETIO_MESSAGE_QUEUE'],
+                                                         app.config['SOCKETIO_CHANNEL']))
 
 # Explicitly register a teardown function for the database session
 @app.teardown_appcontext
@@ -48,37 +295,378 @@ JUDGE_PINS = {
     "2222": "Judge 2",
     "3333": "Judge 3",
 }
+# Lift column each judge writes their decision to
+JUDGE_SCORE_COLUMNS = {
+    "Judge 1": 'judge1_score',
+    "Judge 2": 'judge2_score',
+    "Judge 3": 'judge3_score',
+}
+# Attempt declaration rules
+ATTEMPT_WEIGHT_STEP = 2.5  # Declared weights are multiples of this (kg)
+ATTEMPT_CHANGE_LIMIT = 2   # Weight changes allowed per attempt after it has been declared
+# Competition order: every flight does its three attempts of a lift before the next
+# flight starts, and all flights finish a lift before the next lift begins
+LIFT_ORDER = ('squat', 'bench', 'deadlift')
+ATTEMPTS_PER_LIFT = 3
+# Bar loading (kg): competition bar, one collar per side and the plates available
+BAR_WEIGHT = 20.0
+COLLAR_WEIGHT = 2.5
+PLATE_WEIGHTS = (25.0, 20.0, 15.0, 10.0, 5.0, 2.5, 1.25, 0.5, 0.25)
+LOADING_PREVIEW = 3 # Upcoming lifts shown to the loaders after the one on the platform
+
+# Helper functions to calculate age
+def meet_date():
+    """Competition day of the current meet: its meet_date, else MEET_DATE, else today."""
+    return current_meet.date() or app.config['MEET_DATE'] or date.today()
+
+@functools.lru_cache(maxsize=8192)
+def age_on(born, day):
+    return day.year - born.year - ((day.month, day.day) < (born.month, born.day))
+
+def calculate_age(born, on=None):
+    """Age on `on` (default: the meet date), memoized per (birth date, day)."""
+    return age_on(born, on or meet_date())
+
+# --- Metrics ---
+# Built-in instrumentation, served by GET /metrics in the Prometheus text format:
+# request latency and SQL statements per route, Socket.IO emits per event, connected
+# clients and database pool use. Every worker process counts its own (one gunicorn
+# worker serves the whole meet). Requests slower than SLOW_REQUEST_MS are counted and
+# logged, and while the profiler is on their stack samples are kept for
+# GET /metrics/profiler.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+# name -> (type, help, histogram buckets)
+METRIC_DEFINITIONS = {
+    'meet_http_requests_total': ('counter', "HTTP requests by route, method and status", None),
+    'meet_http_request_duration_seconds': ('histogram', "HTTP request latency by route", LATENCY_BUCKETS),
+    'meet_http_request_queries': ('histogram', "SQL statements per HTTP request by route", QUERY_COUNT_BUCKETS),
+    'meet_http_slow_requests_total': ('counter', "HTTP requests slower than SLOW_REQUEST_MS by route", None),
+    'meet_db_queries_total': ('counter', "SQL statements executed by route ('-' outside requests)", None),
+    'meet_db_query_seconds_total': ('counter', "Time spent in SQL statements by route ('-' outside requests)", None),
+    'meet_db_pool_connections': ('gauge', "Database pool connections by state", None),
+    'meet_db_pool_capacity': ('gauge', "Connections the pool may hold (DB_POOL_SIZE + DB_MAX_OVERFLOW)", None),
+    'meet_db_pool_saturation': ('gauge', "Checked-out share of the pool capacity (1 = requests wait)", None),
+    'meet_socketio_emits_total': ('counter', "Socket.IO emits by event name", None),
+    'meet_socketio_emit_bytes_total': ('counter', "JSON payload bytes of Socket.IO emits by event name", None),
+    'meet_socketio_connects_total': ('counter', "Socket.IO connections accepted", None),
+    'meet_socketio_disconnects_total': ('counter', "Socket.IO disconnections", None),
+    'meet_socketio_clients': ('gauge', "Socket.IO clients connected to this worker by role", None),
+    'meet_emit_queue_pending': ('gauge', "Socket.IO emits waiting for the background sender", None),
+}
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1) # Last one is +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+class Metrics:
+    """Process-local counters and histograms (see METRIC_DEFINITIONS). Gauges are
+    read when rendered, from the callbacks registered with gauge()."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}   # (name, labels) -> value
+        self._histograms = {} # (name, labels) -> Histogram
+        self._gauges = []     # functions returning [(name, labels, value)]
+
+    def inc(self, name, labels=(), value=1):
+        if not app.config['METRICS_ENABLED']:
+            return
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        if not app.config['METRICS_ENABLED']:
+            return
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(METRIC_DEFINITIONS[name][2])
+            histogram.observe(value)
+
+    def gauge(self, function):
+        self._gauges.append(function)
+        return function
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        samples = {} # name -> [(suffix, labels, value)]
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                samples.setdefault(name, []).append(('', labels, value))
+            for (name, labels), histogram in self._histograms.items():
+                rows = samples.setdefault(name, [])
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, '+Inf'), histogram.counts):
+                    cumulative += count
+                    rows.append(('_bucket', (*labels, ('le', str(bound))), cumulative))
+                rows.append(('_sum', labels, histogram.sum))
+                rows.append(('_count', labels, cumulative))
+        for function in self._gauges:
+            for name, labels, value in function():
+                samples.setdefault(name, []).append(('', labels, value))
+        lines = []
+        for name, (kind, help_text, _) in METRIC_DEFINITIONS.items():
+            if name not in samples:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples[name]:
+                lines.append(f"{name}{suffix}{format_labels(labels)} {value:g}" if isinstance(value, float)
+                             else f"{name}{suffix}{format_labels(labels)} {value}")
+        return '\n'.join(lines) + '\n'
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
+
+metrics = Metrics()
+
+class _RequestStats:
+    def __init__(self, method, route):
+        self.method = method
+        self.route = route
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.status = None
+        self.profile = None # SlowRequestProfiler record while the profiler is on
+
+_request_stats = threading.local() # Green-thread local under eventlet: one per request
+
+def count_emit(event, data):
+    if app.config['METRICS_ENABLED']:
+        size = len(json.dumps(data, separators=(',', ':'), default=str))
+        metrics.inc('meet_socketio_emits_total', (('event', event),))
+        metrics.inc('meet_socketio_emit_bytes_total', (('event', event),), size)
+
+class SlowRequestProfiler:
+    """Sampling profiler for slow requests, switched on and off at runtime.
+
+    A native (not green) thread wakes every PROFILER_INTERVAL_MS and records the
+    stack of whatever request is running at that moment. Under eventlet all requests
+    share one OS thread, so that is the green thread holding the CPU; a request
+    waiting on the database is not sampled (its SQL time is in the metrics). When a
+    request ends slower than SLOW_REQUEST_MS its samples are kept as collapsed stacks
+    ("frame;frame;frame count", the flame graph input format); faster ones are
+    dropped. Needs no lock: the sampler only reads the active map and adds samples.
+    """
+    KEEP = 50 # Slow requests kept
+    TOP_STACKS = 30 # Stacks kept per request
+
+    def __init__(self):
+        self._active = {} # id(bottom frame of the request's stack) -> record
+        self._sampler = None
+        self.slow_requests = deque(maxlen=self.KEEP)
+
+    @staticmethod
+    def _bottom(frame):
+        while frame.f_back is not None:
+            frame = frame.f_back
+        return frame
+
+    def start_request(self, stats):
+        if self._sampler is None or not self._sampler.is_alive():
+            native_threading = eventlet.patcher.original('threading')
+            self._sampler = native_threading.Thread(target=self._sample_forever, name='request-sampler', daemon=True)
+            self._sampler.start()
+        stats.profile = {'samples': {}, 'bottom': id(self._bottom(sys._getframe()))}
+        self._active[stats.profile['bottom']] = stats.profile
 
-# Helper function to calculate age
-def calculate_age(born):
-    today = date.today()
-    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+    def finish_request(self, stats, duration):
+        record = stats.profile
+        self._active.pop(record['bottom'], None)
+        if duration * 1000 < app.config['SLOW_REQUEST_MS']:
+            return
+        stacks = sorted(record['samples'].items(), key=lambda item: -item[1])
+        self.slow_requests.append({
+            'method': stats.method,
+            'route': stats.route,
+            'path': request.full_path.rstrip('?'),
+            'status': stats.status,
+            'duration_ms': round(duration * 1000, 2),
+            'queries': stats.queries,
+            'query_ms': round(stats.query_seconds * 1000, 2),
+            'finished_at': datetime.utcnow().isoformat(),
+            'samples': sum(record['samples'].values()),
+            'stacks': [[stack, count] for stack, count in stacks[:self.TOP_STACKS]],
+        })
+
+    def _sample_forever(self):
+        native_sleep = eventlet.patcher.original('time').sleep
+        own = eventlet.patcher.original('threading').get_ident()
+        while app.config['PROFILER_ENABLED']:
+            native_sleep(app.config['PROFILER_INTERVAL_MS'] / 1000)
+            if not self._active:
+                continue
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame)
+                    frame = frame.f_back
+                record = self._active.get(id(stack[-1]))
+                if record is None:
+                    continue # The hub or a background task, not a request
+                names = [f"{os.path.basename(f.f_code.co_filename)}:{f.f_code.co_name}" for f in reversed(stack)]
+                names[-1] += f":{stack[0].f_lineno}"
+                key = ';'.join(names)
+                record['samples'][key] = record['samples'].get(key, 0) + 1
+        self._sampler = None
+
+profiler = SlowRequestProfiler()
+
+@app.before_request
+def start_request_metrics():
+    if not app.config['METRICS_ENABLED']:
+        _request_stats.current = None
+        return
+    stats = _request_stats.current = _RequestStats(
+        request.method, request.url_rule.rule if request.url_rule else '(unmatched)')
+    if app.config['PROFILER_ENABLED']:
+        profiler.start_request(stats)
+
+@app.after_request
+def note_response_status(response):
+    stats = getattr(_request_stats, 'current', None)
+    if stats is not None:
+        stats.status = response.status_code
+    return response
+
+@app.teardown_request
+def finish_request_metrics(exception=None):
+    # Runs when the response is done, after the last chunk of a streamed one
+    stats = getattr(_request_stats, 'current', None)
+    if stats is None:
+        return
+    _request_stats.current = None
+    duration = time.perf_counter() - stats.started
+    route = (('method', stats.method), ('route', stats.route))
+    status = stats.status or (500 if exception is not None else 200)
+    metrics.inc('meet_http_requests_total', (*route, ('status', str(status))))
+    metrics.observe('meet_http_request_duration_seconds', route, duration)
+    metrics.observe('meet_http_request_queries', route, stats.queries)
+    if duration * 1000 >= app.config['SLOW_REQUEST_MS']:
+        metrics.inc('meet_http_slow_requests_total', route)
+        app.logger.warning("Slow request %s %s: %.0f ms, %d SQL statements (%.0f ms)", stats.method,
+                           request.full_path.rstrip('?'), duration * 1000, stats.queries, stats.query_seconds * 1000)
+    if stats.profile is not None:
+        profiler.finish_request(stats, duration)
+
+with app.app_context():
+    _engine = db.engine # Created by SQLAlchemy(app); no connection is opened here
+
+@event.listens_for(_engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started'] = time.perf_counter()
+
+@event.listens_for(_engine, 'after_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop('query_started', time.perf_counter())
+    stats = getattr(_request_stats, 'current', None)
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+    route = (('route', stats.route if stats is not None else '-'),)
+    metrics.inc('meet_db_queries_total', route)
+    metrics.inc('meet_db_query_seconds_total', route, elapsed)
+
+@metrics.gauge
+def pool_gauges():
+    pool = _engine.pool
+    if not hasattr(pool, 'checkedout'): # SingletonThreadPool/NullPool (SQLite in memory, tests)
+        return []
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    return [
+        ('meet_db_pool_connections', (('state', 'checked_out'),), checked_out),
+        ('meet_db_pool_connections', (('state', 'idle'),), pool.checkedin()),
+        ('meet_db_pool_connections', (('state', 'overflow'),), max(pool.overflow(), 0)),
+        ('meet_db_pool_capacity', (), capacity),
+        ('meet_db_pool_saturation', (), round(checked_out / capacity, 4) if capacity else 0.0),
+    ]
+
+@metrics.gauge
+def socketio_gauges():
+    roles = {role: 0 for role in CLIENT_ROLES}
+    for subscription in list(client_subscriptions.values()):
+        for role in subscription['roles']:
+            roles[role] += 1
+    return [('meet_socketio_clients', (('role', role),), count) for role, count in roles.items()] + [
+        ('meet_emit_queue_pending', (), emit_queue.pending())]
 
 # --- Database Models ---
+class Meet(db.Model):
+    # One row per competition. The 'active' meet is the one being run; lifters, lifts
+    # and meet states of earlier ('archived') meets are kept for history and records.
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    meet_date = db.Column(db.Date, nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='active') # active, archived
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    archived_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'meet_date': self.meet_date.isoformat() if self.meet_date else None,
+            'status': self.status,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
 class MeetState(db.Model):
+    # One row per platform of a meet
     id = db.Column(db.Integer, primary_key=True)
+    meet_id = db.Column(db.Integer, db.ForeignKey('meet.id'), nullable=False)
+    platform = db.Column(db.Integer, nullable=False, default=1)
+    current_flight = db.Column(db.String(10), nullable=True) # None = all flights of the platform together
     current_lift_type = db.Column(db.String(50), default='squat') # squat, bench, deadlift
     current_attempt_number = db.Column(db.Integer, default=1) # 1, 2, 3
     current_active_lift_id = db.Column(db.Integer, db.ForeignKey('lift.id'), nullable=True)
+    auto_advance = db.Column(db.Boolean, nullable=False, default=False) # Call the next lift after each decision
+    version = db.Column(db.Integer, nullable=False, default=1)
+
+    __table_args__ = (db.Index('uq_meet_state_meet_platform', 'meet_id', 'platform', unique=True),)
 
     def to_dict(self):
         return {
             'id': self.id,
+            'platform': self.platform,
+            'current_flight': self.current_flight,
             'current_lift_type': self.current_lift_type,
             'current_attempt_number': self.current_attempt_number,
-            'current_active_lift_id': self.current_active_lift_id
+            'current_active_lift_id': self.current_active_lift_id,
+            'auto_advance': self.auto_advance,
+            'version': self.version
         }
 
 class Lifter(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    meet_id = db.Column(db.Integer, db.ForeignKey('meet.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
     gender = db.Column(db.String(10), nullable=False) # Male, Female
-    lifter_id_number = db.Column(db.String(50), unique=True, nullable=False)
+    lifter_id_number = db.Column(db.String(50), nullable=False) # Federation ID; unique within a meet
     actual_weight = db.Column(db.Float, nullable=False)
     birth_date = db.Column(db.Date, nullable=False)
     opener_squat = db.Column(db.Float, nullable=True)
     opener_bench = db.Column(db.Float, nullable=True)
     opener_deadlift = db.Column(db.Float, nullable=True)
+    platform = db.Column(db.Integer, nullable=False, default=1)
+    flight = db.Column(db.String(10), nullable=False, default='A')
+    version = db.Column(db.Integer, nullable=False, default=1)
 
     primary_weight_class_id = db.Column(db.Integer, db.ForeignKey('weight_class.id'), nullable=True)
     primary_age_class_id = db.Column(db.Integer, db.ForeignKey('age_class.id'), nullable=True)
@@ -95,10 +683,18 @@ class Lifter(db.Model):
 
     lifts = db.relationship('Lift', backref='lifter', lazy=True)
 
+    __table_args__ = (
+        db.Index('uq_lifter_meet_id_number', 'meet_id', 'lifter_id_number', unique=True),
+        # Lifting queue loads select a platform's lifters
+        db.Index('ix_lifter_meet_platform_flight', 'meet_id', 'platform', 'flight'),
+    )
+
     def to_dict(self):
         age = calculate_age(self.birth_date)
+        classes = class_index.get()
         return {
             'id': self.id,
+            'meet_id': self.meet_id,
             'name': self.name,
             'gender': self.gender,
             'lifter_id_number': self.lifter_id_number,
@@ -108,14 +704,17 @@ class Lifter(db.Model):
             'opener_squat': self.opener_squat,
             'opener_bench': self.opener_bench,
             'opener_deadlift': self.opener_deadlift,
+            'platform': self.platform,
+            'flight': self.flight,
             'primary_weight_class_id': self.primary_weight_class_id,
-            'primary_weight_class_name': self.primary_weight_class.name if self.primary_weight_class else None,
+            'primary_weight_class_name': classes.weight_class_names.get(self.primary_weight_class_id),
             'primary_age_class_id': self.primary_age_class_id,
-            'primary_age_class_name': self.primary_age_class.name if self.primary_age_class else None,
+            'primary_age_class_name': classes.age_class_names.get(self.primary_age_class_id),
             'additional_weight_class_ids': [wc.id for wc in self.additional_weight_classes],
             'additional_weight_class_names': [wc.name for wc in self.additional_weight_classes],
             'additional_age_class_ids': [ac.id for ac in self.additional_age_classes],
             'additional_age_class_names': [ac.name for ac in self.additional_age_classes],
+            'version': self.version,
         }
 
 class WeightClass(db.Model):
@@ -148,127 +747,2049 @@ class AgeClass(db.Model):
             'max_age': self.max_age
         }
 
-# Association tables for many-to-many relationships
-lifter_additional_weight_class = db.Table('lifter_additional_weight_class',
-    db.Column('lifter_id', db.Integer, db.ForeignKey('lifter.id'), primary_key=True),
-    db.Column('weight_class_id', db.Integer, db.ForeignKey('weight_class.id'), primary_key=True)
-)
+# Association tables for many-to-many relationships
+lifter_additional_weight_class = db.Table('lifter_additional_weight_class',
+    db.Column('lifter_id', db.Integer, db.ForeignKey('lifter.id'), primary_key=True),
+    db.Column('weight_class_id', db.Integer, db.ForeignKey('weight_class.id'), primary_key=True)
+)
+
+lifter_additional_age_class = db.Table('lifter_additional_age_class',
+    db.Column('lifter_id', db.Integer, db.ForeignKey('lifter.id'), primary_key=True),
+    db.Column('age_class_id', db.Integer, db.ForeignKey('age_class.id'), primary_key=True)
+)
+
+class Lift(db.Model):
+    __tablename__ = 'lift' # Explicitly set table name for clarity
+    id = db.Column(db.Integer, primary_key=True)
+    lifter_id = db.Column(db.Integer, db.ForeignKey('lifter.id'), nullable=False)
+    meet_id = db.Column(db.Integer, db.ForeignKey('meet.id'), nullable=False) # The lifter's meet
+    lift_type = db.Column(db.String(50), nullable=False) # squat, bench, deadlift
+    attempt_number = db.Column(db.Integer, nullable=False) # 1, 2, 3
+    weight_lifted = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(50), default='pending') # pending, active, completed
+
+    judge1_score = db.Column(db.Boolean, nullable=True)
+    judge2_score = db.Column(db.Boolean, nullable=True)
+    judge3_score = db.Column(db.Boolean, nullable=True)
+    overall_result = db.Column(db.Boolean, nullable=True) # True for good lift, False for no lift
+    declared_at = db.Column(db.DateTime, nullable=True) # None while the weight is only a placeholder
+    weight_changes = db.Column(db.Integer, nullable=False, default=0) # Changes since declaration
+    decided_at = db.Column(db.DateTime, nullable=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+
+    __table_args__ = (
+        # Pending lifts of a round in lifting order (queue loads, ORDER BY weight_lifted, lifter_id)
+        db.Index('ix_lift_round', 'status', 'lift_type', 'attempt_number', 'weight_lifted', 'lifter_id'),
+        # A lifter's lifts and "previous attempt" lookups
+        db.Index('ix_lift_lifter_attempt', 'lifter_id', 'lift_type', 'attempt_number'),
+        # Best good lift per lifter and lift type (leaderboard load), index-only
+        db.Index('ix_lift_result', 'overall_result', 'lifter_id', 'lift_type', 'weight_lifted'),
+        # One meet's lifts (lift lists, exports, records rebuild)
+        db.Index('ix_lift_meet', 'meet_id', 'overall_result'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'lifter_id': self.lifter_id,
+            'lifter_name': self.lifter.name,
+            'lifter_id_number': self.lifter.lifter_id_number,
+            'gender': self.lifter.gender,
+            'weight_class_name': class_index.get().weight_class_names.get(self.lifter.primary_weight_class_id),
+            'platform': self.lifter.platform,
+            'flight': self.lifter.flight,
+            'lift_type': self.lift_type,
+            'attempt_number': self.attempt_number,
+            'weight_lifted': self.weight_lifted,
+            'status': self.status,
+            'judge1_score': self.judge1_score,
+            'judge2_score': self.judge2_score,
+            'judge3_score': self.judge3_score,
+            'overall_result': self.overall_result,
+            'declared_at': self.declared_at.isoformat() if self.declared_at else None,
+            'weight_changes': self.weight_changes,
+            'decided_at': self.decided_at.isoformat() if self.decided_at else None,
+            'version': self.version
+        }
+
+class AttemptDeclaration(db.Model):
+    # Append-only record of every declared attempt weight and change card
+    id = db.Column(db.Integer, primary_key=True)
+    lift_id = db.Column(db.Integer, db.ForeignKey('lift.id'), nullable=False, index=True)
+    kind = db.Column(db.String(20), nullable=False) # declaration, change
+    weight = db.Column(db.Float, nullable=False)
+    previous_weight = db.Column(db.Float, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'lift_id': self.lift_id,
+            'kind': self.kind,
+            'weight': self.weight,
+            'previous_weight': self.previous_weight,
+            'created_at': self.created_at.isoformat()
+        }
+
+class JudgeDecision(db.Model):
+    # Judge decisions submitted with a client-generated decision_id and what became of
+    # them, so a retried submission is answered from here instead of applied again
+    id = db.Column(db.Integer, primary_key=True)
+    decision_id = db.Column(db.String(64), unique=True, nullable=False)
+    lift_id = db.Column(db.Integer, nullable=False) # No foreign key: unknown lifts are recorded too
+    judge = db.Column(db.String(50), nullable=False)
+    score = db.Column(db.Boolean, nullable=False)
+    sequence = db.Column(db.Integer, nullable=True) # Client order of the judge's decisions
+    status = db.Column(db.String(20), nullable=False) # applied, superseded, not_found, decided
+    error = db.Column(db.String(200), nullable=True)
+    revision = db.Column(db.Integer, nullable=True) # Change log revision of an applied decision
+    received_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Latest applied sequence of a judge on a lift (out-of-order check)
+        db.Index('ix_judge_decision_lift_judge', 'lift_id', 'judge', 'sequence'),
+    )
+
+    def to_result(self):
+        result = {'decision_id': self.decision_id, 'lift_id': self.lift_id, 'status': self.status}
+        if self.error:
+            result['error'] = self.error
+        return result
+
+class LiftRecord(db.Model):
+    # Best good lift per record key (see record_keys): a lifter's personal best, the
+    # meet record and the national (all meets) record of a gender/weight/age class
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(200), unique=True, nullable=False)
+    scope = db.Column(db.String(20), nullable=False) # personal, meet, national
+    lift_type = db.Column(db.String(50), nullable=False)
+    lifter_id_number = db.Column(db.String(50), nullable=True) # personal records
+    meet_id = db.Column(db.Integer, nullable=True) # meet records
+    gender = db.Column(db.String(10), nullable=True) # meet and national records
+    weight_class_id = db.Column(db.Integer, nullable=True)
+    age_class_id = db.Column(db.Integer, nullable=True)
+    weight = db.Column(db.Float, nullable=False)
+    lift_id = db.Column(db.Integer, nullable=False) # No foreign keys: records outlive what set them
+    lifter_id = db.Column(db.Integer, nullable=False)
+    lifter_name = db.Column(db.String(100), nullable=False)
+    record_meet_id = db.Column(db.Integer, nullable=False) # Meet the record was set at
+    set_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (db.Index('ix_lift_record_scope', 'scope', 'lift_type'),)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'key': self.key,
+            'scope': self.scope,
+            'lift_type': self.lift_type,
+            'lifter_id_number': self.lifter_id_number,
+            'meet_id': self.meet_id,
+            'gender': self.gender,
+            'weight_class_id': self.weight_class_id,
+            'age_class_id': self.age_class_id,
+            'weight': self.weight,
+            'lift_id': self.lift_id,
+            'lifter_id': self.lifter_id,
+            'lifter_name': self.lifter_name,
+            'record_meet_id': self.record_meet_id,
+            'set_at': self.set_at.isoformat()
+        }
+
+class MeetChange(db.Model):
+    # Append-only change log. The autoincrement id doubles as the meet revision:
+    # every mutation adds one row per changed entity, so a client that has seen
+    # revision N only needs the rows with id > N (see /sync).
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(20), nullable=False) # meet, lift, lifter, meet_state, weight_class, age_class
+    entity_id = db.Column(db.Integer, nullable=False)
+    event = db.Column(db.String(30), nullable=True) # e.g. lift_activated, judge_scored, result_finalized, class_changed
+    version = db.Column(db.Integer, nullable=True) # Entity version after the change (if versioned)
+    changes = db.Column(db.JSON, nullable=True) # Changed fields only; null for deletions
+    deleted = db.Column(db.Boolean, nullable=False, default=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'revision': self.id,
+            'event': self.event,
+            'entity': self.entity,
+            'entity_id': self.entity_id,
+            'version': self.version,
+            'changes': self.changes,
+            'deleted': self.deleted,
+            'created_at': self.created_at.isoformat()
+        }
+
+    __table_args__ = (
+        # Latest revision per entity (see TableRevisions) is an index-only max() lookup
+        db.Index('ix_meet_change_entity_id', 'entity', 'id'),
+        # History of one entity (/events?entity=&entity_id=)
+        db.Index('ix_meet_change_entity_entity_id', 'entity', 'entity_id', 'id'),
+    )
+
+class CacheSnapshot(db.Model):
+    # The in-memory caches as of a change-log revision, zlib-compressed JSON (see restore_caches)
+    id = db.Column(db.Integer, primary_key=True)
+    revision = db.Column(db.Integer, nullable=False)
+    data = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'revision': self.revision,
+            'bytes': len(self.data),
+            'created_at': self.created_at.isoformat()
+        }
+
+# --- Query Layer ---
+# Bulk reads go through these so that to_dict() never lazy-loads per row:
+# the lifter is joined into lifts, the two many-to-many class lists are
+# fetched with one extra SELECT each (subqueryload joins them to the lifter
+# query itself; selectinload would split a large meet into SELECT ... IN
+# batches of 500 lifters) and primary class names come from class_index.
+# Serializing any number of lifts or lifters therefore costs a constant
+# number of queries.
+def lift_query():
+    return Lift.query.options(joinedload(Lift.lifter))
+
+def lifter_query():
+    return Lifter.query.options(
+        subqueryload(Lifter.additional_weight_classes),
+        subqueryload(Lifter.additional_age_classes)
+    )
+
+# --- Helper Functions (Backend Logic) ---
+def record_change(entity, obj, before=None, flush=True, event=None):
+    """Logs the fields of `obj` that differ from `before` (a previous to_dict()).
+
+    Bumps the entity version (if it has one), adds a MeetChange row to the
+    current session and returns the delta payload to broadcast: the changed
+    fields plus 'id', 'version' and 'revision'. Returns None if nothing changed.
+    Must be called before the session is committed. Bulk callers pass
+    flush=False so the log rows are inserted together; their deltas then
+    carry no 'revision'. `event` names the change in the log; it defaults to
+    '<entity>_created' / '<entity>_updated'.
+    """
+    after = obj.to_dict()
+    changes = {k: v for k, v in after.items() if before is None or before.get(k) != v}
+    changes.pop('version', None)
+    if not changes:
+        return None
+    if hasattr(obj, 'version'):
+        if before is not None: # New entities start at their initial version
+            obj.version = (obj.version or 0) + 1
+        changes['version'] = obj.version
+    event = event or (f'{entity}_created' if before is None else f'{entity}_updated')
+    change = MeetChange(entity=entity, entity_id=obj.id, event=event, version=getattr(obj, 'version', None),
+                        changes=changes)
+    db.session.add(change)
+    if not flush:
+        return {'id': obj.id, **changes}
+    db.session.flush() # Assigns the revision
+    return {'id': obj.id, **changes, 'revision': change.id}
+
+def record_deletion(entity, entity_id):
+    """Logs the deletion of an entity and returns its revision. Caller commits."""
+    change = MeetChange(entity=entity, entity_id=entity_id, event=f'{entity}_deleted', deleted=True)
+    db.session.add(change)
+    db.session.flush()
+    return change.id
+
+# Revisions are assigned at insert, not at commit, so a transaction can commit a
+# revision below one a reader has already seen. Readers keyed on revisions (/sync,
+# TableRevisions) also look back this many revisions to catch such late commits.
+SYNC_REPLAY_OVERLAP = 100
+
+def current_revision():
+    return db.session.query(db.func.max(MeetChange.id)).scalar() or 0
+
+def parse_platform(value, default=1):
+    """Validates a platform number (1..MEET_PLATFORMS); raises ValueError."""
+    if value is None or str(value).strip() == '':
+        return default
+    try:
+        platform = int(value)
+    except (TypeError, ValueError):
+        platform = 0
+    if not 1 <= platform <= app.config['MEET_PLATFORMS']:
+        raise ValueError(f"Invalid platform {value!r} (platforms are 1-{app.config['MEET_PLATFORMS']})")
+    return platform
+
+def parse_flight(value, default='A'):
+    """Normalizes a flight name ('a ' -> 'A'); raises ValueError."""
+    if value is None or str(value).strip() == '':
+        return default
+    flight = str(value).strip().upper()
+    if len(flight) > 10:
+        raise ValueError(f"Invalid flight {value!r} (at most 10 characters)")
+    return flight
+
+def request_platform(data=None):
+    """Platform a request addresses: ?platform=, else 'platform' in the JSON body, else 1."""
+    value = request.args.get('platform')
+    if value is None and isinstance(data, dict):
+        value = data.get('platform')
+    return parse_platform(value)
+
+# --- Meets ---
+# One meet is run at a time: lifters, lifts and meet states belong to a meet and
+# everything that reads "the meet" (queues, leaderboard, lists, exports) is scoped
+# to the active one. Starting a new meet (POST /meets) archives the previous one;
+# its rows stay in place for history and records.
+class CurrentMeet:
+    """The active meet, cached per process until a meet is started here or, through
+    the message queue, on another worker."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._meet = None # (to_dict(), meet_date) or ({}, None) while there is no meet
+        self._generation = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._meet = None
+            self._generation += 1
+
+    def _ensure_loaded(self):
+        cached = self._meet
+        if cached is not None:
+            return cached
+        with self._lock:
+            generation = self._generation
+        meet = Meet.query.filter_by(status='active').order_by(Meet.id.desc()).first()
+        cached = (meet.to_dict(), meet.meet_date) if meet else ({}, None)
+        with self._lock:
+            if generation == self._generation: # Not invalidated while loading
+                self._meet = cached
+        return cached
+
+    def get(self):
+        """The active meet's to_dict(), or None before the first meet exists."""
+        return self._ensure_loaded()[0] or None
+
+    def id(self):
+        return self._ensure_loaded()[0].get('id')
+
+    def date(self):
+        return self._ensure_loaded()[1]
+
+current_meet = CurrentMeet()
+
+def current_meet_id():
+    return current_meet.id()
+
+def active_meet_lifter(lifter_id):
+    """The lifter with this id if they compete in the active meet, else None (archived
+    meets' lifters are read-only)."""
+    return Lifter.query.filter(Lifter.id == lifter_id, Lifter.meet_id == current_meet_id()).first()
+
+def request_meet_id():
+    """Meet a read addresses: ?meet_id= (any meet, archived ones included), else the
+    active meet. Raises ValueError."""
+    value = request.args.get('meet_id')
+    if value is None or value.strip() == '':
+        return current_meet_id()
+    try:
+        meet_id = int(value)
+    except ValueError:
+        meet_id = None
+    if meet_id is None or db.session.get(Meet, meet_id) is None:
+        raise ValueError(f"Unknown meet {value!r}")
+    return meet_id
+
+def ensure_current_meet():
+    """Creates the first meet if there is none yet."""
+    if not Meet.query.first():
+        db.session.add(Meet(name=app.config['MEET_NAME'], meet_date=app.config['MEET_DATE'], status='active'))
+        db.session.commit()
+        current_meet.invalidate()
+
+def invalidate_meet_caches():
+    """Drops every per-meet cache, e.g. after the active meet changed."""
+    current_meet.invalidate()
+    lifting_queue.invalidate()
+    meet_state_cache.invalidate()
+    leaderboard.invalidate()
+    records_index.invalidate()
+
+# --- Class Resolution ---
+class IntervalTable:
+    """Maps a value to the class whose [low, high] range contains it.
+
+    Matches the SQL lookup this replaced: ranges are inclusive, high=None means
+    open-ended and where ranges overlap the one with the lowest lower bound wins.
+    The ranges are flattened into non-overlapping segments up front, so each
+    lookup is a single bisect.
+    """
+
+    def __init__(self, ranges):
+        # ranges: iterable of (low, high, class_id)
+        ranges = sorted(ranges, key=lambda r: (r[0], r[2]))
+        # A boundary (v, 0) starts at v inclusive, (v, 1) starts just after v.
+        bounds = sorted({(low, 0) for low, _, _ in ranges} |
+                        {(high, 1) for _, high, _ in ranges if high is not None})
+        owners = []
+        for bound in bounds:
+            owner = None
+            for low, high, class_id in ranges:
+                if (low, 0) <= bound and (high is None or bound < (high, 1)):
+                    owner = class_id
+                    break
+            owners.append(owner)
+        self._bounds = tuple(bounds)
+        self._owners = tuple(owners)
+
+    def lookup(self, value):
+        i = bisect_right(self._bounds, (value, 0)) - 1
+        return self._owners[i] if i >= 0 else None
+
+class ClassTables:
+    """In-memory weight class (per gender, including 'Both') and age class tables.
+
+    Never modified after construction; a change to the class tables builds a new
+    instance (see ClassIndex).
+    """
+
+    def __init__(self, weight_classes, age_classes):
+        self.weight_class_names = {wc.id: wc.name for wc in weight_classes}
+        self.age_class_names = {ac.id: ac.name for ac in age_classes}
+        genders = {wc.gender for wc in weight_classes if wc.gender != 'Both'}
+        self._weight_tables = {
+            gender: IntervalTable((wc.min_weight, wc.max_weight, wc.id) for wc in weight_classes
+                                  if wc.gender in (gender, 'Both'))
+            for gender in genders
+        }
+        self._both_table = IntervalTable((wc.min_weight, wc.max_weight, wc.id) for wc in weight_classes
+                                         if wc.gender == 'Both')
+        self._age_table = IntervalTable((ac.min_age, ac.max_age, ac.id) for ac in age_classes)
+
+    @classmethod
+    def load(cls, exclude=()):
+        """Builds the tables from the database, skipping any class objects in `exclude`."""
+        return cls([wc for wc in WeightClass.query.all() if wc not in exclude],
+                   [ac for ac in AgeClass.query.all() if ac not in exclude])
+
+    def resolve(self, gender, actual_weight, birth_date):
+        """Returns (primary_weight_class_id, primary_age_class_id)."""
+        weight_table = self._weight_tables.get(gender, self._both_table)
+        return weight_table.lookup(actual_weight), self._age_table.lookup(calculate_age(birth_date))
+
+class ClassIndex:
+    """The committed class tables as a ClassTables, shared by every request.
+
+    Built on first use and rebuilt only after the class routes (or, through the
+    message queue, another worker) change a weight or age class, so resolving a
+    lifter's classes or serializing a lifter does not query the class tables.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tables = None
+        self._generation = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._tables = None
+            self._generation += 1
+
+    def get(self):
+        tables = self._tables
+        if tables is not None:
+            return tables
+        with self._lock:
+            generation = self._generation
+        tables = ClassTables.load()
+        with self._lock:
+            if generation == self._generation: # Not invalidated while loading
+                self._tables = tables
+        return tables
+
+class_index = ClassIndex()
+
+def assign_primary_classes(lifter, tables=None):
+    """Assigns primary weight and age classes to a lifter."""
+    tables = tables or class_index.get()
+    # None when no class matches (Or assign a default/error class)
+    lifter.primary_weight_class_id, lifter.primary_age_class_id = tables.resolve(
+        lifter.gender, lifter.actual_weight, lifter.birth_date)
+    db.session.add(lifter)
+    db.session.commit()
+
+def reassign_all_lifters(tables=None):
+    """Re-resolves every lifter's primary classes after the class tables changed.
+
+    Only the active meet's lifters are re-resolved (archived meets keep the classes
+    they competed in). Classes are resolved in memory against ClassTables and only the lifters
+    whose assignment changed are written, with one bulk UPDATE. Runs inside
+    the caller's transaction (caller commits) and returns the delta payloads
+    of the changed lifters.
+    """
+    tables = tables or ClassTables.load()
+    rows = db.session.query(
+        Lifter.id, Lifter.gender, Lifter.actual_weight, Lifter.birth_date,
+        Lifter.primary_weight_class_id, Lifter.primary_age_class_id, Lifter.version
+    ).filter(Lifter.meet_id == current_meet_id()).all()
+
+    updates = []
+    deltas = []
+    for row in rows:
+        weight_class_id, age_class_id = tables.resolve(row.gender, row.actual_weight, row.birth_date)
+        changes = {}
+        if weight_class_id != row.primary_weight_class_id:
+            changes['primary_weight_class_id'] = weight_class_id
+            changes['primary_weight_class_name'] = tables.weight_class_names.get(weight_class_id)
+        if age_class_id != row.primary_age_class_id:
+            changes['primary_age_class_id'] = age_class_id
+            changes['primary_age_class_name'] = tables.age_class_names.get(age_class_id)
+        if not changes:
+            continue
+        version = (row.version or 0) + 1
+        changes['version'] = version
+        updates.append({'id': row.id, 'primary_weight_class_id': weight_class_id,
+                        'primary_age_class_id': age_class_id, 'version': version})
+        deltas.append({'id': row.id, **changes})
+
+    if not updates:
+        return []
+    db.session.execute(update(Lifter), updates)
+    revisions = db.session.scalars(
+        insert(MeetChange).returning(MeetChange.id, sort_by_parameter_order=True),
+        [{'entity': 'lifter', 'entity_id': d['id'], 'event': 'class_changed', 'version': d['version'],
+          'changes': {k: v for k, v in d.items() if k != 'id'}} for d in deltas]
+    ).all()
+    for delta, revision in zip(deltas, revisions):
+        delta['revision'] = revision
+    return deltas
+
+def class_used_by_archived_meets(primary_column, association_column, class_id):
+    """True if a lifter of an archived meet has the class as primary or additional
+    class. Such a class is kept: reassign_all_lifters() leaves archived lifters alone,
+    so deleting it would break their foreign keys (or rewrite their results)."""
+    archived = Lifter.meet_id != current_meet_id()
+    primary = select(Lifter.id).where(archived, primary_column == class_id)
+    association = association_column.table
+    additional = select(Lifter.id).join(association, association.c.lifter_id == Lifter.id).where(
+        archived, association_column == class_id)
+    return db.session.scalar(select(exists(primary) | exists(additional)))
+
+def refresh_cached_lifters(deltas):
+    """Pushes weight class name changes from lifter deltas into the in-memory caches."""
+    for delta in deltas:
+        if 'primary_weight_class_name' in delta:
+            fields = {'weight_class_name': delta['primary_weight_class_name']}
+            lifting_queue.update_lifter_fields(delta['id'], fields)
+            meet_state_cache.update_lifter_fields(delta['id'], fields)
+        leaderboard.apply_lifter_delta(delta)
+
+def build_lifts_for_lifter(lifter):
+    """Builds (but does not add) the 3 lifts for each lift type of a new lifter."""
+    lifts_to_add = []
+    for lift_type_name in ['squat', 'bench', 'deadlift']:
+        opener_weight = getattr(lifter, f'opener_{lift_type_name}')
+        if opener_weight is not None:
+            lifts_to_add.append(Lift(
+                lifter=lifter,
+                meet_id=lifter.meet_id,
+                lift_type=lift_type_name,
+                attempt_number=1,
+                weight_lifted=opener_weight,
+                declared_at=datetime.utcnow() # The opener is declared at registration
+            ))
+            # Attempt 2: Opener + 5kg (placeholder until declared, see /lifts/<id>/declare)
+            lifts_to_add.append(Lift(
+                lifter=lifter,
+                meet_id=lifter.meet_id,
+                lift_type=lift_type_name,
+                attempt_number=2,
+                weight_lifted=opener_weight + 5
+            ))
+            # Attempt 3: Opener + 10kg (or a smart increment)
+            lifts_to_add.append(Lift(
+                lifter=lifter,
+                meet_id=lifter.meet_id,
+                lift_type=lift_type_name,
+                attempt_number=3,
+                weight_lifted=opener_weight + 10
+            ))
+    return lifts_to_add
+
+def generate_lifts_for_lifter(lifter):
+    """Generates 3 lifts for each lift type for a new lifter."""
+    lifts_to_add = build_lifts_for_lifter(lifter)
+    db.session.add_all(lifts_to_add)
+    db.session.flush()
+    for lift in lifts_to_add:
+        record_change('lift', lift, flush=False)
+    db.session.commit()
+    for lift in lifts_to_add:
+        lifting_queue.sync(lift)
+
+def csv_lines(stream):
+    """Decodes an uploaded CSV (UTF-8, optional BOM) one line at a time, so that an
+    undecodable byte raises UnicodeDecodeError while reading the row it is in."""
+    for line_number, line in enumerate(stream):
+        yield line.decode('utf-8-sig' if line_number == 0 else 'utf-8')
+
+def parse_lifter_row(row):
+    """Validates one lifter registration row (JSON object or CSV record).
+
+    Returns the Lifter column values, or raises ValueError with a message
+    suitable for the per-row error report.
+    """
+    def text(key):
+        value = str(row.get(key) or '').strip()
+        if not value:
+            raise ValueError(f"Missing '{key}'")
+        return value
+
+    def number(key, required=True):
+        value = row.get(key)
+        if value is None or str(value).strip() == '':
+            if required:
+                raise ValueError(f"Missing '{key}'")
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid number for '{key}': {value!r}")
+
+    gender = text('gender')
+    if gender not in ('Male', 'Female'):
+        raise ValueError(f"Invalid gender: {gender!r}")
+    try:
+        birth_date = datetime.strptime(text('birth_date'), '%Y-%m-%d').date()
+    except ValueError as e:
+        if 'Missing' in str(e):
+            raise
+        raise ValueError(f"Invalid birth_date (expected YYYY-MM-DD): {row.get('birth_date')!r}")
+    actual_weight = number('actual_weight')
+    if actual_weight <= 0:
+        raise ValueError("'actual_weight' must be positive")
+
+    return {
+        'name': text('name'),
+        'gender': gender,
+        'lifter_id_number': text('lifter_id_number'),
+        'actual_weight': actual_weight,
+        'birth_date': birth_date,
+        'opener_squat': number('opener_squat', required=False),
+        'opener_bench': number('opener_bench', required=False),
+        'opener_deadlift': number('opener_deadlift', required=False),
+        'platform': parse_platform(row.get('platform')),
+        'flight': parse_flight(row.get('flight')),
+    }
+
+def apply_judge_score(lift_id, judge_column, score):
+    """Records one judge decision and the resulting overall result atomically.
+
+    A single conditional UPDATE ... RETURNING writes the judge's column and
+    recomputes overall_result/status from the row as it is in the database
+    (two GOOD or two NO LIFT decide the lift), so concurrent judges never
+    overwrite each other through stale ORM state. A judge may change their
+    decision until the lift is decided; after that only judges who have not
+    voted yet can still add theirs (which cannot flip a 2-of-3 majority).
+    Adds the change-log row to the session and returns (delta payload,
+    RETURNING row), or (None, None) if no scorable lift matched. Caller
+    commits. Only the call whose vote decided the lift gets 'decided_at' in
+    its delta.
+    """
+    now = datetime.utcnow()
+    other_columns = [getattr(Lift, c) for c in JUDGE_SCORE_COLUMNS.values() if c != judge_column]
+    good = int(score is True) + sum(case((c.is_(True), 1), else_=0) for c in other_columns)
+    bad = int(score is False) + sum(case((c.is_(False), 1), else_=0) for c in other_columns)
+
+    row = db.session.execute(
+        update(Lift)
+        .where(Lift.id == lift_id,
+               Lift.overall_result.is_(None) | getattr(Lift, judge_column).is_(None))
+        .values({
+            getattr(Lift, judge_column): score,
+            Lift.overall_result: case((good >= 2, True), (bad >= 2, False), else_=null()),
+            Lift.status: case((good >= 2, 'completed'), (bad >= 2, 'completed'), else_=Lift.status),
+            Lift.decided_at: case((Lift.overall_result.is_(None) & ((good >= 2) | (bad >= 2)), now),
+                                  else_=Lift.decided_at),
+            Lift.version: Lift.version + 1,
+        })
+        .returning(Lift.status, Lift.overall_result, Lift.decided_at, Lift.version,
+                   Lift.lifter_id, Lift.lift_type, Lift.weight_lifted,
+                   select(Lifter.platform).where(Lifter.id == Lift.lifter_id).scalar_subquery().label('platform'))
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        return None, None
+
+    changes = {judge_column: score, 'version': row.version}
+    event = 'judge_scored'
+    if row.overall_result is not None:
+        changes['overall_result'] = row.overall_result
+        changes['status'] = row.status
+        if row.decided_at == now: # Set by this vote, not an earlier one
+            changes['decided_at'] = now.isoformat()
+            event = 'result_finalized'
+    change = MeetChange(entity='lift', entity_id=lift_id, event=event, version=row.version, changes=changes)
+    db.session.add(change)
+    db.session.flush()
+    return {'id': lift_id, **changes, 'revision': change.id}, row
+
+# --- Lifting Order Queue ---
+class PlatformQueue:
+    """In-process index of one platform's pending lifts.
+
+    Pending lifts are bucketed by (flight, lift_type, attempt_number) and each bucket is
+    kept sorted by (weight_lifted, lifter_id), which is the lifting order. Routes
+    that change a lift's status or a lifter's class call sync()/update_lifter_fields()
+    so the queue never has to be rebuilt with an ORDER BY scan. The index is
+    loaded lazily from the database on first use and after invalidate().
+    """
+
+    def __init__(self, platform):
+        self.platform = platform
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._buckets = {}    # (flight, lift_type, attempt_number) -> sorted [(weight, lifter_id, lift_id)]
+        self._entries = {}    # lift_id -> (bucket key, sort key, payload dict)
+        self._by_lifter = {}  # lifter_id -> set of lift_ids
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded = False
+            self._buckets = {}
+            self._entries = {}
+            self._by_lifter = {}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        platform_lifters = select(Lifter.id).where(Lifter.meet_id == current_meet_id(), Lifter.platform == self.platform)
+        for lift in lift_query().filter(Lift.status == 'pending', Lift.lifter_id.in_(platform_lifters)):
+            self._insert(lift.to_dict())
+        self._loaded = True
+
+    def _insert(self, payload):
+        key = (payload['flight'], payload['lift_type'], payload['attempt_number'])
+        sort_key = (payload['weight_lifted'], payload['lifter_id'], payload['id'])
+        insort(self._buckets.setdefault(key, []), sort_key)
+        self._entries[payload['id']] = (key, sort_key, payload)
+        self._by_lifter.setdefault(payload['lifter_id'], set()).add(payload['id'])
+
+    def _remove(self, lift_id):
+        entry = self._entries.pop(lift_id, None)
+        if entry is None:
+            return
+        key, sort_key, payload = entry
+        bucket = self._buckets.get(key, [])
+        i = bisect_left(bucket, sort_key)
+        if i < len(bucket) and bucket[i] == sort_key:
+            del bucket[i]
+        lifter_lifts = self._by_lifter.get(payload['lifter_id'])
+        if lifter_lifts is not None:
+            lifter_lifts.discard(lift_id)
+            if not lifter_lifts:
+                del self._by_lifter[payload['lifter_id']]
+
+    def sync(self, lift):
+        self.put(lift.to_dict())
+
+    def put(self, payload):
+        """Inserts or moves a lift given as a Lift.to_dict(), or drops it if it is no longer pending."""
+        with self._lock:
+            if not self._loaded:
+                return # Picked up by the next full load
+            self._remove(payload['id'])
+            if payload['status'] == 'pending':
+                self._insert(payload)
+
+    def get(self, lift_id):
+        with self._lock:
+            entry = self._entries.get(lift_id)
+            return dict(entry[2]) if entry else None
+
+    def dump(self):
+        """All queued lifts as dicts (for cache snapshots)."""
+        with self._lock:
+            self._ensure_loaded()
+            return [dict(payload) for _, _, payload in self._entries.values()]
+
+    def restore(self, payloads):
+        with self._lock:
+            self.invalidate()
+            for payload in payloads:
+                self._insert(payload)
+            self._loaded = True
+
+    def discard(self, lift_id):
+        with self._lock:
+            self._remove(lift_id)
+
+    def update_lifter_fields(self, lifter_id, fields):
+        with self._lock:
+            if not self._loaded:
+                return
+            for lift_id in self._by_lifter.get(lifter_id, ()):
+                self._entries[lift_id][2].update(fields)
+
+    def position(self, lift_id):
+        """0-based place of a pending lift in its flight's lifting order, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(lift_id)
+            if entry is None:
+                return None
+            key, sort_key, _ = entry
+            return bisect_left(self._buckets[key], sort_key)
+
+    def _ordered(self, flight, lift_type, attempt_number):
+        """Sort keys in lifting order; flight=None merges all flights of the platform."""
+        if flight is not None:
+            return self._buckets.get((flight, lift_type, attempt_number), [])
+        return heapq.merge(*[bucket for (_, t, a), bucket in self._buckets.items()
+                             if t == lift_type and a == attempt_number])
+
+    def peek(self, flight, lift_type, attempt_number, limit=None):
+        with self._lock:
+            self._ensure_loaded()
+            ordered = islice(self._ordered(flight, lift_type, attempt_number), limit)
+            return [dict(self._entries[lift_id][2]) for _, _, lift_id in ordered]
+
+    def _rounds(self, flight, lift_type, attempt_number):
+        """(flight, lift_type, attempt_number) of the given round and every later one, in
+        competition order (see LIFT_ORDER). flight=None runs all flights together."""
+        current = (LIFT_ORDER.index(lift_type) if lift_type in LIFT_ORDER else 0, flight or '', attempt_number)
+        lift_types = LIFT_ORDER if lift_type in LIFT_ORDER else (lift_type,)
+        flights = [None] if flight is None else sorted({f for (f, _, _), bucket in self._buckets.items() if bucket})
+        for t, lift_type_name in enumerate(lift_types):
+            for f in flights:
+                for a in range(1, ATTEMPTS_PER_LIFT + 1):
+                    if (t, f or '', a) >= current:
+                        yield f, lift_type_name, a
+
+    def upcoming(self, flight, lift_type, attempt_number, limit=None):
+        """Like peek(), but continues into the following rounds, flights and lifts once
+        the given round runs out. Only the rounds actually reached are merged."""
+        with self._lock:
+            self._ensure_loaded()
+            ordered = chain.from_iterable(self._ordered(*round_)
+                                          for round_ in self._rounds(flight, lift_type, attempt_number))
+            return [dict(self._entries[lift_id][2]) for _, _, lift_id in islice(ordered, limit)]
+
+class LiftingQueue:
+    """Lifting order for every platform, sharded into one PlatformQueue (with its
+    own lock) per platform so the platforms never wait on each other."""
+
+    def __init__(self):
+        self._lock = threading.Lock() # Guards the shard map only
+        self._shards = {}
+
+    def shard(self, platform):
+        with self._lock:
+            shard = self._shards.get(platform)
+            if shard is None:
+                shard = self._shards[platform] = PlatformQueue(platform)
+            return shard
+
+    def _all_shards(self):
+        with self._lock:
+            return list(self._shards.values())
+
+    def invalidate(self, platform=None):
+        for shard in self._all_shards():
+            if platform is None or shard.platform == platform:
+                shard.invalidate()
+
+    def sync(self, lift):
+        """Re-index a single lift after its status or weight changed."""
+        self.shard(lift.lifter.platform).sync(lift)
+
+    def discard(self, lift_id, platform=None):
+        for shard in ([self.shard(platform)] if platform else self._all_shards()):
+            shard.discard(lift_id)
+
+    def get(self, lift_id):
+        """The queued dict of a pending lift, or None if it is not (known to be) queued."""
+        for shard in self._all_shards():
+            payload = shard.get(lift_id)
+            if payload is not None:
+                return payload
+        return None
+
+    def put(self, payload):
+        """Like sync(), for a lift given as a dict."""
+        for shard in self._all_shards():
+            if shard.platform != payload['platform']:
+                shard.discard(payload['id'])
+        self.shard(payload['platform']).put(payload)
+
+    def dump(self, platforms):
+        return {platform: self.shard(platform).dump() for platform in platforms}
+
+    def restore(self, queues):
+        """Replaces the queues of the given platforms ({platform: [lift dicts]})."""
+        for platform, payloads in queues.items():
+            self.shard(platform).restore(payloads)
+
+    def update_lifter_fields(self, lifter_id, fields):
+        """Patches lifter fields (e.g. weight_class_name) cached on the lifter's queued lifts."""
+        for shard in self._all_shards():
+            shard.update_lifter_fields(lifter_id, fields)
+
+    def peek(self, platform, flight, lift_type, attempt_number, limit=None):
+        """Returns the next `limit` pending lifts (as dicts) in lifting order."""
+        return self.shard(platform).peek(flight, lift_type, attempt_number, limit)
+
+    def upcoming(self, platform, flight, lift_type, attempt_number, limit=None):
+        """Returns the next `limit` pending lifts in competition order from the given round on."""
+        return self.shard(platform).upcoming(flight, lift_type, attempt_number, limit)
+
+    def position(self, platform, lift_id):
+        return self.shard(platform).position(lift_id)
+
+lifting_queue = LiftingQueue()
+
+# --- Meet State Cache ---
+class _PlatformState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = None       # MeetState.to_dict(), None until loaded
+        self.active_lift = None # active_lift_dict() of the active lift
+        self.checked_at = 0.0
+
+class MeetStateCache:
+    """Process-local copy of each platform's MeetState row and active lift.
+
+    Write routes update the database first and then call set()/apply_lift_delta()
+    (write-through), so a worker always reads its own writes. Writes made by
+    other workers are detected with one small version query (meet state and
+    active lift versions), run at most every MEET_STATE_REVALIDATE_SECONDS.
+    Read-only routes (/meet_state GET, /current_lift, /next_lift_in_queue)
+    answer from here without touching the database in between. Every platform
+    has its own lock, so platforms never contend with each other.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock() # Guards the platform map only
+        self._platforms = {}
+
+    def _slot(self, platform):
+        with self._lock:
+            slot = self._platforms.get(platform)
+            if slot is None:
+                slot = self._platforms[platform] = _PlatformState()
+            return slot
+
+    def _all_slots(self):
+        with self._lock:
+            return list(self._platforms.values())
+
+    def invalidate(self, platform=None):
+        for slot in ([self._slot(platform)] if platform else self._all_slots()):
+            with slot.lock:
+                slot.state = None
+                slot.active_lift = None
+
+    def get(self, platform=1):
+        """Returns (meet_state_dict, active_lift_dict) of a platform; either may be None."""
+        slot = self._slot(platform)
+        with slot.lock:
+            state, active_lift, checked_at = slot.state, slot.active_lift, slot.checked_at
+        if state is not None:
+            interval = app.config['MEET_STATE_REVALIDATE_SECONDS']
+            if interval < 0 or time.monotonic() - checked_at < interval:
+                return state, active_lift
+            if self._is_current(state, active_lift):
+                with slot.lock:
+                    slot.checked_at = time.monotonic()
+                return state, active_lift
+        return self._load(platform)
+
+    def _is_current(self, state, active_lift):
+        row = db.session.query(MeetState.version, Lift.version).outerjoin(
+            Lift, Lift.id == MeetState.current_active_lift_id
+        ).filter(MeetState.id == state['id']).first()
+        if row is None:
+            return False
+        return (row[0] == state['version'] and
+                row[1] == (active_lift['version'] if active_lift else None))
+
+    def _load(self, platform):
+        meet_state = MeetState.query.filter_by(meet_id=current_meet_id(), platform=platform).first()
+        active_lift = None
+        if meet_state and meet_state.current_active_lift_id:
+            active_lift = lift_query().filter(Lift.id == meet_state.current_active_lift_id).first()
+        if meet_state is None:
+            return None, None
+        self.set(meet_state, active_lift)
+        slot = self._slot(platform)
+        with slot.lock:
+            return slot.state, slot.active_lift
+
+    def set(self, meet_state, active_lift=None):
+        """Stores freshly written state. `active_lift` is the Lift model for
+        meet_state.current_active_lift_id (ignored if it does not match)."""
+        state = meet_state.to_dict()
+        active = None
+        if active_lift is not None and active_lift.id == state['current_active_lift_id']:
+            active = active_lift_dict(active_lift)
+        slot = self._slot(state['platform'])
+        with slot.lock:
+            slot.state = state
+            slot.active_lift = active
+            slot.checked_at = time.monotonic()
+            if state['current_active_lift_id'] and active is None:
+                slot.state = None # Active lift unknown here, reload on next read
+
+    def apply_lift_delta(self, delta):
+        """Merges a lift delta into the cached active lift; returns the merged
+        dict, or None if the lift is not a cached active lift."""
+        for slot in self._all_slots():
+            with slot.lock:
+                if slot.active_lift and slot.active_lift['id'] == delta['id']:
+                    fields = {k: v for k, v in delta.items() if k != 'revision'}
+                    slot.active_lift = {**slot.active_lift, **fields}
+                    if 'weight_lifted' in fields:
+                        slot.state = None # Record attempt flag is stale, reload on next read
+                    return slot.active_lift
+        return None
+
+    def update_lifter_fields(self, lifter_id, fields):
+        for slot in self._all_slots():
+            with slot.lock:
+                if slot.active_lift and slot.active_lift['lifter_id'] == lifter_id:
+                    slot.active_lift = {**slot.active_lift, **fields}
+
+    def apply_state_delta(self, delta, find_lift):
+        """Merges a meet state delta into the cached state it belongs to. A new active
+        lift is looked up with find_lift(lift_id) -> dict; if that fails (or the dict
+        has no record attempt flag) the platform is reloaded on its next read."""
+        fields = {k: v for k, v in delta.items() if k != 'revision'}
+        for slot in self._all_slots():
+            with slot.lock:
+                if slot.state is None or slot.state['id'] != delta['id']:
+                    continue
+                slot.state = {**slot.state, **fields}
+                lift_id = slot.state['current_active_lift_id']
+                if 'current_active_lift_id' in fields:
+                    slot.active_lift = find_lift(lift_id) if lift_id else None
+                    if lift_id and 'record_attempt' not in (slot.active_lift or {}):
+                        slot.state = None
+                return
+
+    def restore(self, states):
+        """Installs [{'state': MeetState dict, 'active_lift': Lift dict or None}]."""
+        for item in states:
+            slot = self._slot(item['state']['platform'])
+            with slot.lock:
+                slot.state = item['state']
+                slot.active_lift = item['active_lift']
+                slot.checked_at = time.monotonic()
+
+meet_state_cache = MeetStateCache()
+
+def load_meet_state(platform=1):
+    """Loads a platform's MeetState row (of the active meet) for a write."""
+    return MeetState.query.filter_by(meet_id=current_meet_id(), platform=platform).first()
+
+def ensure_meet_states():
+    """Creates the MeetState rows of any platform (1..MEET_PLATFORMS) the active meet has none for."""
+    meet_id = current_meet_id()
+    existing = {platform for (platform,) in db.session.query(MeetState.platform).filter(MeetState.meet_id == meet_id)}
+    missing = [platform for platform in range(1, app.config['MEET_PLATFORMS'] + 1) if platform not in existing]
+    if missing:
+        db.session.add_all([MeetState(meet_id=meet_id, platform=platform, current_lift_type='squat',
+                                      current_attempt_number=1)
+                            for platform in missing])
+        db.session.commit()
+
+
+# --- Response Cache ---
+CHANGE_LOG_ENTITIES = ('meet', 'lift', 'lifter', 'meet_state', 'weight_class', 'age_class')
+RESPONSE_CACHE_SIZE = 256
+
+class TableRevisions:
+    """Latest change-log revision of each entity type ("table revision"), paired
+    with the number of that entity's log rows in the SYNC_REPLAY_OVERLAP revisions
+    up to it. The count changes when a transaction commits late with a lower
+    revision, which the latest revision alone would not show.
+
+    Read with one statement of per-entity max() and count() subqueries (index
+    range scans) and kept for RESPONSE_CACHE_REVALIDATE_SECONDS. Any commit in
+    this process and any event from another worker invalidates it, so a worker
+    never serves a response older than its own writes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._revisions = None
+        self._checked_at = 0.0
+
+    def invalidate(self):
+        with self._lock:
+            self._revisions = None
+
+    def get(self, entities):
+        with self._lock:
+            revisions, checked_at = self._revisions, self._checked_at
+        if revisions is None or time.monotonic() - checked_at >= app.config['RESPONSE_CACHE_REVALIDATE_SECONDS']:
+            columns = []
+            for entity in CHANGE_LOG_ENTITIES:
+                latest = select(db.func.max(MeetChange.id)).where(MeetChange.entity == entity).scalar_subquery()
+                columns += [latest, select(db.func.count()).where(
+                    MeetChange.entity == entity,
+                    MeetChange.id > db.func.coalesce(latest, 0) - SYNC_REPLAY_OVERLAP).scalar_subquery()]
+            row = db.session.execute(select(*columns)).one()
+            revisions = {entity: (row[2 * i] or 0, row[2 * i + 1]) for i, entity in enumerate(CHANGE_LOG_ENTITIES)}
+            with self._lock:
+                self._revisions, self._checked_at = revisions, time.monotonic()
+        return tuple(revisions[entity] for entity in entities)
+
+table_revisions = TableRevisions()
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_table_revisions(session):
+    table_revisions.invalidate()
+
+class ResponseCache:
+    """Serialized GET response bodies keyed by URL, each stored with the table
+    revisions it was built from and only served while those still match."""
+
+    def __init__(self, size=RESPONSE_CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._size = size
+        self._bodies = {} # full path -> (revisions, body bytes)
+
+    def get(self, key, revisions):
+        with self._lock:
+            cached = self._bodies.get(key)
+        return cached[1] if cached and cached[0] == revisions else None
+
+    def put(self, key, revisions, body):
+        with self._lock:
+            self._bodies.pop(key, None)
+            if len(self._bodies) >= self._size:
+                del self._bodies[next(iter(self._bodies))] # Drop the oldest entry
+            self._bodies[key] = (revisions, body)
+
+response_cache = ResponseCache()
+
+def revisions_etag(revisions):
+    """ETag part for table revisions from TableRevisions.get()."""
+    return '-'.join(f'{revision}.{recent}' for revision, recent in revisions)
+
+def tagged_response(body, etag, mimetype='application/json'):
+    """Wraps an already-serialized body with an ETag and answers
+    If-None-Match with 304. Clients must revalidate before reuse (no-cache)."""
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+def cached_get(*entities):
+    """Decorates a route so its GET responses are served from ResponseCache and
+    tagged with the revisions of `entities`, the tables its output depends on
+    (plus 'meet': starting a meet changes what every route returns)."""
+    entities = (*entities, 'meet')
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+            revisions = table_revisions.get(entities)
+            etag = revisions_etag(revisions)
+            if etag in request.if_none_match:
+                return tagged_response(b'', etag) # 304, nothing to serialize
+            key = request.full_path
+            body = response_cache.get(key, revisions)
+            if body is None:
+                response = view(*args, **kwargs)
+                if not isinstance(response, Response) or response.status_code != 200:
+                    return response
+                body = response.get_data()
+                response_cache.put(key, revisions, body)
+            return tagged_response(body, etag)
+        return wrapper
+    return decorator
+
+# --- Leaderboard ---
+# Coefficient formulas. Bodyweight is clamped to the range each formula was fitted on.
+WILKS_COEFFICIENTS = {
+    'Male': (-216.0475144, 16.2606339, -0.002388645, -0.00113732, 7.01863e-06, -1.291e-08),
+    'Female': (594.31747775582, -27.23842536447, 0.82112226871, -0.00930733913, 4.731582e-05, -9.054e-08),
+}
+WILKS_BODYWEIGHT_RANGE = {'Male': (40.0, 201.9), 'Female': (26.51, 154.53)}
+DOTS_COEFFICIENTS = {
+    'Male': (-307.75076, 24.0900756, -0.1918759221, 0.0007391293, -0.000001093),
+    'Female': (-57.96288, 13.6175032, -0.1126655495, 0.0005158568, -0.0000010706),
+}
+DOTS_BODYWEIGHT_RANGE = {'Male': (40.0, 210.0), 'Female': (40.0, 150.0)}
+IPF_GL_COEFFICIENTS = { # Classic (raw) three-lift powerlifting
+    'Male': (1199.72839, 1025.18162, 0.00921),
+    'Female': (610.32796, 1045.59282, 0.03048),
+}
+
+def _polynomial(coefficients, x):
+    return sum(c * x ** i for i, c in enumerate(coefficients))
+
+def wilks_score(total, bodyweight, gender):
+    if not total or gender not in WILKS_COEFFICIENTS:
+        return None
+    low, high = WILKS_BODYWEIGHT_RANGE[gender]
+    bodyweight = min(max(bodyweight, low), high)
+    return round(total * 500 / _polynomial(WILKS_COEFFICIENTS[gender], bodyweight), 2)
+
+def dots_score(total, bodyweight, gender):
+    if not total or gender not in DOTS_COEFFICIENTS:
+        return None
+    low, high = DOTS_BODYWEIGHT_RANGE[gender]
+    bodyweight = min(max(bodyweight, low), high)
+    return round(total * 500 / _polynomial(DOTS_COEFFICIENTS[gender], bodyweight), 2)
+
+def ipf_gl_score(total, bodyweight, gender):
+    if not total or gender not in IPF_GL_COEFFICIENTS or bodyweight < 35:
+        return None
+    a, b, c = IPF_GL_COEFFICIENTS[gender]
+    return round(total * 100 / (a - b * math.exp(-c * bodyweight)), 2)
+
+LEADERBOARD_SORT_KEYS = ('total_lift', 'dots', 'wilks', 'ipf_gl')
+LEADERBOARD_LIFTER_FIELDS = (
+    'name', 'lifter_id_number', 'gender', 'actual_weight',
+    'primary_weight_class_id', 'primary_weight_class_name', 'primary_age_class_id', 'primary_age_class_name',
+    'additional_weight_class_ids', 'additional_age_class_ids', 'version',
+)
+
+class Leaderboard:
+    """In-process standings: best good lift per lift type, total and coefficients.
+
+    Loaded once from the database (one lifter query and one GROUP BY over good
+    lifts) and then updated incrementally: every good lift only touches its
+    lifter's entry. Ranked lists are cached per (class filter, sort key) and
+    dropped whenever a standing changes, so displays polling between lifts get
+    an already-sorted list.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = None # lifter_id -> standing dict
+        self._ranked = {}    # (weight_class_id, age_class_id, gender, sort key) -> ranked list
+
+    def invalidate(self):
+        with self._lock:
+            self._entries = None
+            self._ranked = {}
+
+    def _ensure_loaded(self):
+        if self._entries is not None:
+            return
+        entries = {}
+        meet_id = current_meet_id()
+        for lifter in lifter_query().filter(Lifter.meet_id == meet_id):
+            entries[lifter.id] = self._new_entry(lifter.to_dict())
+        best_lifts = db.session.query(Lift.lifter_id, Lift.lift_type, db.func.max(Lift.weight_lifted)).filter(
+            Lift.meet_id == meet_id, Lift.overall_result.is_(True)
+        ).group_by(Lift.lifter_id, Lift.lift_type)
+        for lifter_id, lift_type, weight in best_lifts:
+            if lifter_id in entries:
+                entries[lifter_id][f'best_{lift_type}'] = weight
+        for entry in entries.values():
+            self._score(entry)
+        self._entries = entries
+        self._ranked = {}
+
+    @staticmethod
+    def _new_entry(lifter_dict):
+        entry = {'lifter_id': lifter_dict['id'], 'lifter_name': lifter_dict['name'],
+                 'best_squat': None, 'best_bench': None, 'best_deadlift': None}
+        entry.update({field: lifter_dict[field] for field in LEADERBOARD_LIFTER_FIELDS})
+        return entry
+
+    @staticmethod
+    def _score(entry):
+        total = sum(entry[f'best_{t}'] or 0 for t in ('squat', 'bench', 'deadlift'))
+        entry['total_lift'] = total or None
+        entry['dots'] = dots_score(total, entry['actual_weight'], entry['gender'])
+        entry['wilks'] = wilks_score(total, entry['actual_weight'], entry['gender'])
+        entry['ipf_gl'] = ipf_gl_score(total, entry['actual_weight'], entry['gender'])
+
+    def add_lifter(self, lifter_dict):
+        with self._lock:
+            if self._entries is None:
+                return
+            entry = self._new_entry(lifter_dict)
+            self._score(entry)
+            self._entries[lifter_dict['id']] = entry
+            self._ranked = {}
+
+    def apply_lifter_delta(self, delta):
+        """Applies a lifter delta (class changes, name, bodyweight, ...)."""
+        with self._lock:
+            entry = self._entries.get(delta['id']) if self._entries is not None else None
+            if entry is None:
+                return
+            if 'name' in delta:
+                entry['lifter_name'] = delta['name']
+            entry.update({k: v for k, v in delta.items() if k in LEADERBOARD_LIFTER_FIELDS})
+            self._score(entry)
+            self._ranked = {}
+
+    def apply_good_lift(self, lifter_id, lift_type, weight):
+        """Like record_good_lift() for a lift decided by another worker, without
+        loading the standings: one not loaded yet counts it when it loads."""
+        with self._lock:
+            entry = self._entries.get(lifter_id) if self._entries is not None else None
+            key = f'best_{lift_type}'
+            if entry is not None and (entry[key] is None or weight > entry[key]):
+                entry[key] = weight
+                self._score(entry)
+                self._ranked = {}
+
+    def record_good_lift(self, lifter_id, lift_type, weight):
+        """Returns a copy of the lifter's standing if it improved, else None."""
+        with self._lock:
+            just_loaded = self._entries is None
+            self._ensure_loaded()
+            entry = self._entries.get(lifter_id)
+            if entry is None:
+                return None
+            key = f'best_{lift_type}'
+            if entry[key] is None or weight > entry[key]:
+                entry[key] = weight
+                self._score(entry)
+                self._ranked = {}
+                return dict(entry)
+            if just_loaded and entry[key] == weight:
+                return dict(entry) # The load already counted this (committed) lift
+            return None
+
+    def dump(self):
+        with self._lock:
+            self._ensure_loaded()
+            return [dict(entry) for entry in self._entries.values()]
+
+    def restore(self, entries):
+        with self._lock:
+            self._entries = {entry['lifter_id']: entry for entry in entries}
+            self._ranked = {}
+
+    def ranked(self, weight_class_id=None, age_class_id=None, gender=None, sort='total_lift'):
+        """Lifters with at least one good lift, best first, optionally limited
+        to a weight/age class (primary or additional) and gender."""
+        with self._lock:
+            self._ensure_loaded()
+            key = (weight_class_id, age_class_id, gender, sort)
+            ranked = self._ranked.get(key)
+            if ranked is None:
+                entries = [e for e in self._entries.values() if e['total_lift'] and
+                           (weight_class_id is None or weight_class_id == e['primary_weight_class_id']
+                            or weight_class_id in e['additional_weight_class_ids']) and
+                           (age_class_id is None or age_class_id == e['primary_age_class_id']
+                            or age_class_id in e['additional_age_class_ids']) and
+                           (gender is None or gender == e['gender'])]
+                # Ties go to the lighter lifter, then to whoever registered first
+                entries.sort(key=lambda e: (-(e[sort] or 0), e['actual_weight'], e['lifter_id']))
+                ranked = [{**e, 'rank': i} for i, e in enumerate(entries, start=1)]
+                self._ranked[key] = ranked
+            return ranked
+
+leaderboard = Leaderboard()
+
+# --- Cache Snapshots ---
+# MeetChange is the meet's append-only event log. Every CACHE_SNAPSHOT_SECONDS the
+# caches above are written to cache_snapshot, tagged with the revision they were read
+# at. On startup restore_caches() installs the latest snapshot and replays the log
+# rows after it, so a restarted worker is warm after one snapshot read and a short
+# log scan instead of full-table loads. Replay is version-checked per entity, so
+# rows the snapshot already contains are skipped; whatever a cache cannot replay
+# exactly makes it fall back to its normal lazy load.
+SNAPSHOT_KEEP = 3 # Snapshots kept; older ones are deleted
+# Log rows before the snapshot revision that are replayed anyway: ids are assigned at
+# insert, so a transaction can commit an id below the revision after the snapshot read
+SNAPSHOT_REPLAY_OVERLAP = 100
+# Lifter fields copied onto their lifts' dicts -> name in Lift.to_dict()
+LIFT_LIFTER_FIELDS = {'name': 'lifter_name', 'lifter_id_number': 'lifter_id_number', 'gender': 'gender',
+                      'primary_weight_class_name': 'weight_class_name', 'platform': 'platform', 'flight': 'flight'}
+
+def build_cache_snapshot():
+    """Reads fresh copies of the caches from the database; returns (revision, data)."""
+    revision = current_revision() # Read first: the data is at least this recent
+    meet_id = current_meet_id()
+    platforms = ({platform for (platform,) in db.session.query(Lifter.platform).filter(Lifter.meet_id == meet_id)
+                  .distinct()}
+                 | set(range(1, app.config['MEET_PLATFORMS'] + 1)))
+    meet_states = []
+    for meet_state in MeetState.query.filter_by(meet_id=meet_id):
+        active_lift = None
+        if meet_state.current_active_lift_id:
+            active_lift = lift_query().filter(Lift.id == meet_state.current_active_lift_id).first()
+        meet_states.append({'state': meet_state.to_dict(),
+                            'active_lift': active_lift_dict(active_lift) if active_lift else None})
+    return revision, {
+        'meet_id': meet_id,
+        'meet_states': meet_states,
+        'queues': [[platform, lifts] for platform, lifts in LiftingQueue().dump(sorted(platforms)).items()],
+        'leaderboard': Leaderboard().dump(),
+        # What replaying a lift needs besides the queue: [id, lifter_id, lift_type, weight_lifted, version]
+        'lifts': [list(row) for row in db.session.query(Lift.id, Lift.lifter_id, Lift.lift_type,
+                                                        Lift.weight_lifted, Lift.version)
+                  .filter(Lift.meet_id == meet_id)],
+    }
+
+def save_cache_snapshot():
+    """Writes a snapshot unless the latest one is still current. Returns it, or None."""
+    latest = db.session.query(db.func.max(CacheSnapshot.revision)).scalar()
+    if latest is not None and latest >= current_revision():
+        return None
+    revision, data = build_cache_snapshot()
+    snapshot = CacheSnapshot(revision=revision, data=zlib.compress(json.dumps(data, separators=(',', ':')).encode()))
+    db.session.add(snapshot)
+    db.session.flush()
+    CacheSnapshot.query.filter(CacheSnapshot.id <= snapshot.id - SNAPSHOT_KEEP).delete(synchronize_session=False)
+    db.session.commit()
+    return snapshot
+
+def snapshot_caches_periodically():
+    while True:
+        socketio.sleep(app.config['CACHE_SNAPSHOT_SECONDS'])
+        with app.app_context():
+            try:
+                save_cache_snapshot()
+            except Exception:
+                db.session.rollback()
+                app.logger.exception("Cannot write cache snapshot")
+
+def replay_lift_change(delta, lifts):
+    lift_id = delta['id']
+    created = 'lifter_id' in delta # New entities log every field
+    known = lifts.get(lift_id)
+    if known is None:
+        if not created:
+            lifting_queue.invalidate()
+            leaderboard.invalidate()
+            return
+        known = lifts[lift_id] = [lift_id, delta['lifter_id'], delta['lift_type'], delta['weight_lifted'], delta['version']]
+    elif 'weight_lifted' in delta:
+        known[3] = delta['weight_lifted']
+
+    active = meet_state_cache.apply_lift_delta(delta)
+    base = lifting_queue.get(lift_id) or active or ({} if created else None)
+    if base is not None:
+        lifting_queue.put({**base, **{k: v for k, v in delta.items() if k != 'revision'}})
+    elif delta.get('status') == 'pending':
+        lifting_queue.invalidate() # Back in the queue, but its other fields are unknown here
+    if delta.get('overall_result') is True:
+        leaderboard.record_good_lift(known[1], known[2], known[3])
+
+def replay_lifter_change(delta):
+    if 'lifter_id_number' in delta and 'birth_date' in delta: # New lifter
+        leaderboard.add_lifter(delta)
+        return
+    leaderboard.apply_lifter_delta(delta)
+    if 'platform' in delta or 'flight' in delta:
+        lifting_queue.invalidate() # Its lifts change buckets
+    fields = {LIFT_LIFTER_FIELDS[k]: v for k, v in delta.items() if k in LIFT_LIFTER_FIELDS}
+    if fields:
+        lifting_queue.update_lifter_fields(delta['id'], fields)
+        meet_state_cache.update_lifter_fields(delta['id'], fields)
+
+def restore_caches():
+    """Installs the latest cache snapshot and replays the change log after it.
+    Returns the number of log rows replayed, or None if nothing was restored."""
+    snapshot = CacheSnapshot.query.order_by(CacheSnapshot.id.desc()).first()
+    if snapshot is None:
+        return None
+    limit = app.config['CACHE_REPLAY_LIMIT']
+    tail = MeetChange.query.filter(MeetChange.id > snapshot.revision - SNAPSHOT_REPLAY_OVERLAP).order_by(
+        MeetChange.id).limit(limit + 1).all()
+    if len(tail) > limit:
+        return None # Loading from scratch is cheaper
+
+    data = json.loads(zlib.decompress(snapshot.data))
+    if data.get('meet_id') != current_meet_id() or any(change.entity == 'meet' for change in tail):
+        return None # Taken during another meet, or a meet was started since
+    meet_state_cache.restore(data['meet_states'])
+    lifting_queue.restore({platform: lifts for platform, lifts in data['queues']})
+    leaderboard.restore(data['leaderboard'])
+    lifts = {row[0]: row for row in data['lifts']}
+    versions = {('lift', row[0]): row[4] for row in data['lifts']}
+    versions.update({('lifter', entry['lifter_id']): entry['version'] for entry in data['leaderboard']})
+    versions.update({('meet_state', item['state']['id']): item['state']['version'] for item in data['meet_states']})
+
+    for change in tail:
+        key = (change.entity, change.entity_id)
+        if change.deleted or change.version is None or change.version <= versions.get(key, 0):
+            continue # Class tables are not cached; older rows are already in the snapshot
+        versions[key] = change.version
+        delta = {**(change.changes or {}), 'id': change.entity_id}
+        if change.entity == 'lift':
+            replay_lift_change(delta, lifts)
+        elif change.entity == 'lifter':
+            replay_lifter_change(delta)
+        elif change.entity == 'meet_state':
+            meet_state_cache.apply_state_delta(delta, lifting_queue.get)
+    return len(tail)
+
+# --- Socket.IO Rooms ---
+# Clients say what they are when they connect: ?role=organizer|judge|display|leaderboard
+# (comma-separated for several), ?platform= and, for leaderboards, ?weight_class_id= /
+# ?age_class_id=. Each event is only sent to the rooms of the roles that use it.
+# Clients without a role are treated as organizers and receive everything.
+CLIENT_ROLES = ('organizer', 'judge', 'display', 'leaderboard')
+# event -> (roles that receive it, scoped to one platform?)
+EVENT_AUDIENCES = {
+    'meet_state_updated': (('organizer', 'display'), True),
+    'active_lift_changed': (('organizer', 'judge', 'display'), True),
+    'lift_updated': (('organizer', 'judge', 'display'), True),
+    'queue_updated': (('organizer', 'display'), True),
+    'loading_updated': (('organizer', 'display'), True),
+    'lifter_added': (('organizer',), False),
+    'lifters_imported': (('organizer',), False),
+    'lifter_updated': (('organizer',), False),
+    'weight_class_updated': (('organizer',), False),
+    'age_class_updated': (('organizer',), False),
+    'record_set': (('organizer', 'display'), True),
+    'records_rebuilt': (('organizer', 'display'), False),
+    'meet_started': (('organizer', 'judge', 'display', 'leaderboard'), False),
+}
+client_subscriptions = {} # sid -> subscription of the clients connected to this worker
+
+def platform_room(platform, role):
+    return f'platform:{platform}:{role}'
+
+def role_room(role):
+    return f'role:{role}'
+
+def leaderboard_room(weight_class_id=None, age_class_id=None):
+    return f"leaderboard:{weight_class_id or '*'}:{age_class_id or '*'}"
+
+def leaderboard_rooms(entry):
+    """Rooms of every leaderboard filter a standing appears in."""
+    weight_class_ids = {None, entry['primary_weight_class_id'], *entry['additional_weight_class_ids']}
+    age_class_ids = {None, entry['primary_age_class_id'], *entry['additional_age_class_ids']}
+    return [leaderboard_room(wc, ac) for wc in weight_class_ids for ac in age_class_ids]
+
+def parse_subscription(args, current=None):
+    """Validates the role/platform/class parameters of a connect query or a
+    'subscribe' event; parameters left out keep their `current` value."""
+    subscription = dict(current or {'roles': ['organizer'], 'platform': 1,
+                                    'weight_class_id': None, 'age_class_id': None})
+    roles = args.get('role')
+    if roles is not None:
+        if isinstance(roles, str):
+            roles = [role.strip() for role in roles.split(',') if role.strip()]
+        unknown = [role for role in roles if role not in CLIENT_ROLES]
+        if unknown or not roles:
+            raise ValueError(f"Unknown role {', '.join(unknown)!r} (roles are {', '.join(CLIENT_ROLES)})")
+        subscription['roles'] = list(roles)
+    subscription['platform'] = parse_platform(args.get('platform'), default=subscription['platform'])
+    for key in ('weight_class_id', 'age_class_id'):
+        if key in args:
+            value = args.get(key)
+            try:
+                subscription[key] = int(value) if value not in (None, '') else None
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {key} {value!r}")
+    return subscription
+
+def subscription_rooms(subscription):
+    subscribed = []
+    for role in subscription['roles']:
+        if role == 'leaderboard':
+            subscribed.append(leaderboard_room(subscription['weight_class_id'], subscription['age_class_id']))
+        else:
+            subscribed.append(platform_room(subscription['platform'], role))
+            subscribed.append(role_room(role))
+    return subscribed
+
+def apply_subscription(subscription):
+    """Moves the current Socket.IO client into the rooms of `subscription`."""
+    for room in rooms():
+        if room != request.sid:
+            leave_room(room)
+    for room in subscription_rooms(subscription):
+        join_room(room)
+    client_subscriptions[request.sid] = subscription
+
+class EventBatcher:
+    """Collapses bursts of one event to the same rooms into a single message.
+
+    The first emit opens a window of SOCKETIO_BATCH_MS[event]; everything added
+    until it closes is sent as one list. Payloads with the same entity id
+    ('id', or 'lifter_id' for standings) are merged, later fields winning, so
+    e.g. a bulk class reassignment becomes one 'lifter_updated' per room. A
+    window with a single payload sends it as is, in the unbatched shape.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {} # (event, rooms) -> {entity id: payload}
+
+    def add(self, event, payload, to, delay):
+        key = (event, tuple(to))
+        item_key = payload.get('id', payload.get('lifter_id')) if isinstance(payload, dict) else None
+        with self._lock:
+            pending = self._pending.get(key)
+            opened = pending is None
+            if opened:
+                pending = self._pending[key] = {}
+            if item_key is None:
+                item_key = ('#', len(pending))
+            pending[item_key] = {**pending[item_key], **payload} if item_key in pending else payload
+        if opened:
+            eventlet.spawn_n(self._flush_later, key, delay) # Does not switch away from the request
+
+    def _flush_later(self, key, delay):
+        socketio.sleep(delay)
+        with self._lock:
+            pending = self._pending.pop(key, {})
+        if pending:
+            event, to = key
+            payloads = list(pending.values())
+            emit_queue.put(event, payloads if len(payloads) > 1 else payloads[0], list(to))
+
+event_batcher = EventBatcher()
+
+class EmitQueue:
+    """Bounded queue of Socket.IO emits, sent in order by one background green thread.
+
+    Routes only enqueue, so a judge's response does not wait for the payload to be
+    encoded and fanned out to every connected display (or published to the message
+    queue). An emit whose (event, rooms, entity id) is still pending is merged into
+    that one, later fields winning, and moved to the back: clients skip intermediate
+    states but never see an entity's older state after a newer event. When
+    SOCKETIO_EMIT_QUEUE_SIZE emits are pending the caller sends the oldest one
+    itself, slowing the writer down instead of dropping events.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = OrderedDict() # (event, rooms, entity id) -> (event, data, rooms)
+        self._ready = threading.Event()
+        self._sequence = 0
+        self._sender_started = False
+
+    def put(self, event, data, to):
+        limit = app.config['SOCKETIO_EMIT_QUEUE_SIZE']
+        if limit <= 0:
+            count_emit(event, data)
+            socketio.emit(event, data, to=to)
+            return
+        item_key = data.get('id', data.get('lifter_id')) if isinstance(data, dict) else None
+        overflow = None
+        with self._lock:
+            if item_key is None:
+                self._sequence += 1
+                key = (event, tuple(to), '#', self._sequence)
+            else:
+                key = (event, tuple(to), item_key)
+            queued = self._pending.pop(key, None)
+            self._pending[key] = (event, {**queued[1], **data} if queued else data, to)
+            if len(self._pending) > limit:
+                overflow = self._pending.popitem(last=False)[1]
+            if not self._sender_started:
+                self._sender_started = True
+                # Deferred until the request yields (a green Thread.start() would switch to it now)
+                eventlet.spawn_n(self._send_forever)
+        self._ready.set()
+        if overflow:
+            self._send(*overflow)
+
+    def pending(self):
+        return len(self._pending)
+
+    def flush(self):
+        """Sends everything pending from the calling thread."""
+        while self._send_next():
+            pass
+
+    def _send_next(self):
+        with self._lock:
+            if not self._pending:
+                return False
+            item = self._pending.popitem(last=False)[1]
+        self._send(*item)
+        return True
+
+    def _send(self, event, data, to):
+        try:
+            count_emit(event, data)
+            socketio.emit(event, data, to=to)
+        except Exception:
+            app.logger.exception("Cannot emit %r", event)
+
+    def _send_forever(self):
+        while True:
+            self._ready.wait()
+            self._ready.clear()
+            while self._send_next():
+                socketio.sleep(0) # Let requests run between fan-outs
+
+emit_queue = EmitQueue()
+
+def emit_to_rooms(event, data, to):
+    if not to:
+        return # An empty room list would broadcast to everyone
+    window_ms = app.config['SOCKETIO_BATCH_MS'].get(event)
+    if window_ms:
+        event_batcher.add(event, data, to, window_ms / 1000)
+    else:
+        emit_queue.put(event, data, to)
+
+def broadcast(event, data, platform=None):
+    """Emits `event` to the rooms of the roles that use it (see EVENT_AUDIENCES);
+    platform-scoped events only reach clients following `platform`."""
+    roles, platform_scoped = EVENT_AUDIENCES[event]
+    if platform_scoped:
+        emit_to_rooms(event, data, [platform_room(platform, role) for role in roles])
+    else:
+        emit_to_rooms(event, data, [role_room(role) for role in roles])
+
+# --- Cache Coherence ---
+# Events broadcast by other workers (through the message queue) are applied to this
+# worker's caches the way the local write that sent them was: lift and lifter deltas
+# are merged in, and only the caches (and platform) an event touches are dropped
+# when its payload does not carry enough to patch them. Handlers run on the queue's
+# listener thread, outside any request, so they never read the database.
+def event_platform(rooms):
+    """The platform of a platform-scoped broadcast, from its rooms; None otherwise."""
+    for room in [rooms] if isinstance(rooms, str) else rooms or ():
+        kind, _, rest = room.partition(':')
+        if kind == 'platform':
+            return int(rest.partition(':')[0])
+    return None
+
+def apply_foreign_lift_delta(delta, platform):
+    fields = {k: v for k, v in delta.items() if k not in ('revision', 'position')}
+    active = meet_state_cache.apply_lift_delta(fields)
+    base = lifting_queue.get(fields['id']) or active
+    if base is not None:
+        lift = {**{k: v for k, v in base.items() if k != 'record_attempt'}, **fields}
+        lifting_queue.put(lift)
+    elif fields.get('status') == 'pending':
+        lifting_queue.invalidate(platform) # Back in the queue, but its other fields are unknown here
+    if fields.get('overall_result') is True:
+        if base is not None:
+            leaderboard.apply_good_lift(lift['lifter_id'], lift['lift_type'], lift['weight_lifted'])
+        else:
+            leaderboard.invalidate() # Not a lift this worker knows; reload the standings
+
+def apply_foreign_active_lift(lift, platform):
+    meet_state_cache.invalidate(platform) # The payload has the lift, not the meet state's new version
+    if lift is not None:
+        lifting_queue.discard(lift['id'], platform)
+
+def apply_foreign_lifter_added(lifter, platform):
+    leaderboard.add_lifter(lifter)
+    lifting_queue.invalidate(lifter['platform']) # Its lifts were not broadcast
+
+def apply_foreign_import(summary, platform):
+    lifting_queue.invalidate()
+    leaderboard.invalidate()
+
+def apply_foreign_class_change(weight_or_age_class, platform):
+    class_index.invalidate()
+    if weight_or_age_class.get('deleted'):
+        leaderboard.invalidate() # Deleted class may still be listed as an additional class
+
+# event -> handler(payload, platform) applying one payload (batched events carry a list)
+FOREIGN_EVENT_HANDLERS = {
+    'meet_state_updated': lambda state, platform: meet_state_cache.invalidate(platform),
+    'active_lift_changed': apply_foreign_active_lift,
+    'lift_updated': apply_foreign_lift_delta,
+    'queue_updated': apply_foreign_lift_delta,
+    'lifter_added': apply_foreign_lifter_added,
+    'lifters_imported': apply_foreign_import,
+    'lifter_updated': lambda delta, platform: replay_lifter_change(delta),
+    'weight_class_updated': apply_foreign_class_change,
+    'age_class_updated': apply_foreign_class_change,
+    'record_set': lambda record, platform: records_index.invalidate(),
+    'records_rebuilt': lambda summary, platform: invalidate_records(),
+    'meet_started': lambda meet, platform: invalidate_meet_caches(),
+}
+
+def apply_foreign_event(event, data, rooms):
+    """Brings this worker's caches up to date with an event broadcast by another worker."""
+    handler = FOREIGN_EVENT_HANDLERS.get(event)
+    if handler is None:
+        return # Derived views (loading, standings) that no cache is built from
+    table_revisions.invalidate()
+    platform = event_platform(rooms)
+    for payload in data if isinstance(data, list) else [data]:
+        handler(payload, platform)
+
+# --- Records ---
+# A good lift can set three records: the lifter's personal best (over all their meets,
+# by lifter_id_number), the meet record and the national record (all meets) of its
+# gender, weight class and age class. Each is one lift_record row under a key from
+# record_keys(), mirrored in memory by RecordsIndex, so telling whether the lift on
+# the platform is a record attempt takes a few dict lookups, and a good lift only
+# writes the records it beats.
+RECORD_KEY_FIELDS = {
+    'personal': ('lifter_id_number',),
+    'meet': ('meet_id', 'gender', 'weight_class_id', 'age_class_id'),
+    'national': ('gender', 'weight_class_id', 'age_class_id'),
+}
+
+def record_context(lift):
+    """What the record keys of a Lift are made of."""
+    lifter = lift.lifter
+    return {'lift_type': lift.lift_type, 'meet_id': lift.meet_id, 'lifter_id_number': lifter.lifter_id_number,
+            'gender': lifter.gender, 'weight_class_id': lifter.primary_weight_class_id,
+            'age_class_id': lifter.primary_age_class_id}
+
+def record_keys(context):
+    """scope -> record key of a lift; class records are skipped while a class is unassigned."""
+    keys = {}
+    for scope, names in RECORD_KEY_FIELDS.items():
+        if scope != 'personal' and (context['weight_class_id'] is None or context['age_class_id'] is None):
+            continue
+        keys[scope] = ':'.join([scope, context['lift_type'], *(str(context[name]) for name in names)])
+    return keys
+
+class RecordsIndex:
+    """key -> weight of every lift_record row, loaded with one query on first use."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = None
+        self._generation = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._records = None
+            self._generation += 1
+
+    def _ensure_loaded(self):
+        records = self._records
+        if records is not None:
+            return records
+        with self._lock:
+            generation = self._generation
+        records = dict(db.session.query(LiftRecord.key, LiftRecord.weight))
+        with self._lock:
+            if generation == self._generation:
+                self._records = records
+        return records
+
+    def get(self, key):
+        return self._ensure_loaded().get(key)
 
-lifter_additional_age_class = db.Table('lifter_additional_age_class',
-    db.Column('lifter_id', db.Integer, db.ForeignKey('lifter.id'), primary_key=True),
-    db.Column('age_class_id', db.Integer, db.ForeignKey('age_class.id'), primary_key=True)
-)
+    def record_attempt(self, keys, weight):
+        """Scopes whose existing record `weight` would beat."""
+        records = self._ensure_loaded()
+        return [scope for scope, key in keys.items() if key in records and weight > records[key]]
 
-class Lift(db.Model):
-    __tablename__ = 'lift' # Explicitly set table name for clarity
-    id = db.Column(db.Integer, primary_key=True)
-    lifter_id = db.Column(db.Integer, db.ForeignKey('lifter.id'), nullable=False)
-    lift_type = db.Column(db.String(50), nullable=False) # squat, bench, deadlift
-    attempt_number = db.Column(db.Integer, nullable=False) # 1, 2, 3
-    weight_lifted = db.Column(db.Float, nullable=False)
-    status = db.Column(db.String(50), default='pending') # pending, active, completed
+    def update(self, improved):
+        """Applies {key: weight} written by a committed transaction."""
+        with self._lock:
+            if self._records is not None:
+                self._records.update(improved)
 
-    judge1_score = db.Column(db.Boolean, nullable=True)
-    judge2_score = db.Column(db.Boolean, nullable=True)
-    judge3_score = db.Column(db.Boolean, nullable=True)
-    overall_result = db.Column(db.Boolean, nullable=True) # True for good lift, False for no lift
+records_index = RecordsIndex()
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'lifter_id': self.lifter_id,
-            'lifter_name': self.lifter.name,
-            'lifter_id_number': self.lifter.lifter_id_number,
-            'gender': self.lifter.gender,
-            'weight_class_name': self.lifter.primary_weight_class.name if self.lifter.primary_weight_class else None,
-            'lift_type': self.lift_type,
-            'attempt_number': self.attempt_number,
-            'weight_lifted': self.weight_lifted,
-            'status': self.status,
-            'judge1_score': self.judge1_score,
-            'judge2_score': self.judge2_score,
-            'judge3_score': self.judge3_score,
-            'overall_result': self.overall_result
-        }
+def invalidate_records():
+    """Drops the records index and the active lifts' record attempt flags built from it."""
+    records_index.invalidate()
+    meet_state_cache.invalidate()
 
-# --- Helper Functions (Backend Logic) ---
-def assign_primary_classes(lifter):
-    """Assigns primary weight and age classes to a lifter."""
-    # Assign Primary Weight Class
-    weight_class = WeightClass.query.filter(
-        (WeightClass.min_weight <= lifter.actual_weight) &
-        ((WeightClass.max_weight >= lifter.actual_weight) | (WeightClass.max_weight.is_(None))) &
-        ((WeightClass.gender == lifter.gender) | (WeightClass.gender == 'Both'))
-    ).order_by(WeightClass.min_weight).first()
-
-    if weight_class:
-        lifter.primary_weight_class_id = weight_class.id
-    else:
-        lifter.primary_weight_class_id = None # Or assign a default/error class
+def record_attempt(lift):
+    return records_index.record_attempt(record_keys(record_context(lift)), lift.weight_lifted)
 
-    # Assign Primary Age Class
-    age = calculate_age(lifter.birth_date)
-    age_class = AgeClass.query.filter(
-        (AgeClass.min_age <= age) &
-        ((AgeClass.max_age >= age) | (AgeClass.max_age.is_(None)))
-    ).order_by(AgeClass.min_age).first()
+def active_lift_dict(lift):
+    """Lift.to_dict() of a platform's active lift, plus the records it goes for."""
+    return {**lift.to_dict(), 'record_attempt': record_attempt(lift)}
 
-    if age_class:
-        lifter.primary_age_class_id = age_class.id
-    else:
-        lifter.primary_age_class_id = None # Or assign a default/error class
-    db.session.add(lifter)
+def update_records(lift, weight):
+    """Makes a good lift the holder of every record it beats, within the caller's
+    transaction. Returns ({key: weight}, scopes); pass the first to
+    records_index.update() once committed."""
+    context = record_context(lift)
+    holder = {'weight': weight, 'lift_id': lift.id, 'lifter_id': lift.lifter_id, 'lifter_name': lift.lifter.name,
+              'record_meet_id': lift.meet_id, 'set_at': datetime.utcnow()}
+    improved, scopes = {}, []
+    for scope, key in record_keys(context).items():
+        best = records_index.get(key)
+        if best is not None and best >= weight:
+            continue
+        beat = (update(LiftRecord).where(LiftRecord.key == key, LiftRecord.weight < weight).values(holder)
+                .execution_options(synchronize_session=False))
+        if best is None:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(LiftRecord(key=key, scope=scope, lift_type=context['lift_type'], **holder,
+                                              **{name: context[name] for name in RECORD_KEY_FIELDS[scope]}))
+                written = True
+            except IntegrityError: # Another worker set this record first
+                written = db.session.execute(beat).rowcount > 0
+        else:
+            written = db.session.execute(beat).rowcount > 0
+        if written:
+            improved[key] = weight
+            scopes.append(scope)
+        else:
+            records_index.invalidate() # Another worker holds a better record; reload
+    return improved, scopes
+
+def rebuild_records(connection):
+    """Recomputes every record from the good lifts of all meets (the first lift to
+    reach the best weight holds it) and replaces the lift_record rows. Returns the
+    number of records."""
+    rows = connection.execute(
+        select(Lift.id, Lift.meet_id, Lift.lift_type, Lift.weight_lifted, Lift.decided_at, Lifter.id,
+               Lifter.name, Lifter.lifter_id_number, Lifter.gender, Lifter.primary_weight_class_id,
+               Lifter.primary_age_class_id)
+        .join(Lifter, Lift.lifter_id == Lifter.id)
+        .where(Lift.overall_result.is_(True))
+    ).all()
+    rows.sort(key=lambda row: (row[4] or datetime.min, row[0]))
+    records = {}
+    for (lift_id, meet_id, lift_type, weight, decided_at, lifter_id, name, id_number, gender,
+         weight_class_id, age_class_id) in rows:
+        context = {'lift_type': lift_type, 'meet_id': meet_id, 'lifter_id_number': id_number, 'gender': gender,
+                   'weight_class_id': weight_class_id, 'age_class_id': age_class_id}
+        for scope, key in record_keys(context).items():
+            if key in records and records[key]['weight'] >= weight:
+                continue
+            records[key] = {'key': key, 'scope': scope, 'lift_type': lift_type,
+                            'lifter_id_number': None, 'meet_id': None, 'gender': None,
+                            'weight_class_id': None, 'age_class_id': None,
+                            **{name: context[name] for name in RECORD_KEY_FIELDS[scope]},
+                            'weight': weight, 'lift_id': lift_id, 'lifter_id': lifter_id, 'lifter_name': name,
+                            'record_meet_id': meet_id, 'set_at': decided_at or datetime.utcnow()}
+    connection.execute(delete(LiftRecord.__table__))
+    if records:
+        connection.execute(insert(LiftRecord.__table__), list(records.values()))
+    return len(records)
+
+# --- Lift Progression ---
+# With auto_advance on, the platform calls its next lift as soon as the current one
+# is decided: the rest of the round in lifting order, then the next attempt, flight
+# and lift (LIFT_ORDER). The next lift is the head of the in-memory queue, so the
+# step costs no ORDER BY scan, and the loaders' bar breakdown for the upcoming
+# lifts is pushed with every change instead of being queried by their screen.
+@functools.lru_cache(maxsize=1024)
+def plate_loading(weight):
+    """Plates for one side of the bar, heaviest first, to load `weight` kg (bar and
+    collars included), plus whatever per side the plates cannot make up."""
+    collars = weight >= BAR_WEIGHT + 2 * COLLAR_WEIGHT
+    remaining = (weight - BAR_WEIGHT - (2 * COLLAR_WEIGHT if collars else 0)) / 2
+    plates = []
+    for plate in PLATE_WEIGHTS:
+        count = int((remaining + 1e-9) // plate)
+        plates.extend([plate] * count)
+        remaining -= count * plate
+    return {'plates_per_side': tuple(plates), 'collars': collars, 'unloaded_per_side': round(max(remaining, 0), 3)}
+
+def bar_loading(platform, limit=LOADING_PREVIEW):
+    """The lift on a platform's bar and the next `limit` in competition order, each
+    with its plate breakdown. Answered from the meet state cache and lifting queue."""
+    state, active_lift = meet_state_cache.get(platform)
+    if state is None:
+        return None
+    lifts = [active_lift] if active_lift and active_lift['status'] == 'active' else []
+    lifts += lifting_queue.upcoming(platform, state['current_flight'], state['current_lift_type'],
+                                    state['current_attempt_number'], limit)
+    return {
+        'platform': platform,
+        'lifts': [{'id': lift['id'], 'lifter_id': lift['lifter_id'], 'lifter_name': lift['lifter_name'],
+                   'flight': lift['flight'], 'lift_type': lift['lift_type'],
+                   'attempt_number': lift['attempt_number'], 'weight_lifted': lift['weight_lifted'],
+                   **plate_loading(lift['weight_lifted'])}
+                  for lift in lifts],
+    }
+
+def publish_loading(platform):
+    broadcast('loading_updated', bar_loading(platform), platform)
+
+def next_pending_lift(meet_state, across_rounds=False):
+    """The Lift a platform should call next: the head of its current round or, with
+    across_rounds, of the first later round that still has lifts. None if there is none."""
+    find = lifting_queue.upcoming if across_rounds else lifting_queue.peek
+    platform = meet_state.platform
+    while True:
+        head = find(platform, meet_state.current_flight, meet_state.current_lift_type,
+                    meet_state.current_attempt_number, limit=1)
+        if not head:
+            return None
+        lift = db.session.get(Lift, head[0]['id'])
+        if lift and lift.status == 'pending' and lift.lifter.platform == platform:
+            return lift
+        # Queue entry went stale (e.g. changed by another worker); drop it and try the next one
+        lifting_queue.discard(head[0]['id'], platform)
+
+def clear_active_lift(meet_state, meet_state_before=None):
+    """Leaves a platform without an active lift, commits and notifies its clients."""
+    before = meet_state_before or meet_state.to_dict()
+    meet_state.current_active_lift_id = None
+    delta = record_change('meet_state', meet_state, before)
     db.session.commit()
+    meet_state_cache.set(meet_state)
+    if delta and set(delta) - {'id', 'version', 'revision', 'current_active_lift_id'}:
+        broadcast('meet_state_updated', {**meet_state.to_dict(), 'revision': delta['revision']}, meet_state.platform)
+    broadcast('active_lift_changed', None, meet_state.platform) # No active lift
+    publish_loading(meet_state.platform)
 
-def generate_lifts_for_lifter(lifter):
-    """Generates 3 lifts for each lift type for a new lifter."""
-    lifts_to_add = []
-    for lift_type_name in ['squat', 'bench', 'deadlift']:
-        opener_weight = getattr(lifter, f'opener_{lift_type_name}')
-        if opener_weight is not None:
-            lifts_to_add.append(Lift(
-                lifter_id=lifter.id,
-                lift_type=lift_type_name,
-                attempt_number=1,
-                weight_lifted=opener_weight
-            ))
-            # Attempt 2: Opener + 5kg
-            lifts_to_add.append(Lift(
-                lifter_id=lifter.id,
-                lift_type=lift_type_name,
-                attempt_number=2,
-                weight_lifted=opener_weight + 5
-            ))
-            # Attempt 3: Opener + 10kg (or a smart increment)
-            lifts_to_add.append(Lift(
-                lifter_id=lifter.id,
-                lift_type=lift_type_name,
-                attempt_number=3,
-                weight_lifted=opener_weight + 10
-            ))
-    db.session.add_all(lifts_to_add)
+def activate_lift(meet_state, lift, meet_state_before=None):
+    """Makes a pending lift the platform's active lift, commits and notifies its clients.
+
+    A previous active lift that was not decided goes back to pending. Pass
+    `meet_state_before` when meet_state was already changed (e.g. moved to the
+    lift's round) so the change is logged as one. Returns the lift's delta.
+    """
+    platform = meet_state.platform
+    meet_state_before = meet_state_before or meet_state.to_dict()
+    prev_active_lift = None
+    prev_delta = None
+    if meet_state.current_active_lift_id:
+        prev_active_lift = Lift.query.get(meet_state.current_active_lift_id)
+        if prev_active_lift and prev_active_lift.status == 'active':
+            before = prev_active_lift.to_dict()
+            prev_active_lift.status = 'pending'
+            db.session.add(prev_active_lift)
+            prev_delta = record_change('lift', prev_active_lift, before)
+        else:
+            prev_active_lift = None
+
+    lift_before = lift.to_dict()
+    meet_state.current_active_lift_id = lift.id
+    lift.status = 'active'
+    lift.judge1_score = None # Reset scores for new active lift
+    lift.judge2_score = None
+    lift.judge3_score = None
+    lift.overall_result = None
+
+    db.session.add_all([meet_state, lift])
+    state_delta = record_change('meet_state', meet_state, meet_state_before)
+    delta = record_change('lift', lift, lift_before, event='lift_activated')
     db.session.commit()
+    meet_state_cache.set(meet_state, lift)
+    if prev_active_lift:
+        lifting_queue.sync(prev_active_lift)
+    lifting_queue.sync(lift)
 
-def update_overall_result(lift):
-    """Updates the overall result of a lift based on judge scores."""
-    scores = [lift.judge1_score, lift.judge2_score, lift.judge3_score]
-    # Filter out None scores (judges who haven't scored yet)
-    valid_scores = [s for s in scores if s is not None]
-
-    if len(valid_scores) >= 2: # At least two judges must have scored
-        good_lifts = valid_scores.count(True)
-        no_lifts = valid_scores.count(False)
-        if good_lifts > no_lifts:
-            lift.overall_result = True
-            lift.status = 'completed'
-        elif no_lifts > good_lifts:
-            lift.overall_result = False
-            lift.status = 'completed'
-        db.session.commit()
-        socketio.emit('lift_updated', lift.to_dict()) # Emit update
-        return True
-    return False
+    if prev_delta:
+        broadcast('lift_updated', prev_delta, platform)
+    if state_delta and set(state_delta) - {'id', 'version', 'revision', 'current_active_lift_id'}:
+        # Moved on to another round, flight or lift
+        broadcast('meet_state_updated', {**meet_state.to_dict(), 'revision': state_delta['revision']}, platform)
+    broadcast('active_lift_changed',
+              {**active_lift_dict(lift), 'revision': delta['revision'] if delta else current_revision()}, platform)
+    publish_loading(platform)
+    return delta
 
+def advance_platform(meet_state):
+    """Calls a platform's next lift in competition order, moving its meet state to
+    that lift's round (attempt, flight, lift type) when the current round is done.
+    Returns the activated Lift, or None once the platform has no pending lifts."""
+    before = meet_state.to_dict()
+    lift = next_pending_lift(meet_state, across_rounds=True)
+    if lift is None:
+        clear_active_lift(meet_state, before)
+        return None
+    meet_state.current_lift_type = lift.lift_type
+    meet_state.current_attempt_number = lift.attempt_number
+    if meet_state.current_flight is not None:
+        meet_state.current_flight = lift.lifter.flight
+    activate_lift(meet_state, lift, before)
+    return lift
 
 # --- Routes ---
 @app.route('/')
@@ -276,36 +2797,75 @@ def index():
     return "Powerlifting Meet Backend is running!"
 
 # Meet State Management
+# Every platform has its own meet state, active lift and lifting queue. Routes take
+# the platform as ?platform= (or "platform" in a JSON body) and default to 1; their
+# events go to that platform's Socket.IO room only.
+@app.route('/platforms', methods=['GET'])
+def list_platforms():
+    states = []
+    for platform in range(1, app.config['MEET_PLATFORMS'] + 1):
+        state, active_lift = meet_state_cache.get(platform)
+        if state:
+            states.append({**state, 'active_lift': active_lift})
+    return jsonify(states)
+
 @app.route('/meet_state', methods=['GET', 'POST'])
 def manage_meet_state():
-    meet_state = MeetState.query.first()
-    if not meet_state:
-        meet_state = MeetState()
-        db.session.add(meet_state)
-        db.session.commit()
+    data = request.get_json() if request.method == 'POST' else None
+    try:
+        platform = request_platform(data)
+        flight = parse_flight(data['current_flight'], default=None) if data and 'current_flight' in data else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if data and 'auto_advance' in data and not isinstance(data['auto_advance'], bool):
+        return jsonify({"error": "auto_advance must be true or false"}), 400
 
     if request.method == 'POST':
-        data = request.get_json()
+        meet_state = load_meet_state(platform)
+        if not meet_state:
+            return jsonify({"error": "Meet state not initialized"}), 404
+        before = meet_state.to_dict()
+        if 'current_flight' in data:
+            meet_state.current_flight = flight
+            meet_state.current_attempt_number = 1 # A new flight starts over at attempt 1
+            meet_state.current_active_lift_id = None
         if 'current_lift_type' in data:
             meet_state.current_lift_type = data['current_lift_type']
             meet_state.current_attempt_number = 1 # Reset attempt when lift type changes
             meet_state.current_active_lift_id = None # Clear active lift
+        if 'auto_advance' in data:
+            meet_state.auto_advance = data['auto_advance']
+        delta = record_change('meet_state', meet_state, before)
+        if delta is None:
+            return jsonify(meet_state.to_dict())
         db.session.commit()
-        socketio.emit('meet_state_updated', meet_state.to_dict())
+        meet_state_cache.set(meet_state)
+        broadcast('meet_state_updated', {**meet_state.to_dict(), 'revision': delta['revision']}, platform)
         return jsonify(meet_state.to_dict())
-    return jsonify(meet_state.to_dict())
+
+    state, _ = meet_state_cache.get(platform)
+    if state is None:
+        return jsonify({"error": "Meet state not initialized"}), 404
+    return jsonify(state)
 
 @app.route('/meet_state/advance_attempt', methods=['POST'])
 def advance_attempt_route():
-    meet_state = MeetState.query.first()
+    try:
+        platform = request_platform(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    meet_state = load_meet_state(platform)
     if not meet_state:
         return jsonify({"error": "Meet state not initialized"}), 404
 
     if meet_state.current_attempt_number < 3:
+        before = meet_state.to_dict()
         meet_state.current_attempt_number += 1
         meet_state.current_active_lift_id = None # Clear active lift when advancing attempt
+        delta = record_change('meet_state', meet_state, before)
         db.session.commit()
-        socketio.emit('meet_state_updated', meet_state.to_dict())
+        meet_state_cache.set(meet_state)
+        broadcast('meet_state_updated', {**meet_state.to_dict(), 'revision': delta['revision']}, platform)
         return jsonify(meet_state.to_dict())
     else:
         return jsonify({"error": "Cannot advance beyond attempt 3"}), 400
@@ -314,81 +2874,297 @@ def advance_attempt_route():
 def set_active_lift():
     data = request.get_json()
     lift_id = data.get('lift_id')
+    try:
+        platform = request_platform(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    meet_state = MeetState.query.first()
+    meet_state = load_meet_state(platform)
     if not meet_state:
         return jsonify({"error": "Meet state not initialized"}), 404
 
-    # If no lift_id is provided, auto-select the next pending lift
+    # If no lift_id is provided, auto-select the next pending lift. With auto_advance
+    # on, the platform moves on to the next round/flight/lift when this one is done.
     if lift_id is None:
-        next_lift_candidate = Lift.query.filter_by(
-            status='pending',
-            lift_type=meet_state.current_lift_type,
-            attempt_number=meet_state.current_attempt_number
-        ).order_by(Lift.weight_lifted, Lift.lifter_id).first() # Order to pick consistently
-        if next_lift_candidate:
-            lift_id = next_lift_candidate.id
-        else:
-            meet_state.current_active_lift_id = None
-            db.session.commit()
-            socketio.emit('active_lift_changed', None) # No active lift
+        if meet_state.auto_advance:
+            lift = advance_platform(meet_state)
+            if lift is None:
+                return jsonify({"message": "No more pending lifts on this platform. Active lift cleared."}), 200
+            return jsonify(active_lift_dict(lift))
+        lift = next_pending_lift(meet_state)
+        if lift is None:
+            clear_active_lift(meet_state)
             return jsonify({"message": "No more pending lifts for current attempt/type. Active lift cleared."}), 200
+        lift_id = lift.id
 
-    lift = Lift.query.get(lift_id)
+    lift = lift_query().filter(Lift.id == lift_id, Lift.meet_id == current_meet_id()).first()
     if not lift:
-        return jsonify({"error": "Lift not found"}), 404
+        return jsonify({"error": "Lift not found"}), 404 # Or it belongs to an earlier meet
     if lift.status != 'pending':
         return jsonify({"error": "Only pending lifts can be set as active"}), 400
+    if lift.lifter.platform != platform:
+        return jsonify({"error": f"Lift belongs to platform {lift.lifter.platform}"}), 400
 
-    # Set any previous active lift back to pending (if not completed)
-    if meet_state.current_active_lift_id:
-        prev_active_lift = Lift.query.get(meet_state.current_active_lift_id)
-        if prev_active_lift and prev_active_lift.status == 'active':
-            prev_active_lift.status = 'pending'
-            db.session.add(prev_active_lift)
-            socketio.emit('lift_updated', prev_active_lift.to_dict())
-
-    meet_state.current_active_lift_id = lift.id
-    lift.status = 'active'
-    lift.judge1_score = None # Reset scores for new active lift
-    lift.judge2_score = None
-    lift.judge3_score = None
-    lift.overall_result = None
-
-    db.session.add_all([meet_state, lift])
-    db.session.commit()
-
-    socketio.emit('active_lift_changed', lift.to_dict())
-    return jsonify(lift.to_dict())
+    activate_lift(meet_state, lift)
+    return jsonify(active_lift_dict(lift))
 
 @app.route('/current_lift', methods=['GET'])
 def get_current_lift():
-    meet_state = MeetState.query.first()
-    if meet_state and meet_state.current_active_lift_id:
-        lift = Lift.query.get(meet_state.current_active_lift_id)
-        if lift:
-            return jsonify(lift.to_dict())
-    return jsonify({}), 200 # Return empty object if no current lift
+    try:
+        platform = request_platform()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    state, active_lift = meet_state_cache.get(platform)
+    # Tagged from the cached versions, so revalidating costs no query at all
+    etag = f"{platform}-{state['version'] if state else 0}-{active_lift['version'] if active_lift else 0}"
+    if etag in request.if_none_match:
+        return tagged_response(b'', etag)
+    return tagged_response(json.dumps(active_lift or {}), etag) # Empty object if no current lift
 
 @app.route('/next_lift_in_queue', methods=['GET'])
 def get_next_lift_in_queue():
-    # This endpoint now primarily serves to trigger queue updates, but the queue itself
-    # is typically calculated and fetched by the frontend based on all lifts.
-    # We ensure current meet state is fetched for consistent filtering logic.
-    meet_state = MeetState.query.first()
+    # Returns the pending lifts for the platform's current flight/lift type/attempt
+    # in lifting order (lightest bar first), served from the in-memory queue index.
+    try:
+        platform = request_platform()
+        flight = parse_flight(request.args['flight'], default=None) if 'flight' in request.args else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    meet_state, _ = meet_state_cache.get(platform)
     if not meet_state:
         return jsonify({"message": "Meet state not initialized"}), 200
 
-    # Frontend will query /lifts and filter, so no need to return a specific "next" lift here.
-    # This endpoint can be used to signal updates if complex queueing logic happens on backend.
-    return jsonify({"message": "Queue calculation handled by frontend, data from /lifts"}), 200
+    if 'flight' not in request.args:
+        flight = meet_state['current_flight']
+    lift_type = request.args.get('lift_type', meet_state['current_lift_type'])
+    attempt_number = request.args.get('attempt_number', meet_state['current_attempt_number'], type=int)
+    limit = request.args.get('limit', 10, type=int)
+    if limit is not None and limit <= 0:
+        limit = None # limit=0 returns the whole queue
+
+    return jsonify({
+        'platform': platform,
+        'flight': flight,
+        'lift_type': lift_type,
+        'attempt_number': attempt_number,
+        'lifts': lifting_queue.peek(platform, flight, lift_type, attempt_number, limit)
+    })
+
+@app.route('/loading', methods=['GET'])
+def get_bar_loading():
+    # Plate breakdown of the lift on the bar and the next ones, for the loaders' screen
+    # (also pushed as 'loading_updated' whenever it changes)
+    try:
+        platform = request_platform()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    loading = bar_loading(platform, request.args.get('limit', LOADING_PREVIEW, type=int))
+    if loading is None:
+        return jsonify({"message": "Meet state not initialized"}), 200
+    return jsonify(loading)
+
+@app.route('/sync', methods=['GET'])
+def sync_changes():
+    # Returns what changed since a client's last seen revision, collapsed to one
+    # entry per entity (latest value of each changed field). The entries also cover
+    # the SYNC_REPLAY_OVERLAP revisions before `since`, so a change that committed
+    # late with a lower revision is not lost; fields the client already has come
+    # back with the same values (and 'version'), so applying them again is harmless.
+    # Without `since` only the current revision is returned, so a client can record
+    # it before doing its initial full fetch.
+    since = request.args.get('since', type=int)
+    if since is None:
+        return jsonify({'revision': current_revision()})
+
+    revision = since
+    merged = {}
+    for change in MeetChange.query.filter(MeetChange.id > since - SYNC_REPLAY_OVERLAP).order_by(MeetChange.id).all():
+        revision = max(revision, change.id)
+        key = (change.entity, change.entity_id)
+        if change.deleted:
+            merged[key] = {'id': change.entity_id, 'deleted': True}
+        else:
+            merged.setdefault(key, {'id': change.entity_id}).update(change.changes or {})
+
+    changes = {}
+    for (entity, _), fields in merged.items():
+        changes.setdefault(entity, []).append(fields)
+    return jsonify({'revision': revision, 'changes': changes})
+
+@app.route('/events', methods=['GET'])
+def get_events():
+    # The raw event log (audit trail): every logged change in order, unmerged, with
+    # its event name. Optional filters: since (revision), entity, entity_id, limit.
+    numbers = {}
+    for name in ('since', 'limit', 'entity_id'):
+        if name in request.args:
+            numbers[name] = request.args.get(name, type=int)
+            if numbers[name] is None:
+                return jsonify({"error": f"{name} must be an integer"}), 400
+    since = numbers.get('since', 0)
+    limit = min(numbers.get('limit', 500), 5000)
+    query = MeetChange.query.filter(MeetChange.id > since)
+    if 'entity' in request.args:
+        query = query.filter(MeetChange.entity == request.args['entity'])
+    if 'entity_id' in numbers:
+        query = query.filter(MeetChange.entity_id == numbers['entity_id'])
+    changes = query.order_by(MeetChange.id).limit(limit).all()
+    return jsonify({'revision': changes[-1].id if changes else since, 'events': [c.to_dict() for c in changes]})
+
+@app.route('/cache_snapshots', methods=['GET', 'POST'])
+def manage_cache_snapshots():
+    # POST takes a snapshot now (e.g. right before a planned restart)
+    if request.method == 'POST':
+        snapshot = save_cache_snapshot()
+        if snapshot is None:
+            return jsonify({"message": "Latest snapshot is up to date"}), 200
+        return jsonify(snapshot.to_dict()), 201
+    snapshots = CacheSnapshot.query.order_by(CacheSnapshot.id.desc()).all()
+    return jsonify([snapshot.to_dict() for snapshot in snapshots])
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    # Prometheus scrape target (this worker's counters)
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/metrics/profiler', methods=['GET', 'POST'])
+def manage_profiler():
+    # POST {"enabled": true, "slow_request_ms": 250, "interval_ms": 5} switches the
+    # slow-request profiler of this worker; GET returns its settings and the slow
+    # requests kept so far (newest first). POST {"clear": true} drops them.
+    if request.method == 'POST':
+        data = request.get_json() or {}
+        for key, setting in (('slow_request_ms', 'SLOW_REQUEST_MS'), ('interval_ms', 'PROFILER_INTERVAL_MS')):
+            if key in data:
+                value = data[key]
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                    return jsonify({"error": f"{key} must be a positive number"}), 400
+                app.config[setting] = float(value)
+        if 'enabled' in data:
+            if not isinstance(data['enabled'], bool):
+                return jsonify({"error": "enabled must be true or false"}), 400
+            app.config['PROFILER_ENABLED'] = data['enabled']
+        if data.get('clear'):
+            profiler.slow_requests.clear()
+    return jsonify({
+        'enabled': app.config['PROFILER_ENABLED'],
+        'slow_request_ms': app.config['SLOW_REQUEST_MS'],
+        'interval_ms': app.config['PROFILER_INTERVAL_MS'],
+        'slow_requests': list(reversed(profiler.slow_requests)),
+    })
+
+@app.route('/leaderboard', methods=['GET'])
+def get_leaderboard():
+    # Pre-ranked standings, optionally per weight/age class (primary or additional)
+    # and gender. sort: total_lift (default), dots, wilks or ipf_gl.
+    sort = request.args.get('sort', 'total_lift')
+    if sort not in LEADERBOARD_SORT_KEYS:
+        return jsonify({"error": f"sort must be one of {', '.join(LEADERBOARD_SORT_KEYS)}"}), 400
+    ranked = leaderboard.ranked(
+        weight_class_id=request.args.get('weight_class_id', type=int),
+        age_class_id=request.args.get('age_class_id', type=int),
+        gender=request.args.get('gender'),
+        sort=sort
+    )
+    limit = request.args.get('limit', type=int)
+    return jsonify(ranked[:limit] if limit else ranked)
+
+# Meets and Records
+@app.route('/meets', methods=['GET', 'POST'])
+def manage_meets():
+    # POST starts a new meet ({"name", "meet_date"}): the active meet is archived and
+    # every platform starts over with its own meet state. Records carry over.
+    if request.method == 'POST':
+        data = request.get_json() or {}
+        name = (data.get('name') or '').strip()
+        if not name:
+            return jsonify({"error": "name is required"}), 400
+        try:
+            day = datetime.strptime(data['meet_date'], '%Y-%m-%d').date() if data.get('meet_date') else None
+        except (TypeError, ValueError):
+            return jsonify({"error": "meet_date must be YYYY-MM-DD"}), 400
+        now = datetime.utcnow()
+        for meet in Meet.query.filter_by(status='active').with_for_update():
+            before = meet.to_dict()
+            meet.status = 'archived'
+            meet.archived_at = now
+            record_change('meet', meet, before, event='meet_archived')
+        new_meet = Meet(name=name, meet_date=day, status='active', created_at=now)
+        db.session.add(new_meet)
+        db.session.flush()
+        delta = record_change('meet', new_meet)
+        db.session.commit()
+        current_meet.invalidate()
+        ensure_meet_states()
+        db.session.commit()
+        invalidate_meet_caches()
+        broadcast('meet_started', {**new_meet.to_dict(), 'revision': delta['revision']})
+        return jsonify(new_meet.to_dict()), 201
+    meets = Meet.query.order_by(Meet.id.desc()).all()
+    return jsonify([meet.to_dict() for meet in meets])
+
+@app.route('/meets/current', methods=['GET'])
+def get_current_meet():
+    meet = current_meet.get()
+    if meet is None:
+        return jsonify({"error": "No meet has been started"}), 404
+    return jsonify(meet)
+
+@app.route('/records', methods=['GET'])
+def get_records():
+    # Current records. Optional filters: scope (personal, meet, national), lift_type,
+    # lifter_id_number, gender, meet_id, weight_class_id, age_class_id.
+    query = LiftRecord.query
+    for name in ('scope', 'lift_type', 'lifter_id_number', 'gender'):
+        if request.args.get(name):
+            query = query.filter(getattr(LiftRecord, name) == request.args[name])
+    for name in ('meet_id', 'weight_class_id', 'age_class_id'):
+        if request.args.get(name):
+            value = request.args.get(name, type=int)
+            if value is None:
+                return jsonify({"error": f"{name} must be an integer"}), 400
+            query = query.filter(getattr(LiftRecord, name) == value)
+    records = query.order_by(LiftRecord.scope, LiftRecord.lift_type, LiftRecord.key).all()
+    return jsonify([record.to_dict() for record in records])
+
+@app.route('/records/rebuild', methods=['POST'])
+def rebuild_all_records():
+    # Recomputes every record from the lifts (e.g. after results were corrected)
+    count = rebuild_records(db.session.connection())
+    db.session.commit()
+    invalidate_records()
+    broadcast('records_rebuilt', {'records': count})
+    return jsonify({"records": count}), 200
+
+@app.route('/lifts/<int:lift_id>/records', methods=['GET'])
+def get_lift_records(lift_id):
+    # The personal, meet and national records a lift competes against, and which of
+    # them its weight would break
+    lift = lift_query().filter(Lift.id == lift_id).first()
+    if not lift:
+        return jsonify({"error": "Lift not found"}), 404
+    keys = record_keys(record_context(lift))
+    held = {record.key: record for record in LiftRecord.query.filter(LiftRecord.key.in_(keys.values()))}
+    return jsonify({
+        'lift_id': lift.id,
+        'weight_lifted': lift.weight_lifted,
+        'record_attempt': records_index.record_attempt(keys, lift.weight_lifted),
+        'records': {scope: held[key].to_dict() if key in held else None for scope, key in keys.items()},
+    })
 
 # Lifter Management
 @app.route('/lifters', methods=['GET', 'POST'])
+@cached_get('lifter', 'weight_class', 'age_class')
 def manage_lifters():
     if request.method == 'POST':
         data = request.get_json()
+        try:
+            platform = parse_platform(data.get('platform'))
+            flight = parse_flight(data.get('flight'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         new_lifter = Lifter(
+            meet_id=current_meet_id(),
             name=data['name'],
             gender=data['gender'],
             lifter_id_number=data['lifter_id_number'],
@@ -396,21 +3172,143 @@ def manage_lifters():
             birth_date=datetime.strptime(data['birth_date'], '%Y-%m-%d').date(),
             opener_squat=data.get('opener_squat'),
             opener_bench=data.get('opener_bench'),
-            opener_deadlift=data.get('opener_deadlift')
+            opener_deadlift=data.get('opener_deadlift'),
+            platform=platform,
+            flight=flight
         )
         db.session.add(new_lifter)
         db.session.commit()
         assign_primary_classes(new_lifter)
+        delta = record_change('lifter', new_lifter)
+        db.session.commit()
         generate_lifts_for_lifter(new_lifter)
-        socketio.emit('lifter_added', new_lifter.to_dict()) # Emit lifter added event
+        leaderboard.add_lifter(new_lifter.to_dict())
+        broadcast('lifter_added', {**new_lifter.to_dict(), 'revision': delta['revision']}) # Emit lifter added event
         return jsonify(new_lifter.to_dict()), 201
     elif request.method == 'GET':
-        lifters = Lifter.query.all()
+        try:
+            meet_id = request_meet_id()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        lifters = lifter_query().filter(Lifter.meet_id == meet_id).all()
         return jsonify([lifter.to_dict() for lifter in lifters])
 
+@app.route('/lifters/import', methods=['POST'])
+def import_lifters():
+    # Bulk registration: a JSON array of lifter objects, or CSV (raw text/csv body
+    # or a multipart 'file' upload) with the same column names as POST /lifters.
+    # Valid rows are inserted together with their lifts in one transaction; invalid
+    # rows are reported back by row number. One 'lifters_imported' event is emitted.
+    if request.is_json:
+        rows = request.get_json()
+        if not isinstance(rows, list):
+            return jsonify({"error": "Expected a JSON array of lifters"}), 400
+    else:
+        stream = request.files['file'].stream if 'file' in request.files else request.stream
+        rows = csv.DictReader(csv_lines(stream))
+
+    errors = []
+    parsed = [] # (row number, column values)
+    seen_id_numbers = set()
+    row_number = 0
+    try:
+        for row_number, row in enumerate(rows, start=1):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Expected an object")
+                values = parse_lifter_row(row)
+                if values['lifter_id_number'] in seen_id_numbers:
+                    raise ValueError(f"Duplicate lifter_id_number {values['lifter_id_number']!r} in import")
+            except ValueError as e:
+                errors.append({'row': row_number, 'error': str(e)})
+                continue
+            seen_id_numbers.add(values['lifter_id_number'])
+            parsed.append((row_number, values))
+    except (UnicodeDecodeError, csv.Error) as e:
+        # The file itself is unreadable from here on (not UTF-8, NUL bytes, ...); nothing is imported
+        db.session.rollback()
+        return jsonify({"error": f"Cannot read row {row_number + 1}: {e}", "row": row_number + 1}), 400
+
+    meet_id = current_meet_id()
+    existing = set()
+    if seen_id_numbers:
+        existing = {id_number for (id_number,) in db.session.query(Lifter.lifter_id_number)
+                    .filter(Lifter.meet_id == meet_id, Lifter.lifter_id_number.in_(seen_id_numbers))}
+
+    tables = class_index.get()
+
+    new_lifters = []
+    new_lifts = []
+    for row_number, values in parsed:
+        if values['lifter_id_number'] in existing:
+            errors.append({'row': row_number, 'error': f"Lifter ID {values['lifter_id_number']!r} already registered"})
+            continue
+        lifter = Lifter(**values, meet_id=meet_id, additional_weight_classes=[], additional_age_classes=[])
+        lifter.primary_weight_class_id, lifter.primary_age_class_id = tables.resolve(
+            lifter.gender, lifter.actual_weight, lifter.birth_date)
+        new_lifters.append(lifter)
+        new_lifts.extend(build_lifts_for_lifter(lifter))
+
+    revision = None
+    if new_lifters:
+        db.session.add_all(new_lifters)
+        db.session.add_all(new_lifts)
+        db.session.flush() # Batched multi-row INSERTs
+        for lifter in new_lifters:
+            record_change('lifter', lifter, flush=False)
+        for lift in new_lifts:
+            record_change('lift', lift, flush=False)
+        db.session.flush()
+        revision = current_revision()
+        lifter_ids = [lifter.id for lifter in new_lifters]
+        db.session.commit()
+        lifting_queue.invalidate() # Reloaded with one query on next use
+        leaderboard.invalidate()
+        broadcast('lifters_imported', {
+            'count': len(lifter_ids),
+            'lifter_ids': lifter_ids,
+            'revision': revision
+        })
+
+    errors.sort(key=lambda e: e['row'])
+    status = 201 if new_lifters else 400
+    return jsonify({
+        'imported': len(new_lifters),
+        'lift_count': len(new_lifts),
+        'errors': errors,
+        'revision': revision
+    }), status
+
+@app.route('/lifters/<int:lifter_id>/platform', methods=['POST'])
+def assign_lifter_platform(lifter_id):
+    # Moves a lifter to another platform and/or flight; their pending lifts follow
+    lifter = active_meet_lifter(lifter_id)
+    if not lifter:
+        return jsonify({"error": "Lifter not found"}), 404
+    data = request.get_json()
+    try:
+        platform = parse_platform(data.get('platform'), default=lifter.platform)
+        flight = parse_flight(data.get('flight'), default=lifter.flight)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    before = lifter.to_dict()
+    lifter.platform = platform
+    lifter.flight = flight
+    delta = record_change('lifter', lifter, before)
+    if delta is None:
+        return jsonify(lifter.to_dict()), 200
+    db.session.commit()
+    lifting_queue.invalidate(before['platform'])
+    lifting_queue.invalidate(platform)
+    meet_state_cache.update_lifter_fields(lifter.id, {'platform': platform, 'flight': flight})
+    leaderboard.apply_lifter_delta(delta)
+    broadcast('lifter_updated', delta)
+    return jsonify(lifter.to_dict()), 200
+
 @app.route('/lifters/<int:lifter_id>/add_additional_weight_class', methods=['POST'])
 def add_lifter_additional_weight_class(lifter_id):
-    lifter = Lifter.query.get(lifter_id)
+    lifter = active_meet_lifter(lifter_id)
     if not lifter:
         return jsonify({"error": "Lifter not found"}), 404
     data = request.get_json()
@@ -420,15 +3318,18 @@ def add_lifter_additional_weight_class(lifter_id):
         return jsonify({"error": "Weight class not found"}), 404
 
     if weight_class not in lifter.additional_weight_classes:
+        before = lifter.to_dict()
         lifter.additional_weight_classes.append(weight_class)
+        delta = record_change('lifter', lifter, before, event='class_changed')
         db.session.commit()
-        socketio.emit('lifter_updated', lifter.to_dict())
+        leaderboard.apply_lifter_delta(delta)
+        broadcast('lifter_updated', delta)
         return jsonify(lifter.to_dict()), 200
     return jsonify({"message": "Weight class already added"}), 409
 
 @app.route('/lifters/<int:lifter_id>/remove_additional_weight_class', methods=['POST'])
 def remove_lifter_additional_weight_class(lifter_id):
-    lifter = Lifter.query.get(lifter_id)
+    lifter = active_meet_lifter(lifter_id)
     if not lifter:
         return jsonify({"error": "Lifter not found"}), 404
     data = request.get_json()
@@ -438,15 +3339,18 @@ def remove_lifter_additional_weight_class(lifter_id):
         return jsonify({"error": "Weight class not found"}), 404
 
     if weight_class in lifter.additional_weight_classes:
+        before = lifter.to_dict()
         lifter.additional_weight_classes.remove(weight_class)
+        delta = record_change('lifter', lifter, before, event='class_changed')
         db.session.commit()
-        socketio.emit('lifter_updated', lifter.to_dict())
+        leaderboard.apply_lifter_delta(delta)
+        broadcast('lifter_updated', delta)
         return jsonify(lifter.to_dict()), 200
     return jsonify({"message": "Weight class not found on lifter"}), 404
 
 @app.route('/lifters/<int:lifter_id>/add_additional_age_class', methods=['POST'])
 def add_lifter_additional_age_class(lifter_id):
-    lifter = Lifter.query.get(lifter_id)
+    lifter = active_meet_lifter(lifter_id)
     if not lifter:
         return jsonify({"error": "Lifter not found"}), 404
     data = request.get_json()
@@ -456,15 +3360,18 @@ def add_lifter_additional_age_class(lifter_id):
         return jsonify({"error": "Age class not found"}), 404
 
     if age_class not in lifter.additional_age_classes:
+        before = lifter.to_dict()
         lifter.additional_age_classes.append(age_class)
+        delta = record_change('lifter', lifter, before, event='class_changed')
         db.session.commit()
-        socketio.emit('lifter_updated', lifter.to_dict())
+        leaderboard.apply_lifter_delta(delta)
+        broadcast('lifter_updated', delta)
         return jsonify(lifter.to_dict()), 200
     return jsonify({"message": "Age class already added"}), 409
 
 @app.route('/lifters/<int:lifter_id>/remove_additional_age_class', methods=['POST'])
 def remove_lifter_additional_age_class(lifter_id):
-    lifter = Lifter.query.get(lifter_id)
+    lifter = active_meet_lifter(lifter_id)
     if not lifter:
         return jsonify({"error": "Lifter not found"}), 404
     data = request.get_json()
@@ -474,14 +3381,18 @@ def remove_lifter_additional_age_class(lifter_id):
         return jsonify({"error": "Age class not found"}), 404
 
     if age_class in lifter.additional_age_classes:
+        before = lifter.to_dict()
         lifter.additional_age_classes.remove(age_class)
+        delta = record_change('lifter', lifter, before, event='class_changed')
         db.session.commit()
-        socketio.emit('lifter_updated', lifter.to_dict())
+        leaderboard.apply_lifter_delta(delta)
+        broadcast('lifter_updated', delta)
         return jsonify(lifter.to_dict()), 200
     return jsonify({"message": "Age class not found on lifter"}), 404
 
 # Class Management
 @app.route('/weight_classes', methods=['GET', 'POST'])
+@cached_get('weight_class')
 def manage_weight_classes():
     if request.method == 'POST':
         data = request.get_json()
@@ -492,12 +3403,15 @@ def manage_weight_classes():
             gender=data['gender']
         )
         db.session.add(new_wc)
+        db.session.flush()
+        delta = record_change('weight_class', new_wc)
+        lifter_deltas = reassign_all_lifters()
         db.session.commit()
-        all_lifters = Lifter.query.all()
-        for lifter in all_lifters:
-            assign_primary_classes(lifter)
-        socketio.emit('weight_class_updated', new_wc.to_dict())
-        socketio.emit('lifter_updated', None)
+        class_index.invalidate()
+        refresh_cached_lifters(lifter_deltas)
+        broadcast('weight_class_updated', {**new_wc.to_dict(), 'revision': delta['revision']})
+        for lifter_delta in lifter_deltas:
+            broadcast('lifter_updated', lifter_delta)
         return jsonify(new_wc.to_dict()), 201
     elif request.method == 'GET':
         wcs = WeightClass.query.all()
@@ -508,16 +3422,24 @@ def delete_weight_class(wc_id):
     wc = WeightClass.query.get(wc_id)
     if not wc:
         return jsonify({"error": "Weight class not found"}), 404
+    if class_used_by_archived_meets(Lifter.primary_weight_class_id,
+                                    lifter_additional_weight_class.c.weight_class_id, wc_id):
+        return jsonify({"error": "Weight class is used by lifters of an archived meet"}), 409
+    # Move lifters off the class before deleting it so the foreign keys stay valid
+    lifter_deltas = reassign_all_lifters(ClassTables.load(exclude=(wc,)))
     db.session.delete(wc)
+    revision = record_deletion('weight_class', wc_id)
     db.session.commit()
-    all_lifters = Lifter.query.all()
-    for lifter in all_lifters:
-        assign_primary_classes(lifter)
-    socketio.emit('weight_class_updated', None)
-    socketio.emit('lifter_updated', None)
+    class_index.invalidate()
+    refresh_cached_lifters(lifter_deltas)
+    leaderboard.invalidate() # Deleted class may still be listed as an additional class
+    broadcast('weight_class_updated', {'id': wc_id, 'deleted': True, 'revision': revision})
+    for lifter_delta in lifter_deltas:
+        broadcast('lifter_updated', lifter_delta)
     return jsonify({"message": "Weight class deleted"}), 200
 
 @app.route('/age_classes', methods=['GET', 'POST'])
+@cached_get('age_class')
 def manage_age_classes():
     if request.method == 'POST':
         data = request.get_json()
@@ -527,12 +3449,15 @@ def manage_age_classes():
             max_age=data.get('max_age')
         )
         db.session.add(new_ac)
+        db.session.flush()
+        delta = record_change('age_class', new_ac)
+        lifter_deltas = reassign_all_lifters()
         db.session.commit()
-        all_lifters = Lifter.query.all()
-        for lifter in all_lifters:
-            assign_primary_classes(lifter)
-        socketio.emit('age_class_updated', new_ac.to_dict())
-        socketio.emit('lifter_updated', None)
+        class_index.invalidate()
+        refresh_cached_lifters(lifter_deltas)
+        broadcast('age_class_updated', {**new_ac.to_dict(), 'revision': delta['revision']})
+        for lifter_delta in lifter_deltas:
+            broadcast('lifter_updated', lifter_delta)
         return jsonify(new_ac.to_dict()), 201
     elif request.method == 'GET':
         acs = AgeClass.query.all()
@@ -543,72 +3468,579 @@ def delete_age_class(ac_id):
     ac = AgeClass.query.get(ac_id)
     if not ac:
         return jsonify({"error": "Age class not found"}), 404
+    if class_used_by_archived_meets(Lifter.primary_age_class_id, lifter_additional_age_class.c.age_class_id, ac_id):
+        return jsonify({"error": "Age class is used by lifters of an archived meet"}), 409
+    lifter_deltas = reassign_all_lifters(ClassTables.load(exclude=(ac,)))
     db.session.delete(ac)
+    revision = record_deletion('age_class', ac_id)
     db.session.commit()
-    all_lifters = Lifter.query.all()
-    for lifter in all_lifters:
-        assign_primary_classes(lifter)
-    socketio.emit('age_class_updated', None)
-    socketio.emit('lifter_updated', None)
+    class_index.invalidate()
+    refresh_cached_lifters(lifter_deltas)
+    leaderboard.invalidate() # Deleted class may still be listed as an additional class
+    broadcast('age_class_updated', {'id': ac_id, 'deleted': True, 'revision': revision})
+    for lifter_delta in lifter_deltas:
+        broadcast('lifter_updated', lifter_delta)
     return jsonify({"message": "Age class deleted"}), 200
 
 # Lift scoring
 @app.route('/lifts', methods=['GET'])
+@cached_get('lift', 'lifter', 'weight_class')
 def get_all_lifts():
-    lifts = Lift.query.all()
+    try:
+        meet_id = request_meet_id()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    lifts = lift_query().filter(Lift.meet_id == meet_id).all()
     return jsonify([lift.to_dict() for lift in lifts])
 
+# Judge Scoring
+# Judges score with POST /lifts/<id>/score (one decision), POST /scores (a batch of
+# decisions the tablet queued while offline) or the Socket.IO 'score' event (same
+# payload as /scores, answered with an acknowledgement). A decision may carry a
+# client-generated decision_id: a retried one is answered with its first outcome
+# instead of being applied again. An optional sequence (increasing per tablet) orders
+# one judge's decisions on a lift, so an older decision that arrives late does not
+# undo a newer change of mind. A batch is applied in one transaction.
+SCORE_BATCH_LIMIT = 100
+DECISION_ID_MAX_LENGTH = 64
+# Outcome of a decision that was not applied -> HTTP status of POST /lifts/<id>/score
+DECISION_REJECTIONS = {'not_found': 404, 'decided': 409}
+
+def parse_decision(item, require_id=True):
+    """Validates one submitted decision; raises ValueError."""
+    if not isinstance(item, dict):
+        raise ValueError("Decision must be an object")
+    decision_id = item.get('decision_id')
+    if decision_id is not None or require_id:
+        if not isinstance(decision_id, str) or not 0 < len(decision_id.strip()) <= DECISION_ID_MAX_LENGTH:
+            raise ValueError(f"decision_id must be a string of 1-{DECISION_ID_MAX_LENGTH} characters")
+        decision_id = decision_id.strip()
+    lift_id = item.get('lift_id')
+    if isinstance(lift_id, bool) or not isinstance(lift_id, int):
+        raise ValueError("lift_id must be an integer")
+    if not isinstance(item.get('score'), bool):
+        raise ValueError("Score must be true (good lift) or false (no lift)")
+    sequence = item.get('sequence')
+    if sequence is not None and (isinstance(sequence, bool) or not isinstance(sequence, int) or sequence < 0):
+        raise ValueError("sequence must be a non-negative integer")
+    return {'decision_id': decision_id, 'lift_id': lift_id, 'score': item['score'], 'sequence': sequence}
+
+def judge_for_pin(judge_pin):
+    """(judge name, lift column) of a judge PIN. Raises PermissionError for an unknown
+    PIN and ValueError for a judge without a score column."""
+    if judge_pin not in JUDGE_PINS:
+        raise PermissionError("Invalid Judge PIN")
+    judge = JUDGE_PINS[judge_pin]
+    if judge not in JUDGE_SCORE_COLUMNS:
+        raise ValueError("Judge not recognized")
+    return judge, JUDGE_SCORE_COLUMNS[judge]
+
+def submit_decisions(judge, judge_column, decisions):
+    """Applies one judge's parsed decisions in a single transaction and returns one
+    result per decision, in order: {'decision_id', 'lift_id', 'status'} plus 'lift'
+    (applied: the lift after the decision), 'error' (not_found, decided) or
+    'duplicate': True (answered from an earlier submission). Broadcasts and cache
+    updates follow the commit."""
+    for retry in (True, False):
+        try:
+            results, applied, improved = _apply_decisions(judge, judge_column, decisions)
+            db.session.commit()
+            break
+        except IntegrityError:
+            # A retry of one of these decisions was stored concurrently; run the batch
+            # again, which now answers it as a duplicate
+            db.session.rollback()
+            if not retry:
+                raise
+    records_index.update(improved)
+    reload = []
+    for result, delta, row, scopes in applied:
+        result['lift'] = after_judge_score(delta, row, scopes)
+        if result['lift'] is None:
+            reload.append(result)
+    if reload: # Not the active lift of a platform
+        lifts = {lift.id: lift.to_dict() for lift in
+                 lift_query().filter(Lift.id.in_({result['lift_id'] for result in reload}))}
+        for result in reload:
+            result['lift'] = lifts.get(result['lift_id'])
+    return results
+
+def _apply_decisions(judge, judge_column, decisions):
+    ids = [decision['decision_id'] for decision in decisions if decision['decision_id']]
+    stored = {}
+    if ids:
+        stored = {row.decision_id: row.to_result() for row in
+                  JudgeDecision.query.filter(JudgeDecision.decision_id.in_(ids))}
+    sequenced = {decision['lift_id'] for decision in decisions if decision['sequence'] is not None}
+    latest = {}
+    if sequenced:
+        latest = dict(db.session.query(JudgeDecision.lift_id, db.func.max(JudgeDecision.sequence))
+                      .filter(JudgeDecision.judge == judge, JudgeDecision.lift_id.in_(sequenced),
+                              JudgeDecision.status == 'applied')
+                      .group_by(JudgeDecision.lift_id))
+
+    results, applied, improved = [], [], {}
+    for decision in decisions:
+        decision_id, lift_id, sequence = decision['decision_id'], decision['lift_id'], decision['sequence']
+        if decision_id in stored:
+            results.append({**stored[decision_id], 'duplicate': True})
+            continue
+        result = {'decision_id': decision_id, 'lift_id': lift_id}
+        revision = None
+        if sequence is not None and latest.get(lift_id) is not None and sequence <= latest[lift_id]:
+            result['status'] = 'superseded' # The judge has already sent a newer decision
+        else:
+            delta, row = apply_judge_score(lift_id, judge_column, decision['score'])
+            if delta is None:
+                if db.session.get(Lift, lift_id) is None:
+                    result.update(status='not_found', error="Lift not found")
+                else:
+                    result.update(status='decided', error="Lift has already been decided")
+            else:
+                result['status'] = 'applied'
+                revision = delta['revision']
+                scopes = []
+                if row.overall_result and 'decided_at' in delta: # A good lift: write the records it beats
+                    lift_improved, scopes = update_records(lift_query().filter(Lift.id == lift_id).one(),
+                                                           row.weight_lifted)
+                    improved.update(lift_improved)
+                applied.append((result, delta, row, scopes))
+                if sequence is not None:
+                    latest[lift_id] = sequence
+        if decision_id:
+            db.session.add(JudgeDecision(decision_id=decision_id, lift_id=lift_id, judge=judge,
+                                         score=decision['score'], sequence=sequence, status=result['status'],
+                                         error=result.get('error'), revision=revision))
+            db.session.flush() # A concurrent duplicate fails here, before anything else runs
+            stored[decision_id] = dict(result)
+        results.append(result)
+    return results, applied, improved
+
+def after_judge_score(delta, result, scopes):
+    """Caches and broadcasts after a committed judge score (`result` is the RETURNING
+    row of apply_judge_score); with auto_advance on, a deciding vote calls the next lift.
+    Returns the lift's dict if it is a platform's active lift (answered from the meet
+    state cache), else None."""
+    lift_id = delta['id']
+    if delta.get('status', 'pending') != 'pending':
+        lifting_queue.discard(lift_id, result.platform)
+    standing = None
+    if result.overall_result:
+        standing = leaderboard.record_good_lift(result.lifter_id, result.lift_type, result.weight_lifted)
+    broadcast('lift_updated', delta, result.platform)
+    if scopes:
+        broadcast('record_set', {'lift_id': lift_id, 'lifter_id': result.lifter_id, 'lift_type': result.lift_type,
+                                 'weight': result.weight_lifted, 'scopes': scopes}, result.platform)
+    if standing:
+        emit_to_rooms('leaderboard_updated', standing, leaderboard_rooms(standing))
+    lift_dict = meet_state_cache.apply_lift_delta(delta)
+
+    if 'decided_at' in delta: # This vote decided the lift; only one request gets here
+        meet_state = load_meet_state(result.platform)
+        if meet_state and meet_state.auto_advance and meet_state.current_active_lift_id == lift_id:
+            advance_platform(meet_state)
+    return lift_dict
+
+def score_batch(data):
+    """Handles a batch submission ({"judge_pin", "batch_id", "decisions": [...]}) for
+    POST /scores and the 'score' Socket.IO event. Returns (body, HTTP status)."""
+    if not isinstance(data, dict):
+        return {"error": "Expected a JSON object"}, 400
+    try:
+        judge, judge_column = judge_for_pin(data.get('judge_pin'))
+    except PermissionError as e:
+        return {"error": str(e)}, 403
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    items = data.get('decisions')
+    if not isinstance(items, list) or not 0 < len(items) <= SCORE_BATCH_LIMIT:
+        return {"error": f"decisions must be a list of 1-{SCORE_BATCH_LIMIT} decisions"}, 400
+
+    results = [None] * len(items)
+    valid = []
+    for i, item in enumerate(items):
+        try:
+            valid.append((i, parse_decision(item)))
+        except ValueError as e: # Reported without blocking the rest of the tablet's queue
+            decision_id = item.get('decision_id') if isinstance(item, dict) else None
+            results[i] = {'decision_id': decision_id, 'status': 'invalid', 'error': str(e)}
+    if valid:
+        for (i, _), result in zip(valid, submit_decisions(judge, judge_column, [d for _, d in valid])):
+            results[i] = result
+    return {'batch_id': data.get('batch_id'), 'results': results}, 200
+
+@app.route('/scores', methods=['POST'])
+def submit_scores():
+    body, status = score_batch(request.get_json(silent=True))
+    return jsonify(body), status
+
 @app.route('/lifts/<int:lift_id>/score', methods=['POST'])
 def score_lift(lift_id):
-    lift = Lift.query.get(lift_id)
-    if not lift:
-        return jsonify({"error": "Lift not found"}), 404
+    data = request.get_json()
+    try:
+        judge, judge_column = judge_for_pin(data.get('judge_pin'))
+        decision = parse_decision({**data, 'lift_id': lift_id}, require_id=False)
+    except PermissionError as e:
+        return jsonify({"error": str(e)}), 403
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result = submit_decisions(judge, judge_column, [decision])[0]
+    if result['status'] in DECISION_REJECTIONS:
+        return jsonify({"error": result['error']}), DECISION_REJECTIONS[result['status']]
+
+    if result.get('lift') is None: # A retried or superseded decision
+        return jsonify(lift_query().filter(Lift.id == lift_id).one().to_dict())
+    return jsonify(result['lift'])
 
+# Attempt Declarations
+# Attempt 1 is declared at registration; attempts 2 and 3 start as placeholders
+# (opener +5/+10 kg) until the lifter declares them. A declaration must follow the
+# previous attempt's decision within ATTEMPT_DECLARATION_SECONDS, may not go below
+# that attempt (and must beat it by ATTEMPT_WEIGHT_STEP after a good lift), and can
+# then be changed ATTEMPT_CHANGE_LIMIT times until the attempt is called.
+@app.route('/lifts/<int:lift_id>/declare', methods=['POST'])
+def declare_attempt(lift_id):
     data = request.get_json()
-    judge_pin = data.get('judge_pin')
-    score = data.get('score')
+    try:
+        weight = float(data.get('weight'))
+    except (TypeError, ValueError):
+        return jsonify({"error": "weight must be a number"}), 400
+    steps = weight / ATTEMPT_WEIGHT_STEP
+    if weight <= 0 or abs(steps - round(steps)) > 1e-9:
+        return jsonify({"error": f"weight must be a positive multiple of {ATTEMPT_WEIGHT_STEP:g} kg"}), 400
 
-    if judge_pin not in JUDGE_PINS:
-        return jsonify({"error": "Invalid Judge PIN"}), 403
+    lift = lift_query().filter(Lift.id == lift_id, Lift.meet_id == current_meet_id()).with_for_update(of=Lift).first()
+    if not lift:
+        return jsonify({"error": "Lift not found"}), 404 # Or it belongs to an earlier meet
+    if lift.status != 'pending':
+        return jsonify({"error": "Attempt has already been called"}), 409
 
-    judge_name = JUDGE_PINS[judge_pin]
+    now = datetime.utcnow()
+    kind = 'change' if lift.declared_at else 'declaration'
+    if lift.attempt_number > 1:
+        previous = Lift.query.filter_by(lifter_id=lift.lifter_id, lift_type=lift.lift_type,
+                                        attempt_number=lift.attempt_number - 1).first()
+        if previous is not None:
+            if previous.overall_result is None:
+                return jsonify({"error": f"Attempt {previous.attempt_number} has not been decided yet"}), 409
+            minimum = previous.weight_lifted + (ATTEMPT_WEIGHT_STEP if previous.overall_result else 0)
+            if weight < minimum:
+                return jsonify({"error": f"Attempt {lift.attempt_number} must be at least {minimum:g} kg"}), 400
+            deadline = app.config['ATTEMPT_DECLARATION_SECONDS']
+            if (kind == 'declaration' and deadline > 0 and previous.decided_at
+                    and (now - previous.decided_at).total_seconds() > deadline):
+                return jsonify({"error": f"Declaration deadline passed ({deadline:g}s after attempt "
+                                         f"{previous.attempt_number} was decided)"}), 409
+    if kind == 'change':
+        if weight == lift.weight_lifted:
+            return jsonify({"error": "Weight is unchanged"}), 400
+        if lift.weight_changes >= ATTEMPT_CHANGE_LIMIT:
+            return jsonify({"error": f"No weight changes left for this attempt (limit {ATTEMPT_CHANGE_LIMIT})"}), 409
 
-    if judge_name == "Judge 1":
-        lift.judge1_score = score
-    elif judge_name == "Judge 2":
-        lift.judge2_score = score
-    elif judge_name == "Judge 3":
-        lift.judge3_score = score
+    before = lift.to_dict()
+    declaration = AttemptDeclaration(lift_id=lift.id, kind=kind, weight=weight,
+                                     previous_weight=lift.weight_lifted, created_at=now)
+    lift.weight_lifted = weight
+    if kind == 'declaration':
+        lift.declared_at = now
     else:
-        return jsonify({"error": "Judge not recognized"}), 400
-
+        lift.weight_changes += 1
+    db.session.add(declaration)
+    delta = record_change('lift', lift, before, event='attempt_declared' if kind == 'declaration' else 'attempt_changed')
     db.session.commit()
-    update_overall_result(lift)
-    socketio.emit('lift_updated', lift.to_dict())
-    return jsonify(lift.to_dict())
+
+    # Only this lift moves in the lifting order; displays get its new place
+    lifting_queue.sync(lift)
+    platform = lift.lifter.platform
+    position = lifting_queue.position(platform, lift.id)
+    broadcast('queue_updated', {
+        'id': lift.id,
+        'lifter_id': lift.lifter_id,
+        'flight': lift.lifter.flight,
+        'lift_type': lift.lift_type,
+        'attempt_number': lift.attempt_number,
+        'weight_lifted': lift.weight_lifted,
+        'position': position,
+        'version': lift.version,
+        'revision': delta['revision'],
+    }, platform)
+    publish_loading(platform)
+    return jsonify({**lift.to_dict(), 'position': position, 'declaration': declaration.to_dict()}), 200
+
+@app.route('/lifts/<int:lift_id>/declarations', methods=['GET'])
+def get_attempt_declarations(lift_id):
+    if not db.session.query(Lift.id).filter(Lift.id == lift_id, Lift.meet_id == current_meet_id()).first():
+        return jsonify({"error": "Lift not found"}), 404
+    declarations = AttemptDeclaration.query.filter_by(lift_id=lift_id).order_by(AttemptDeclaration.id).all()
+    return jsonify([declaration.to_dict() for declaration in declarations])
+
+# Display Snapshot
+# The whole meet in a normalized, columnar form: every lifter once, lifts as
+# parallel arrays, enum strings as small integers (see the 'legend') and the
+# three judge decisions plus the overall result packed into one integer per
+# lift. Served as JSON, MessagePack or streamed NDJSON, gzip/brotli-compressed
+# when the client accepts it.
+SNAPSHOT_ENTITIES = ('meet', 'lift', 'lifter', 'meet_state', 'weight_class', 'age_class')
+SNAPSHOT_FORMATS = {'json': 'application/json', 'msgpack': 'application/msgpack', 'ndjson': 'application/x-ndjson'}
+SNAPSHOT_LEGEND = {
+    'gender': ['Male', 'Female'],
+    'lift_type': ['squat', 'bench', 'deadlift'],
+    'status': ['pending', 'active', 'completed'],
+    'decisions': "2 bits each (0 = none, 1 = good lift, 2 = no lift): judge 1 in bits 0-1, "
+                 "judge 2 in bits 2-3, judge 3 in bits 4-5, overall result in bits 6-7",
+}
+SNAPSHOT_CODES = {field: {value: code for code, value in enumerate(values)}
+                  for field, values in SNAPSHOT_LEGEND.items() if isinstance(values, list)}
+SNAPSHOT_LIFTER_COLUMNS = ('id', 'name', 'lifter_id_number', 'gender', 'actual_weight', 'age',
+                           'platform', 'flight', 'primary_weight_class_id', 'primary_age_class_id')
+SNAPSHOT_LIFT_COLUMNS = ('id', 'lifter_id', 'lift_type', 'attempt_number', 'weight_lifted',
+                         'status', 'decisions', 'version')
+
+def pack_decisions(*decisions):
+    bits = 0
+    for i, decision in enumerate(decisions):
+        if decision is not None:
+            bits |= (1 if decision else 2) << (2 * i)
+    return bits
+
+def snapshot_lifter_rows(meet_id):
+    rows = db.session.execute(
+        select(Lifter.id, Lifter.name, Lifter.lifter_id_number, Lifter.gender, Lifter.actual_weight,
+               Lifter.birth_date, Lifter.platform, Lifter.flight,
+               Lifter.primary_weight_class_id, Lifter.primary_age_class_id)
+        .where(Lifter.meet_id == meet_id)
+        .order_by(Lifter.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    genders = SNAPSHOT_CODES['gender']
+    for lifter_id, name, id_number, gender, actual_weight, birth_date, platform, flight, wc_id, ac_id in rows:
+        yield (lifter_id, name, id_number, genders.get(gender), actual_weight, calculate_age(birth_date),
+               platform, flight, wc_id, ac_id)
+
+def snapshot_lift_rows(meet_id):
+    rows = db.session.execute(
+        select(Lift.id, Lift.lifter_id, Lift.lift_type, Lift.attempt_number, Lift.weight_lifted, Lift.status,
+               Lift.judge1_score, Lift.judge2_score, Lift.judge3_score, Lift.overall_result, Lift.version)
+        .where(Lift.meet_id == meet_id)
+        .order_by(Lift.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    lift_types, statuses = SNAPSHOT_CODES['lift_type'], SNAPSHOT_CODES['status']
+    for lift_id, lifter_id, lift_type, attempt, weight, status, j1, j2, j3, overall, version in rows:
+        yield (lift_id, lifter_id, lift_types.get(lift_type), attempt, weight, statuses.get(status),
+               pack_decisions(j1, j2, j3, overall), version)
+
+def columnar(names, rows):
+    """Turns row tuples into {column name: [values]}."""
+    columns = tuple([] for _ in names)
+    for row in rows:
+        for values, value in zip(columns, row):
+            values.append(value)
+    return dict(zip(names, columns))
+
+def snapshot_header(revision, meet_id):
+    def classes(model):
+        return columnar(('id', 'name'), db.session.query(model.id, model.name).order_by(model.id))
+    return {
+        'revision': revision,
+        'legend': SNAPSHOT_LEGEND,
+        'meet': current_meet.get(),
+        'meet_states': [state.to_dict() for state in
+                        MeetState.query.filter_by(meet_id=meet_id).order_by(MeetState.platform)],
+        'weight_classes': classes(WeightClass),
+        'age_classes': classes(AgeClass),
+    }
+
+def stream_snapshot_ndjson(revision, meet_id):
+    # Header line, then one line per EXPORT_BATCH_SIZE lifters/lifts:
+    # {"table": "lifters", "columns": {...}}
+    yield json.dumps(snapshot_header(revision, meet_id), separators=(',', ':')) + '\n'
+    for table, names, rows in (('lifters', SNAPSHOT_LIFTER_COLUMNS, snapshot_lifter_rows(meet_id)),
+                               ('lifts', SNAPSHOT_LIFT_COLUMNS, snapshot_lift_rows(meet_id))):
+        while True:
+            chunk = list(islice(rows, EXPORT_BATCH_SIZE))
+            if not chunk:
+                break
+            yield json.dumps({'table': table, 'columns': columnar(names, chunk)}, separators=(',', ':')) + '\n'
+
+def compress_stream(chunks, encoding):
+    if encoding == 'br':
+        compressor = brotli.Compressor()
+        process, finish = compressor.process, compressor.finish
+    else: # gzip
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) # wbits 31 = gzip container
+        process, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = process(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield finish()
+
+@app.route('/snapshot', methods=['GET'])
+def get_snapshot():
+    # Format from ?format=json|msgpack|ndjson, else from the Accept header.
+    fmt = request.args.get('format')
+    if fmt is None:
+        mimetype = request.accept_mimetypes.best_match(list(SNAPSHOT_FORMATS.values()), default='application/json')
+        fmt = next(name for name, value in SNAPSHOT_FORMATS.items() if value == mimetype)
+    if fmt not in SNAPSHOT_FORMATS:
+        return jsonify({"error": f"format must be one of {', '.join(SNAPSHOT_FORMATS)}"}), 400
+    if fmt == 'msgpack' and msgpack is None:
+        return jsonify({"error": "MessagePack support is not installed on the server (pip install msgpack)"}), 406
+    encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+    encoding = request.accept_encodings.best_match(encodings)
+
+    revisions = table_revisions.get(SNAPSHOT_ENTITIES)
+    revision = max(revision for revision, _ in revisions)
+    etag = f"{fmt}-{encoding or 'identity'}-" + revisions_etag(revisions)
+    if etag in request.if_none_match:
+        response = tagged_response(b'', etag)
+    elif fmt == 'ndjson':
+        body = stream_snapshot_ndjson(revision, current_meet_id())
+        if encoding:
+            body = compress_stream(body, encoding)
+        response = Response(stream_with_context(body), mimetype=SNAPSHOT_FORMATS[fmt])
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+    else:
+        key = f'/snapshot:{fmt}:{encoding}'
+        body = response_cache.get(key, revisions)
+        if body is None:
+            meet_id = current_meet_id()
+            snapshot = {
+                **snapshot_header(revision, meet_id),
+                'lifters': columnar(SNAPSHOT_LIFTER_COLUMNS, snapshot_lifter_rows(meet_id)),
+                'lifts': columnar(SNAPSHOT_LIFT_COLUMNS, snapshot_lift_rows(meet_id)),
+            }
+            if fmt == 'msgpack':
+                body = msgpack.packb(snapshot)
+            else:
+                body = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+            if encoding == 'br':
+                body = brotli.compress(body, quality=5)
+            elif encoding == 'gzip':
+                body = gzip.compress(body, compresslevel=6)
+            response_cache.put(key, revisions, body)
+        response = tagged_response(body, etag, SNAPSHOT_FORMATS[fmt])
+    if encoding and response.status_code == 200:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    return response
 
 # Data Export
-@app.route('/export_meet_data', methods=['GET'])
-def export_meet_data():
-    try:
-        lifters = Lifter.query.all()
-        lifts = Lift.query.all()
+# Exports are streamed row by row from a single join query. yield_per makes
+# SQLAlchemy fetch in batches (a server-side cursor on PostgreSQL), so memory
+# stays flat no matter how big the meet is.
+EXPORT_BATCH_SIZE = 500
+
+class _Echo:
+    """File-like object that hands back what csv.writer writes to it."""
+    def write(self, value):
+        return value
+
+def export_lifter_rows(meet_id):
+    weight_class = aliased(WeightClass)
+    age_class = aliased(AgeClass)
+    meet = db.session.get(Meet, meet_id)
+    day = (meet.meet_date if meet else None) or meet_date() # Ages as of that meet
+    rows = db.session.execute(
+        select(Lifter.lifter_id_number, Lifter.name, Lifter.gender, Lifter.actual_weight,
+               Lifter.birth_date, Lifter.platform, Lifter.flight, weight_class.name, age_class.name)
+        .outerjoin(weight_class, Lifter.primary_weight_class_id == weight_class.id)
+        .outerjoin(age_class, Lifter.primary_age_class_id == age_class.id)
+        .where(Lifter.meet_id == meet_id)
+        .order_by(Lifter.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    for id_number, name, gender, actual_weight, birth_date, platform, flight, wc_name, ac_name in rows:
+        yield {
+            'lifter_id_number': id_number,
+            'name': name,
+            'gender': gender,
+            'actual_weight': actual_weight,
+            'age': calculate_age(birth_date, day),
+            'platform': platform,
+            'flight': flight,
+            'primary_weight_class_name': wc_name,
+            'primary_age_class_name': ac_name,
+        }
+
+def export_lift_rows(meet_id):
+    rows = db.session.execute(
+        select(Lift.id, Lifter.lifter_id_number, Lifter.name, Lift.lift_type, Lift.attempt_number,
+               Lift.weight_lifted, Lift.judge1_score, Lift.judge2_score, Lift.judge3_score,
+               Lift.overall_result)
+        .join(Lifter, Lift.lifter_id == Lifter.id)
+        .where(Lift.meet_id == meet_id)
+        .order_by(Lift.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    for row in rows:
+        yield {
+            'id': row[0],
+            'lifter_id_number': row[1],
+            'lifter_name': row[2],
+            'lift_type': row[3],
+            'attempt_number': row[4],
+            'weight_lifted': row[5],
+            'judge1_score': row[6],
+            'judge2_score': row[7],
+            'judge3_score': row[8],
+            'overall_result': row[9],
+        }
 
-        lifters_csv = "Lifter ID,Name,Gender,Actual Weight,Age,Primary Weight Class,Primary Age Class\n"
-        for lifter in lifters:
-            lifters_csv += f"{lifter.lifter_id_number},{lifter.name},{lifter.gender},{lifter.actual_weight},{calculate_age(lifter.birth_date)},{lifter.primary_weight_class.name if lifter.primary_weight_class else 'N/A'},{lifter.primary_age_class.name if lifter.primary_age_class else 'N/A'}\n"
+# dataset -> (row generator, [(CSV header, row key)])
+EXPORT_DATASETS = {
+    'lifters': (export_lifter_rows, [
+        ('Lifter ID', 'lifter_id_number'), ('Name', 'name'), ('Gender', 'gender'),
+        ('Actual Weight', 'actual_weight'), ('Age', 'age'), ('Platform', 'platform'), ('Flight', 'flight'),
+        ('Primary Weight Class', 'primary_weight_class_name'), ('Primary Age Class', 'primary_age_class_name'),
+    ]),
+    'lifts': (export_lift_rows, [
+        ('Lift ID', 'id'), ('Lifter ID', 'lifter_id_number'), ('Lifter Name', 'lifter_name'),
+        ('Lift Type', 'lift_type'), ('Attempt', 'attempt_number'), ('Weight', 'weight_lifted'),
+        ('Judge1', 'judge1_score'), ('Judge2', 'judge2_score'), ('Judge3', 'judge3_score'),
+        ('Overall Result', 'overall_result'),
+    ]),
+}
+
+def stream_csv(rows, columns):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    for row in rows:
+        yield writer.writerow(['' if row[key] is None else row[key] for _, key in columns])
 
-        lifts_csv = "Lift ID,Lifter Name,Lift Type,Attempt,Weight,Judge1,Judge2,Judge3,Overall Result\n"
-        for lift in lifts:
-            lifts_csv += f"{lift.id},{lift.lifter.name},{lift.lift_type},{lift.attempt_number},{lift.weight_lifted},{lift.judge1_score},{lift.judge2_score},{lift.judge3_score},{lift.overall_result}\n"
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row) + '\n'
 
-        print("\n--- LIFTERS EXPORT ---\n", lifters_csv)
-        print("\n--- LIFTS EXPORT ---\n", lifts_csv)
+@app.route('/export/<dataset>.<fmt>', methods=['GET'])
+def export_dataset(dataset, fmt):
+    if dataset not in EXPORT_DATASETS:
+        return jsonify({"error": f"Unknown export '{dataset}'"}), 404
+    row_generator, columns = EXPORT_DATASETS[dataset]
+    try:
+        meet_id = request_meet_id() # ?meet_id= exports an archived meet
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if fmt == 'csv':
+        body, mimetype = stream_csv(row_generator(meet_id), columns), 'text/csv'
+    elif fmt == 'ndjson':
+        body, mimetype = stream_ndjson(row_generator(meet_id)), 'application/x-ndjson'
+    else:
+        return jsonify({"error": "Format must be csv or ndjson"}), 400
+    return Response(stream_with_context(body), mimetype=mimetype, headers={
+        'Content-Disposition': f'attachment; filename="{dataset}.{fmt}"'
+    })
 
-        return jsonify({"message": "Data export simulated successfully. Check backend logs."}), 200
-    except Exception as e:
-        print(f"Error during export: {e}")
-        return jsonify({"error": "Failed to export data", "details": str(e)}), 500
+@app.route('/export_meet_data', methods=['GET'])
+def export_meet_data():
+    # Lists the streaming export endpoints
+    return jsonify({
+        dataset: {fmt: url_for('export_dataset', dataset=dataset, fmt=fmt) for fmt in ('csv', 'ndjson')}
+        for dataset in EXPORT_DATASETS
+    }), 200
 
 # Judge Login Route
 @app.route('/login_judge', methods=['POST'])
@@ -623,23 +4055,230 @@ def login_judge():
 # Socket.IO Event Handlers
 @socketio.on('connect')
 def test_connect():
-    print('Client connected')
-    emit('after connect', {'data': 'Lets go!'})
+    metrics.inc('meet_socketio_connects_total')
+    app.logger.debug("Socket.IO client %s connected", request.sid)
+    try:
+        subscription = parse_subscription(request.args)
+    except ValueError as e:
+        raise ConnectionRefusedError(str(e))
+    apply_subscription(subscription)
+    emit('after connect', {'data': 'Lets go!', **subscription})
+
+@socketio.on('subscribe')
+def handle_subscribe(data):
+    # Changes what this client receives, e.g. {"role": "display", "platform": 2}
+    try:
+        subscription = parse_subscription(data or {}, client_subscriptions.get(request.sid))
+    except ValueError as e:
+        emit('subscription_error', {'error': str(e)})
+        return
+    apply_subscription(subscription)
+    emit('subscribed', subscription)
+
+@socketio.on('join_platform')
+def handle_join_platform(data):
+    # Shorthand for subscribe({"platform": n}), keeping the client's roles
+    handle_subscribe({'platform': (data or {}).get('platform')})
+
+@socketio.on('score')
+def handle_score(data):
+    # Same payload as POST /scores; the returned body is the client's acknowledgement.
+    # Socket.IO events bypass before_request, so the worker is warmed up here.
+    ensure_warmed_up()
+    body, status = score_batch(data)
+    return body if status == 200 else {**body, 'status': status}
 
 @socketio.on('disconnect')
 def test_disconnect():
-    print('Client disconnected')
+    client_subscriptions.pop(request.sid, None)
+    metrics.inc('meet_socketio_disconnects_total')
+    app.logger.debug("Socket.IO client %s disconnected", request.sid)
+
+# --- Schema Migrations ---
+# db.create_all() only creates missing tables. Everything else an existing database
+# needs (new columns, new indexes) is a numbered migration below; applied versions
+# are recorded in schema_migration. Migrations check what is already there, so on
+# a database that create_all() just made they only record themselves.
+class SchemaMigration(db.Model):
+    version = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(200), nullable=False)
+    applied_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+MIGRATIONS = [] # (version, name, function(connection)), in version order
+MIGRATION_LOCK_ID = 72_011_019 # PostgreSQL advisory lock held while migrating
+
+def migration(version, name):
+    def decorator(function):
+        MIGRATIONS.append((version, name, function))
+        return function
+    return decorator
+
+def add_missing_columns(connection, model, *names):
+    """ALTER TABLE ... ADD COLUMN for the model columns the table does not have yet.
+    Columns with a scalar default get it as server default (filling existing rows).
+    Returns the names of the added columns."""
+    table = model.__table__
+    existing = {column['name'] for column in inspect(connection).get_columns(table.name)}
+    quote = connection.dialect.identifier_preparer.quote
+    added = []
+    for name in names:
+        if name in existing:
+            continue
+        column = table.c[name]
+        ddl = f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(name)} {column.type.compile(connection.dialect)}"
+        if column.default is not None and column.default.is_scalar:
+            value = literal(column.default.arg, column.type).compile(
+                dialect=connection.dialect, compile_kwargs={'literal_binds': True})
+            ddl += f" DEFAULT {value}"
+            if not column.nullable:
+                ddl += " NOT NULL"
+        connection.execute(text(ddl))
+        added.append(name)
+    return added
+
+def create_missing_indexes(connection, *models):
+    for model in models:
+        for index in model.__table__.indexes:
+            index.create(connection, checkfirst=True)
+
+def create_index(connection, name, table, *columns, unique=False):
+    """CREATE INDEX IF NOT EXISTS. Migrations spell their indexes out instead of
+    taking them from the models, whose indexes may use columns a later migration adds."""
+    quote = connection.dialect.identifier_preparer.quote
+    connection.execute(text(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {quote(name)} "
+                            f"ON {quote(table)} ({', '.join(quote(column) for column in columns)})"))
+
+@migration(1, "Columns added before migrations existed")
+def add_early_columns(connection):
+    if 'platform' in add_missing_columns(connection, MeetState, 'platform', 'current_flight', 'auto_advance', 'version'):
+        create_index(connection, 'uq_meet_state_platform', 'meet_state', 'platform', unique=True)
+    add_missing_columns(connection, Lifter, 'platform', 'flight', 'version')
+    add_missing_columns(connection, Lift, 'declared_at', 'weight_changes', 'decided_at', 'version')
+    add_missing_columns(connection, MeetChange, 'event')
+
+@migration(2, "Indexes for the lifting queue, attempt lookups, leaderboard and change log")
+def add_hot_path_indexes(connection):
+    create_index(connection, 'ix_lifter_platform_flight', 'lifter', 'platform', 'flight')
+    create_index(connection, 'ix_lift_round', 'lift', 'status', 'lift_type', 'attempt_number', 'weight_lifted',
+                 'lifter_id')
+    create_index(connection, 'ix_lift_lifter_attempt', 'lift', 'lifter_id', 'lift_type', 'attempt_number')
+    create_index(connection, 'ix_lift_result', 'lift', 'overall_result', 'lifter_id', 'lift_type', 'weight_lifted')
+    create_index(connection, 'ix_meet_change_entity_id', 'meet_change', 'entity', 'id')
+    create_index(connection, 'ix_meet_change_entity_entity_id', 'meet_change', 'entity', 'entity_id', 'id')
+
+def drop_single_column_unique(connection, model, column):
+    """Drops the unique constraints and unique indexes of `model` on `column` alone (PostgreSQL)."""
+    table = model.__table__
+    inspector = inspect(connection)
+    quote = connection.dialect.identifier_preparer.quote
+    for constraint in inspector.get_unique_constraints(table.name):
+        if constraint['column_names'] == [column]:
+            connection.execute(text(f"ALTER TABLE {quote(table.name)} DROP CONSTRAINT {quote(constraint['name'])}"))
+    for index in inspector.get_indexes(table.name):
+        if index['unique'] and index['column_names'] == [column] and not index.get('duplicates_constraint'):
+            connection.execute(text(f"DROP INDEX IF EXISTS {quote(index['name'])}"))
+
+def rebuild_sqlite_table(connection, model, drop_indexes=()):
+    """Recreates a SQLite table from its model (SQLite cannot drop constraints or make
+    a column NOT NULL in place): create a staging table, copy the rows, drop the old
+    table and rename. The old table's indexes, except `drop_indexes`, are recreated."""
+    table = model.__table__
+    inspector = inspect(connection)
+    existing = {column['name'] for column in inspector.get_columns(table.name)}
+    indexes = [index for index in inspector.get_indexes(table.name) if index['name'] not in drop_indexes]
+    staging = table.to_metadata(db.metadata, name=f'_{table.name}_new')
+    try:
+        connection.execute(CreateTable(staging))
+        columns = ', '.join(connection.dialect.identifier_preparer.quote(column.name) for column in table.columns
+                            if column.name in existing)
+        connection.execute(text(f'INSERT INTO "{staging.name}" ({columns}) SELECT {columns} FROM "{table.name}"'))
+        connection.execute(text(f'DROP TABLE "{table.name}"'))
+        connection.execute(text(f'ALTER TABLE "{staging.name}" RENAME TO "{table.name}"'))
+    finally:
+        db.metadata.remove(staging)
+    for index in indexes:
+        create_index(connection, index['name'], table.name, *index['column_names'], unique=bool(index['unique']))
+
+@migration(3, "Meets, per-meet lifters, lifts and meet states, records")
+def add_meets(connection):
+    # create_all() added the meet and lift_record tables; what is already in the
+    # database becomes the first meet
+    meet_table = Meet.__table__
+    meet_id = connection.execute(select(meet_table.c.id).order_by(meet_table.c.id).limit(1)).scalar()
+    if meet_id is None and (connection.execute(select(MeetState.__table__.c.id).limit(1)).first()
+                            or connection.execute(select(Lifter.__table__.c.id).limit(1)).first()):
+        meet_id = connection.execute(insert(meet_table).values(
+            name=app.config['MEET_NAME'], meet_date=app.config['MEET_DATE'], status='active',
+            created_at=datetime.utcnow())).inserted_primary_key[0]
+    quote = connection.dialect.identifier_preparer.quote
+    for model in (MeetState, Lifter, Lift):
+        table = model.__table__
+        if add_missing_columns(connection, model, 'meet_id') and meet_id is not None:
+            connection.execute(update(table).where(table.c.meet_id.is_(None)).values(meet_id=meet_id))
+        if connection.dialect.name == 'sqlite':
+            rebuild_sqlite_table(connection, model, drop_indexes=('uq_meet_state_platform', 'ix_lifter_platform_flight'))
+            continue
+        existing = {fk['name'] for fk in inspect(connection).get_foreign_keys(table.name)
+                    if fk['constrained_columns'] == ['meet_id']}
+        connection.execute(text(f"ALTER TABLE {quote(table.name)} ALTER COLUMN meet_id SET NOT NULL"))
+        if not existing:
+            connection.execute(text(f"ALTER TABLE {quote(table.name)} ADD CONSTRAINT "
+                                    f"{quote(f'{table.name}_meet_id_fkey')} FOREIGN KEY (meet_id) REFERENCES meet (id)"))
+    if connection.dialect.name != 'sqlite':
+        drop_single_column_unique(connection, MeetState, 'platform')
+        drop_single_column_unique(connection, Lifter, 'lifter_id_number')
+    connection.execute(text("DROP INDEX IF EXISTS ix_lifter_platform_flight")) # Now per meet
+    create_index(connection, 'uq_meet_state_meet_platform', 'meet_state', 'meet_id', 'platform', unique=True)
+    create_index(connection, 'uq_lifter_meet_id_number', 'lifter', 'meet_id', 'lifter_id_number', unique=True)
+    create_index(connection, 'ix_lifter_meet_platform_flight', 'lifter', 'meet_id', 'platform', 'flight')
+    create_index(connection, 'ix_lift_meet', 'lift', 'meet_id', 'overall_result')
+    rebuild_records(connection)
+
+@migration(4, "Judge decisions for idempotent scoring")
+def add_judge_decisions(connection):
+    JudgeDecision.__table__.create(connection, checkfirst=True)
+
+def run_migrations():
+    """Applies the migrations this database has not seen yet, each in its own
+    transaction. Returns the versions applied."""
+    applied = []
+    for version, name, function in MIGRATIONS:
+        with db.engine.begin() as connection:
+            if connection.dialect.name == 'postgresql':
+                # Workers starting together migrate one at a time
+                connection.execute(text("SELECT pg_advisory_xact_lock(:id)"), {'id': MIGRATION_LOCK_ID})
+            table = SchemaMigration.__table__
+            if connection.execute(select(table.c.version).where(table.c.version == version)).first():
+                continue
+            function(connection)
+            connection.execute(insert(table).values(version=version, name=name, applied_at=datetime.utcnow()))
+            app.logger.info("Applied schema migration %d: %s", version, name)
+            applied.append(version)
+    return applied
+
+# --- Startup ---
+# Importing this module does not touch the database. The schema is created, migrated
+# and seeded by `flask --app app init-db` (a one-shot release step), and each worker
+# warms up lazily: create_app() starts the warm-up in the background and the first
+# request waits for it only if it has not finished yet. Warming up checks the schema
+# version with one query, runs init-db itself if AUTO_INIT_DB is on and the schema is
+# missing or behind, then restores the caches from the latest snapshot.
+_warm_up_lock = threading.Lock()
+_warmed_up = False
 
 # Initial database setup function - This MUST retain app_context as it runs outside a request
 def create_tables():
     with app.app_context():
-        # db.drop_all() # Keep this commented out after manual DROP SCHEMA public CASCADE
-        db.create_all()
-        
+        db.create_all() # New tables only; columns and indexes of existing ones come from migrations
+        run_migrations()
+        seed_defaults()
+
+def seed_defaults():
+    """Adds the first meet, its meet state rows and the default weight/age classes if they are missing."""
+    with app.app_context():
         # Populate initial data only if tables were just created (or dropped and recreated)
-        if not MeetState.query.first():
-            db.session.add(MeetState(current_lift_type='squat', current_attempt_number=1))
-            db.session.commit()
+        ensure_current_meet()
+        ensure_meet_states()
         if not WeightClass.query.first():
             db.session.add_all([
                 WeightClass(name="Men's 59kg", min_weight=0, max_weight=59, gender="Male"),
@@ -671,10 +4310,73 @@ def create_tables():
                 AgeClass(name="Master IV", min_age=70, max_age=None)
             ])
             db.session.commit()
+    class_index.invalidate()
+
+def schema_is_current():
+    """True if every migration has been applied (one query; False if there is no schema yet)."""
+    try:
+        latest = db.session.query(db.func.max(SchemaMigration.version)).scalar()
+    except SQLAlchemyError:
+        db.session.rollback()
+        return False
+    return latest == MIGRATIONS[-1][0]
 
-# Call create_tables() unconditionally to ensure database schema is initialized
-create_tables()
+def warm_up():
+    """Prepares this worker for requests; runs once per process."""
+    global _warmed_up
+    with _warm_up_lock:
+        if _warmed_up:
+            return
+        started = time.perf_counter()
+        with app.app_context():
+            if not schema_is_current():
+                if not app.config['AUTO_INIT_DB']:
+                    raise RuntimeError("Database schema is missing or outdated; run `flask --app app init-db`")
+                create_tables()
+            replayed = restore_caches()
+        if app.config['CACHE_SNAPSHOT_SECONDS'] > 0:
+            # Daemon thread (green under eventlet) so it never holds up shutdown
+            threading.Thread(target=snapshot_caches_periodically, name='cache-snapshots', daemon=True).start()
+        _warmed_up = True
+        app.logger.info("Worker warmed up in %.0f ms (%s)", (time.perf_counter() - started) * 1000,
+                        "no cache snapshot" if replayed is None else f"snapshot + {replayed} log rows")
+
+@app.before_request
+def ensure_warmed_up():
+    if not _warmed_up:
+        warm_up()
+
+def _warm_up_in_background():
+    try:
+        warm_up()
+    except Exception:
+        app.logger.exception("Warm-up failed; the first request retries it")
+
+def create_app():
+    """Application factory for WSGI servers: gunicorn ... "app:create_app()".
+
+    Returns the app right away and warms the worker up in the background, so
+    boot time does not depend on the database at all.
+    """
+    if app.config['WARM_UP_ON_START'] and not _warmed_up:
+        # Runs once the worker's main loop yields (a green Thread.start() would
+        # switch to it immediately and block until the database work is done)
+        eventlet.spawn_n(_warm_up_in_background)
+    return app
+
+@app.cli.command('init-db')
+@click.option('--seed/--no-seed', default=True, help="Add meet states and default weight/age classes")
+def init_db_command(seed):
+    """Creates and migrates the schema (and seeds defaults). Safe to re-run."""
+    with app.app_context():
+        db.create_all()
+        applied = run_migrations()
+    if seed:
+        seed_defaults()
+    click.echo(f"Schema is at version {MIGRATIONS[-1][0]}" + (f" (applied {applied})" if applied else ""))
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
-    socketio.run(app, host='0.0.0.0', port=port, allow_unsafe_werkzeug=True)
+    # Served by eventlet's WSGI server (async_mode follows the monkey patching), so the
+    # Werkzeug-only allow_unsafe_werkzeug flag does not apply
+    socketio.run(create_app(), host='0.0.0.0', port=port)
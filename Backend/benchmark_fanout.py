@@ -0,0 +1,133 @@
+# Backend/benchmark_fanout.py
+#
+# Judge-click latency against the number of connected displays.
+#
+# For every display count of --displays (and both emit modes: "inline", where the
+# route calls socketio.emit itself, and "queued", where it hands the emit to the
+# background EmitQueue) the meet is reset, N Socket.IO display clients connect and
+# --decisions squat attempts are called and scored by three judges clicking at the
+# same time. Reported per run: latency of POST /lifts/<id>/score (what a judge
+# waits for) and judge-to-display latency (first click until every display has
+# the decision). With queued emits the first should stay flat as displays grow;
+# the second grows with the fan-out either way.
+#
+# With --max-p95-growth the script exits non-zero when the queued p95 score latency
+# at the most displays exceeds that factor times the one at the fewest, so it can
+# guard the concurrency model in CI.
+#
+# By default a throwaway SQLite file is used; pass --database-url (plus --reset,
+# since all tables are dropped) to run against a local PostgreSQL instead.
+#
+# Usage:
+#   python benchmark_fanout.py --displays 1,10,50,100
+#   python benchmark_fanout.py --database-url postgresql://localhost/bench --reset --max-p95-growth 2
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmark_meet import Bench, decide, register_lifters, summarize
+
+SCORE_ROUTE = 'POST /lifts/<id>/score'
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Judge latency against display count for the powerlifting backend.")
+    parser.add_argument('--displays', default='1,10,50,100',
+                        help="Comma-separated display counts to measure (default 1,10,50,100)")
+    parser.add_argument('--decisions', type=int, default=20, help="Lifts decided per run (default 20)")
+    parser.add_argument('--modes', default='inline,queued', help="Emit modes to compare (default inline,queued)")
+    parser.add_argument('--database-url', help="Database to run against (default: temporary SQLite file)")
+    parser.add_argument('--reset', action='store_true', help="Allow dropping all tables of --database-url")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for weights and judge decisions")
+    parser.add_argument('--max-p95-growth', type=float,
+                        help="Fail (exit 1) if queued p95 score latency grows more than this factor")
+    parser.add_argument('--json', dest='json_path', help="Also write the report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def reset_meet(app_module):
+    with app_module.app.app_context():
+        app_module.db.drop_all()
+    app_module.create_tables()
+    app_module.invalidate_meet_caches()
+
+
+def measure(app_module, displays, decisions, queue_size, rng):
+    app_module.app.config['SOCKETIO_EMIT_QUEUE_SIZE'] = queue_size
+    reset_meet(app_module)
+    bench = Bench(app_module, displays, display_reads=False)
+    try:
+        register_lifters(bench, decisions, rng)
+        organizer = bench.app.test_client()
+        judges = [(pin, bench.app.test_client()) for pin in sorted(app_module.JUDGE_PINS)]
+        bench.call('POST /meet_state', 'post', '/meet_state', organizer, json={'current_lift_type': 'squat'})
+        for _ in range(decisions):
+            lift = bench.call('POST /set_active_lift', 'post', '/set_active_lift', organizer, json={}).get_json()
+            if 'id' not in lift:
+                break
+            decide(bench, judges, lift, rng)
+    finally:
+        for display in bench.displays:
+            display.disconnect()
+    return {'score': summarize(bench.latencies[SCORE_ROUTE]),
+            'judge_to_display': summarize(bench.judge_to_display)}
+
+
+def print_report(result):
+    print(f"\n{result['decisions']} decisions per run, three judges per decision\n")
+    print(f"{'mode':8} {'displays':>8} {'score p50':>10} {'score p95':>10} {'j2d p50':>10} {'j2d p95':>10}  (ms)")
+    for run in result['runs']:
+        s, j = run['score'], run['judge_to_display']
+        print(f"{run['mode']:8} {run['displays']:>8} {s['p50_ms']:>10} {s['p95_ms']:>10} "
+              f"{j['p50_ms']:>10} {j['p95_ms']:>10}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.database_url:
+        if not args.reset:
+            raise SystemExit("--database-url drops all tables; pass --reset to confirm it is a scratch database")
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        db_file = os.path.join(tempfile.mkdtemp(prefix='meet-bench-'), 'bench.db')
+        os.environ['DATABASE_URL'] = f"sqlite:///{db_file}"
+    os.environ['CACHE_SNAPSHOT_SECONDS'] = '0'
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module # Imported late: reads DATABASE_URL
+
+    display_counts = sorted({int(count) for count in args.displays.split(',') if count.strip()})
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = set(modes) - {'inline', 'queued'}
+    if unknown:
+        raise SystemExit(f"Unknown mode(s) {', '.join(sorted(unknown))} (modes are inline, queued)")
+    queue_size = app_module.app.config['SOCKETIO_EMIT_QUEUE_SIZE'] or 1000
+
+    started = time.perf_counter()
+    runs = []
+    for mode in modes:
+        for displays in display_counts:
+            rng = random.Random(args.seed)
+            measured = measure(app_module, displays, args.decisions, queue_size if mode == 'queued' else 0, rng)
+            runs.append({'mode': mode, 'displays': displays, **measured})
+    result = {'decisions': args.decisions, 'elapsed_s': round(time.perf_counter() - started, 2), 'runs': runs}
+
+    print_report(result)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(result, f, indent=2)
+    queued = [run for run in runs if run['mode'] == 'queued']
+    if args.max_p95_growth is not None and len(queued) > 1:
+        first, last = queued[0]['score']['p95_ms'], queued[-1]['score']['p95_ms']
+        if last > first * args.max_p95_growth:
+            raise SystemExit(f"Queued p95 score latency grew from {first} ms ({queued[0]['displays']} displays) "
+                             f"to {last} ms ({queued[-1]['displays']} displays)")
+
+
+if __name__ == '__main__':
+    main()
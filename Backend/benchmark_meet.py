@@ -0,0 +1,269 @@
+# Backend/benchmark_meet.py
+#
+# Simulated meet-day load test for the backend in app.py.
+#
+# Registers N lifters, then runs the whole squat/bench/deadlift sequence the way
+# the organizer and judges drive it (set_active_lift, then three judges scoring
+# concurrently) while M Socket.IO display clients are connected and re-read
+# the display endpoints after every decision, like PublicDisplayView does.
+# With --auto-advance the organizer only starts the meet and the server calls
+# every following lift itself.
+#
+# Reports request latency percentiles and DB queries per request per route,
+# Socket.IO bytes per event name, and judge-to-display latency (time from the
+# first judge click until every display has received the decision).
+#
+# Everything runs in-process (Flask and Flask-SocketIO test clients), so the
+# numbers exclude network time but are reproducible. By default a throwaway
+# SQLite file is used; pass --database-url (plus --reset, since all tables are
+# dropped) to run against a local PostgreSQL instead.
+#
+# Usage:
+#   python benchmark_meet.py --lifters 100 --displays 20
+#   python benchmark_meet.py --lifters 100 --displays 20 --auto-advance
+#   python benchmark_meet.py --database-url postgresql://localhost/bench --reset --json out.json
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    values = sorted(samples)
+    return {
+        'count': len(values),
+        'p50_ms': round(percentile(values, 50) * 1000, 2),
+        'p95_ms': round(percentile(values, 95) * 1000, 2),
+        'p99_ms': round(percentile(values, 99) * 1000, 2),
+        'max_ms': round(values[-1] * 1000, 2) if values else 0.0,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulated full-meet benchmark for the powerlifting backend.")
+    parser.add_argument('--lifters', type=int, default=100, help="Number of lifters to register (default 100)")
+    parser.add_argument('--displays', type=int, default=10, help="Connected display clients (default 10)")
+    parser.add_argument('--database-url', help="Database to run against (default: temporary SQLite file)")
+    parser.add_argument('--reset', action='store_true', help="Allow dropping all tables of --database-url")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for weights and judge decisions")
+    parser.add_argument('--no-display-reads', action='store_true',
+                        help="Displays only listen; they do not re-read endpoints after each decision")
+    parser.add_argument('--auto-advance', action='store_true',
+                        help="Let the server call the next lift after each decision instead of the organizer")
+    parser.add_argument('--json', dest='json_path', help="Also write the report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+class Bench:
+    """Holds the app under test plus the per-route/per-event measurements."""
+
+    def __init__(self, app_module, displays, display_reads):
+        self.app_module = app_module
+        self.app = app_module.app
+        self.display_reads = display_reads
+        self.latencies = defaultdict(list)   # route -> [seconds]
+        self.queries = defaultdict(list)     # route -> [query count]
+        self.event_bytes = defaultdict(list) # event name -> [payload bytes]
+        self.judge_to_display = []
+        self._query_count = app_module.threading.local()
+
+        from sqlalchemy import event
+        with self.app.app_context():
+            engine = app_module.db.engine
+        event.listen(engine, 'before_cursor_execute', self._count_query)
+
+        self.displays = [app_module.socketio.test_client(self.app, query_string='role=display')
+                         for _ in range(displays)]
+        for display in self.displays:
+            display.get_received() # Drop the connect greeting
+
+    def _count_query(self, *args):
+        self._query_count.value = getattr(self._query_count, 'value', 0) + 1
+
+    def call(self, route, method, url, client=None, **kwargs):
+        client = client or self.app.test_client()
+        self._query_count.value = 0
+        start = time.perf_counter()
+        response = getattr(client, method)(url, **kwargs)
+        self.latencies[route].append(time.perf_counter() - start)
+        self.queries[route].append(self._query_count.value)
+        return response
+
+    def drain_displays(self, lift_id, started_at, timeout=5.0):
+        """Waits until every display has seen the decision for lift_id."""
+        pending = set(range(len(self.displays)))
+        deadline = time.perf_counter() + timeout
+        while pending and time.perf_counter() < deadline:
+            for i in list(pending):
+                for packet in self.displays[i].get_received():
+                    args = packet.get('args')
+                    payload = json.dumps(args, default=str)
+                    self.event_bytes[packet['name']].append(len(payload))
+                    data = args[0] if isinstance(args, list) and args else args
+                    if (packet['name'] == 'lift_updated' and isinstance(data, dict)
+                            and data.get('id') == lift_id and data.get('overall_result') is not None):
+                        pending.discard(i)
+            if pending:
+                time.sleep(0.001)
+        self.judge_to_display.append(time.perf_counter() - started_at)
+        return not pending
+
+    def display_refresh(self):
+        client = self.app.test_client()
+        for _ in self.displays:
+            self.call('GET /current_lift', 'get', '/current_lift', client)
+            self.call('GET /next_lift_in_queue', 'get', '/next_lift_in_queue', client)
+            self.call('GET /leaderboard', 'get', '/leaderboard', client)
+
+
+def register_lifters(bench, count, rng):
+    rows = []
+    for i in range(count):
+        gender = 'Male' if i % 2 else 'Female'
+        bodyweight = round(rng.uniform(52, 125) if gender == 'Male' else rng.uniform(44, 95), 1)
+        rows.append({
+            'name': f"Lifter {i}",
+            'gender': gender,
+            'lifter_id_number': f"B{i:05d}",
+            'actual_weight': bodyweight,
+            'birth_date': f"{rng.randint(1960, 2008)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'opener_squat': round(bodyweight * rng.uniform(1.2, 2.4) / 2.5) * 2.5,
+            'opener_bench': round(bodyweight * rng.uniform(0.7, 1.5) / 2.5) * 2.5,
+            'opener_deadlift': round(bodyweight * rng.uniform(1.5, 2.8) / 2.5) * 2.5,
+        })
+    response = bench.call('POST /lifters/import', 'post', '/lifters/import', json=rows)
+    if response.status_code != 201:
+        raise SystemExit(f"Lifter import failed: {response.status_code} {response.get_json()}")
+
+
+def decide(bench, judges, lift, rng):
+    import eventlet
+    good = rng.random() < 0.75
+
+    # Three judges click at the same time
+    started_at = time.perf_counter()
+    pool = eventlet.GreenPool(len(judges))
+    for pin, client in judges:
+        vote = good if rng.random() < 0.9 else not good
+        pool.spawn(bench.call, 'POST /lifts/<id>/score', 'post', f"/lifts/{lift['id']}/score",
+                   client, json={'judge_pin': pin, 'score': vote})
+    pool.waitall()
+    bench.drain_displays(lift['id'], started_at)
+    if bench.display_reads:
+        bench.display_refresh()
+
+
+def run_meet(bench, rng):
+    organizer = bench.app.test_client()
+    judges = [(pin, bench.app.test_client()) for pin in sorted(bench.app_module.JUDGE_PINS)]
+    decisions = 0
+    for lift_type in ('squat', 'bench', 'deadlift'):
+        bench.call('POST /meet_state', 'post', '/meet_state', organizer, json={'current_lift_type': lift_type})
+        for attempt in (1, 2, 3):
+            if attempt > 1:
+                bench.call('POST /meet_state/advance_attempt', 'post', '/meet_state/advance_attempt', organizer)
+            while True:
+                response = bench.call('POST /set_active_lift', 'post', '/set_active_lift', organizer, json={})
+                lift = response.get_json()
+                if response.status_code != 200 or 'id' not in lift:
+                    break
+                decide(bench, judges, lift, rng)
+                decisions += 1
+    return decisions
+
+
+def run_meet_auto_advance(bench, rng):
+    organizer = bench.app.test_client()
+    judges = [(pin, bench.app.test_client()) for pin in sorted(bench.app_module.JUDGE_PINS)]
+    decisions = 0
+    bench.call('POST /meet_state', 'post', '/meet_state', organizer, json={'auto_advance': True})
+    lift = bench.call('POST /set_active_lift', 'post', '/set_active_lift', organizer, json={}).get_json()
+    while 'id' in lift:
+        decide(bench, judges, lift, rng)
+        decisions += 1
+        lift = bench.call('GET /current_lift', 'get', '/current_lift', organizer).get_json()
+    return decisions
+
+
+def report(bench, args, decisions, elapsed):
+    routes = {}
+    for route in sorted(bench.latencies):
+        queries = bench.queries[route]
+        routes[route] = {**summarize(bench.latencies[route]),
+                         'queries_avg': round(sum(queries) / len(queries), 2),
+                         'queries_max': max(queries)}
+    events = {}
+    for name in sorted(bench.event_bytes):
+        sizes = bench.event_bytes[name]
+        events[name] = {'count': len(sizes), 'bytes_avg': round(sum(sizes) / len(sizes), 1),
+                        'bytes_total': sum(sizes)}
+    return {
+        'lifters': args.lifters,
+        'displays': args.displays,
+        'decisions': decisions,
+        'elapsed_s': round(elapsed, 2),
+        'routes': routes,
+        'events': events,
+        'judge_to_display': summarize(bench.judge_to_display),
+    }
+
+
+def print_report(result):
+    print(f"\n{result['lifters']} lifters, {result['displays']} displays, "
+          f"{result['decisions']} decisions in {result['elapsed_s']}s\n")
+    print(f"{'route':34} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'q avg':>6} {'q max':>6}")
+    for route, r in result['routes'].items():
+        print(f"{route:34} {r['count']:>6} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} "
+              f"{r['max_ms']:>8} {r['queries_avg']:>6} {r['queries_max']:>6}")
+    print(f"\n{'event':34} {'count':>6} {'avg bytes':>10} {'total bytes':>12}")
+    for name, e in result['events'].items():
+        print(f"{name:34} {e['count']:>6} {e['bytes_avg']:>10} {e['bytes_total']:>12}")
+    j = result['judge_to_display']
+    print(f"\njudge-to-display: p50 {j['p50_ms']} ms, p95 {j['p95_ms']} ms, p99 {j['p99_ms']} ms, max {j['max_ms']} ms")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.database_url:
+        if not args.reset:
+            raise SystemExit("--database-url drops all tables; pass --reset to confirm it is a scratch database")
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        db_file = os.path.join(tempfile.mkdtemp(prefix='meet-bench-'), 'bench.db')
+        os.environ['DATABASE_URL'] = f"sqlite:///{db_file}"
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module # Imported late: reads DATABASE_URL
+
+    with app_module.app.app_context():
+        app_module.db.drop_all()
+    app_module.create_tables()
+    app_module.invalidate_meet_caches()
+
+    rng = random.Random(args.seed)
+    bench = Bench(app_module, args.displays, not args.no_display_reads)
+    started = time.perf_counter()
+    register_lifters(bench, args.lifters, rng)
+    decisions = (run_meet_auto_advance if args.auto_advance else run_meet)(bench, rng)
+    result = report(bench, args, decisions, time.perf_counter() - started)
+
+    print_report(result)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
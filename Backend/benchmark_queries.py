@@ -0,0 +1,202 @@
+# Backend/benchmark_queries.py
+#
+# Query plans and latency of the backend's hot query paths, without and with the
+# secondary indexes of the models (see "Schema Migrations" in app.py).
+#
+# Builds a meet of about N lifts (nine per lifter, imported through /lifters/import
+# so the change log fills up as it would on meet day), decides a share of them,
+# then runs every query first with the secondary indexes of the lift, lifter and
+# meet_change tables dropped and again after they have been recreated. For
+# each query the plan (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on PostgreSQL) and the
+# latency percentiles of both runs are printed.
+#
+# By default a throwaway SQLite file is used; pass --database-url (plus --reset,
+# since all tables are dropped) to run against a local PostgreSQL instead.
+#
+# Usage:
+#   python benchmark_queries.py --lifts 10000
+#   python benchmark_queries.py --lifts 10000 --database-url postgresql://localhost/bench --reset --json out.json
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmark_meet import summarize
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Before/after index benchmark of the hot query paths.")
+    parser.add_argument('--lifts', type=int, default=10000, help="Approximate number of lifts (default 10000)")
+    parser.add_argument('--repeat', type=int, default=50, help="Runs per query and phase (default 50)")
+    parser.add_argument('--database-url', help="Database to run against (default: temporary SQLite file)")
+    parser.add_argument('--reset', action='store_true', help="Allow dropping all tables of --database-url")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for the dataset")
+    parser.add_argument('--json', dest='json_path', help="Also write the report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def build_dataset(app_module, lifts, rng):
+    client = app_module.app.test_client()
+    lifters = max(1, lifts // 9)
+    for start in range(0, lifters, 500):
+        rows = []
+        for i in range(start, min(start + 500, lifters)):
+            gender = 'Male' if i % 2 else 'Female'
+            bodyweight = round(rng.uniform(52, 125) if gender == 'Male' else rng.uniform(44, 95), 1)
+            rows.append({
+                'name': f"Lifter {i}",
+                'gender': gender,
+                'lifter_id_number': f"Q{i:06d}",
+                'actual_weight': bodyweight,
+                'birth_date': f"{rng.randint(1960, 2008)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                'opener_squat': round(bodyweight * rng.uniform(1.2, 2.4) / 2.5) * 2.5,
+                'opener_bench': round(bodyweight * rng.uniform(0.7, 1.5) / 2.5) * 2.5,
+                'opener_deadlift': round(bodyweight * rng.uniform(1.5, 2.8) / 2.5) * 2.5,
+                'platform': 1 + i % app_module.app.config['MEET_PLATFORMS'],
+                'flight': 'ABCD'[(i // 2) % 4],
+            })
+        response = client.post('/lifters/import', json=rows)
+        if response.status_code != 201:
+            raise SystemExit(f"Lifter import failed: {response.status_code} {response.get_json()}")
+
+    # Roughly the middle of a meet: squat and most of bench are decided
+    Lift, db = app_module.Lift, app_module.db
+    with app_module.app.app_context():
+        decided = (Lift.lift_type == 'squat') | ((Lift.lift_type == 'bench') & (Lift.attempt_number < 3))
+        db.session.execute(app_module.update(Lift).where(decided).values(
+            status='completed', overall_result=(Lift.id % 4 != 0), decided_at=app_module.datetime.utcnow()))
+        db.session.commit()
+        return db.session.query(db.func.count(Lift.id)).scalar()
+
+
+def hot_queries(app_module, rng):
+    """(name, statement) of the queries the backend runs on meet day."""
+    m = app_module
+    Lift, Lifter, MeetChange, db, select = m.Lift, m.Lifter, m.MeetChange, m.db, m.select
+    with m.app.app_context():
+        lifter_ids = [lifter_id for (lifter_id,) in db.session.query(Lifter.id)]
+        lift_ids = [lift_id for (lift_id,) in db.session.query(Lift.id)]
+        meet_id = m.current_meet_id()
+    lifter_id = rng.choice(lifter_ids)
+    lift_id = rng.choice(lift_ids)
+    return [
+        ("lifting queue load (pending lifts of a platform)",
+         select(Lift.id, Lift.weight_lifted).where(
+             Lift.status == 'pending',
+             Lift.lifter_id.in_(select(Lifter.id).where(Lifter.meet_id == meet_id, Lifter.platform == 1)))),
+        ("next lift of a round (lightest pending)",
+         select(Lift.id).where(Lift.status == 'pending', Lift.lift_type == 'bench', Lift.attempt_number == 3)
+         .order_by(Lift.weight_lifted, Lift.lifter_id).limit(1)),
+        ("previous attempt of a lifter",
+         select(Lift).where(Lift.lifter_id == lifter_id, Lift.lift_type == 'bench', Lift.attempt_number == 2)),
+        ("lifts of one lifter",
+         select(Lift).where(Lift.lifter_id == lifter_id)),
+        ("leaderboard best good lifts",
+         select(Lift.lifter_id, Lift.lift_type, db.func.max(Lift.weight_lifted))
+         .where(Lift.overall_result.is_(True)).group_by(Lift.lifter_id, Lift.lift_type)),
+        ("change history of one lift",
+         select(MeetChange).where(MeetChange.entity == 'lift', MeetChange.entity_id == lift_id)
+         .order_by(MeetChange.id)),
+        ("latest revision of a table",
+         select(db.func.max(MeetChange.id)).where(MeetChange.entity == 'lifter')),
+    ]
+
+
+def explain(connection, statement):
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True}))
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.dialect.name == 'sqlite' else 'EXPLAIN '
+    rows = connection.exec_driver_sql(prefix + sql).all()
+    return [row[-1] for row in rows] # SQLite: (id, parent, notused, detail); PostgreSQL: (line,)
+
+
+def measure(app_module, queries, repeat):
+    db = app_module.db
+    results = {}
+    with app_module.app.app_context():
+        with db.engine.connect() as connection:
+            connection.exec_driver_sql('ANALYZE')
+            for name, statement in queries:
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    connection.execute(statement).all()
+                    samples.append(time.perf_counter() - start)
+                results[name] = {'plan': explain(connection, statement), **summarize(samples)}
+    return results
+
+
+def indexed_models(app_module):
+    return app_module.Lifter, app_module.Lift, app_module.MeetChange
+
+
+def drop_indexes(app_module):
+    with app_module.app.app_context():
+        with app_module.db.engine.begin() as connection:
+            for model in indexed_models(app_module):
+                for index in model.__table__.indexes:
+                    index.drop(connection, checkfirst=True)
+
+
+def create_indexes(app_module):
+    with app_module.app.app_context():
+        with app_module.db.engine.begin() as connection:
+            app_module.create_missing_indexes(connection, *indexed_models(app_module))
+
+
+def print_report(result):
+    print(f"\n{result['lifts']} lifts, {result['repeat']} runs per query\n")
+    for name, phases in result['queries'].items():
+        before, after = phases['before'], phases['after']
+        print(f"{name}\n  p50 {before['p50_ms']} -> {after['p50_ms']} ms, "
+              f"p95 {before['p95_ms']} -> {after['p95_ms']} ms")
+        for label, phase in (('before', before), ('after', after)):
+            for line in phase['plan']:
+                print(f"    {label:6} | {line}")
+        print()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.database_url:
+        if not args.reset:
+            raise SystemExit("--database-url drops all tables; pass --reset to confirm it is a scratch database")
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        db_file = os.path.join(tempfile.mkdtemp(prefix='meet-bench-'), 'bench.db')
+        os.environ['DATABASE_URL'] = f"sqlite:///{db_file}"
+    os.environ.setdefault('MEET_PLATFORMS', '2')
+    os.environ['CACHE_SNAPSHOT_SECONDS'] = '0'
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as app_module # Imported late: reads DATABASE_URL
+
+    with app_module.app.app_context():
+        app_module.db.drop_all()
+    app_module.create_tables()
+
+    rng = random.Random(args.seed)
+    lifts = build_dataset(app_module, args.lifts, rng)
+    queries = hot_queries(app_module, rng)
+
+    drop_indexes(app_module)
+    before = measure(app_module, queries, args.repeat)
+    create_indexes(app_module)
+    after = measure(app_module, queries, args.repeat)
+
+    result = {
+        'lifts': lifts,
+        'repeat': args.repeat,
+        'queries': {name: {'before': before[name], 'after': after[name]} for name, _ in queries},
+    }
+    print_report(result)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
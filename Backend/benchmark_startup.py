@@ -0,0 +1,118 @@
+# Backend/benchmark_startup.py
+#
+# Worker cold-start benchmark for the backend in app.py.
+#
+# Every run starts a fresh Python process that imports app, calls create_app() (what
+# gunicorn does when a worker boots) and then serves its first request, GET
+# /current_lift, as the first judge or display would. Reported per phase:
+#   process   - interpreter start until `import app` begins
+#   import    - importing app (no database access)
+#   factory   - create_app() until it returns (the worker is ready to accept)
+#   first req - first request, including any wait for the background warm-up
+#   total     - process start until the first response
+# The one-shot `flask --app app init-db` is timed separately; it runs before the
+# worker runs. With --max-cold-start-ms the script exits non-zero when the p95 total
+# exceeds the bound, so it can guard cold start in CI.
+#
+# By default a throwaway SQLite file is used; pass --database-url (plus --reset,
+# since all tables are dropped) to run against a local PostgreSQL instead.
+#
+# Usage:
+#   python benchmark_startup.py --runs 10
+#   python benchmark_startup.py --database-url postgresql://localhost/bench --reset --max-cold-start-ms 3000
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmark_meet import summarize
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+WORKER = r'''
+import json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+application = app.create_app()
+created = time.perf_counter()
+response = application.test_client().get('/current_lift')
+answered = time.perf_counter()
+print(json.dumps({'status': response.status_code, 'started': started, 'import': imported - started,
+                  'factory': created - imported, 'first_request': answered - created}))
+'''
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Worker cold-start benchmark for the powerlifting backend.")
+    parser.add_argument('--runs', type=int, default=10, help="Worker starts to measure (default 10)")
+    parser.add_argument('--database-url', help="Database to run against (default: temporary SQLite file)")
+    parser.add_argument('--reset', action='store_true', help="Allow dropping all tables of --database-url")
+    parser.add_argument('--max-cold-start-ms', type=float,
+                        help="Fail (exit 1) if the p95 total cold start exceeds this many milliseconds")
+    parser.add_argument('--json', dest='json_path', help="Also write the report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def run(args, env):
+    start = time.perf_counter()
+    completed = subprocess.run(args, cwd=HERE, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise SystemExit(f"{' '.join(args)} failed:\n{completed.stderr}")
+    return elapsed, completed.stdout
+
+
+def reset_database(env):
+    code = "import app\nwith app.app.app_context():\n    app.db.drop_all()"
+    run([sys.executable, '-c', code], env)
+
+
+def measure_worker(env):
+    # perf_counter is system-wide on Linux and macOS, so the parent's start time and
+    # the worker's timestamps can be compared
+    start = time.perf_counter()
+    _, stdout = run([sys.executable, '-c', WORKER], env)
+    worker = json.loads(stdout.strip().splitlines()[-1])
+    if worker['status'] != 200:
+        raise SystemExit(f"First request answered {worker['status']}")
+    process = worker['started'] - start
+    return {'process': process, 'import': worker['import'], 'factory': worker['factory'],
+            'first_request': worker['first_request'],
+            'total': process + worker['import'] + worker['factory'] + worker['first_request']}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    env = dict(os.environ, CACHE_SNAPSHOT_SECONDS='0', PYTHONWARNINGS='ignore')
+    if args.database_url:
+        if not args.reset:
+            raise SystemExit("--database-url drops all tables; pass --reset to confirm it is a scratch database")
+        env['DATABASE_URL'] = args.database_url
+        reset_database(env)
+    else:
+        env['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='meet-bench-'), 'bench.db')}"
+
+    init_db, _ = run([sys.executable, '-m', 'flask', '--app', 'app', 'init-db'], env)
+    samples = [measure_worker(env) for _ in range(args.runs)]
+    phases = {phase: summarize([sample[phase] for sample in samples])
+              for phase in ('process', 'import', 'factory', 'first_request', 'total')}
+    result = {'runs': args.runs, 'init_db_ms': round(init_db * 1000, 2), 'phases': phases}
+
+    print(f"\n{args.runs} worker starts; flask init-db took {result['init_db_ms']} ms (once per deploy)\n")
+    print(f"{'phase':16} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for phase, r in phases.items():
+        print(f"{phase.replace('_', ' '):16} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['max_ms']:>8}")
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(result, f, indent=2)
+    if args.max_cold_start_ms is not None and phases['total']['p95_ms'] > args.max_cold_start_ms:
+        raise SystemExit(f"p95 cold start {phases['total']['p95_ms']} ms exceeds {args.max_cold_start_ms} ms")
+
+
+if __name__ == '__main__':
+    main()
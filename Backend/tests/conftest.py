@@ -0,0 +1,80 @@
+"""Shared test setup. Run the tests from Backend/ with `python -m pytest` (the
+message queue tests also need `requests` for python-socketio's client).
+
+app.py reads its configuration when it is imported, so the environment is set up
+here first: the database is TEST_DATABASE_URL if set, else a throwaway SQLite
+file, events stay in-process and are emitted inline (none is left queued for the
+next test). Every test starts from a freshly created and seeded schema with empty
+caches.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+os.environ['DATABASE_URL'] = (os.environ.get('TEST_DATABASE_URL') or
+                              'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='meet-tests-'), 'meet.db'))
+os.environ['CACHE_SNAPSHOT_SECONDS'] = '0'
+os.environ['WARM_UP_ON_START'] = '0'
+os.environ['SOCKETIO_EMIT_QUEUE_SIZE'] = '0'
+os.environ.pop('SOCKETIO_MESSAGE_QUEUE', None)
+
+import app as meet # noqa: E402  (must come after the environment is set)
+
+
+def reset_caches():
+    meet.invalidate_meet_caches()
+    meet.class_index.invalidate()
+    meet.table_revisions.invalidate()
+    meet.response_cache = meet.ResponseCache() # Revisions restart with the schema
+
+
+@pytest.fixture
+def app():
+    with meet.app.app_context():
+        meet.db.drop_all()
+    meet.create_tables()
+    reset_caches()
+    yield meet.app
+    with meet.app.app_context():
+        meet.db.session.remove()
+    reset_caches()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def add_lifter(client):
+    """add_lifter(number, **fields) registers a lifter through POST /lifters and returns its JSON."""
+    def add(number, **fields):
+        body = {'name': f'Lifter {number}', 'gender': 'Male', 'lifter_id_number': f'ID{number:05d}',
+                'actual_weight': 80.0, 'birth_date': '1995-05-01', 'opener_squat': 150.0,
+                'opener_bench': 100.0, 'opener_deadlift': 200.0, **fields}
+        response = client.post('/lifters', json=body)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+    return add
+
+
+@pytest.fixture
+def connect(app):
+    """connect(query_string) opens a Socket.IO test client with nothing received yet.
+    Emits are sent inline, so a route's broadcasts have arrived when it returns."""
+    clients = []
+
+    def open_client(query_string):
+        client = meet.socketio.test_client(app, query_string=query_string)
+        client.get_received()
+        clients.append(client)
+        return client
+    yield open_client
+    for client in clients:
+        if client.is_connected():
+            client.disconnect()
@@ -0,0 +1,100 @@
+"""Socket.IO events reach the rooms of the views that use them, bursts of a batched
+event are collapsed into one message, and the emit queue sends in order."""
+import pytest
+
+import app as meet
+
+
+def received(client, event):
+    return [packet['args'][0] for packet in client.get_received() if packet['name'] == event]
+
+
+@pytest.fixture
+def batched(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'SOCKETIO_BATCH_MS', {'lifter_updated': 20})
+
+    def flush():
+        meet.socketio.sleep(0.1) # Lets the batch window close and its green thread send
+    return flush
+
+
+def test_events_reach_only_their_roles_and_platform(client, add_lifter, connect, monkeypatch):
+    monkeypatch.setitem(meet.app.config, 'MEET_PLATFORMS', 2)
+    organizer = connect('role=organizer&platform=1')
+    judge = connect('role=judge&platform=1')
+    other_platform = connect('role=display&platform=2')
+
+    lifter = add_lifter(1)
+    client.post('/set_active_lift', json={})
+
+    assert [added['id'] for added in received(organizer, 'lifter_added')] == [lifter['id']]
+    events = {packet['name'] for packet in judge.get_received()}
+    assert 'active_lift_changed' in events and 'lifter_added' not in events
+    assert [packet['name'] for packet in other_platform.get_received()] == []
+
+
+def test_single_batched_update_keeps_object_payload(client, add_lifter, connect, batched):
+    lifter = add_lifter(1)
+    organizer = connect('role=organizer')
+
+    client.post(f"/lifters/{lifter['id']}/platform", json={'flight': 'B'})
+    client.post(f"/lifters/{lifter['id']}/platform", json={'flight': 'C'})
+    batched()
+
+    updates = received(organizer, 'lifter_updated')
+    assert len(updates) == 1
+    assert isinstance(updates[0], dict) # Both updates of the lifter, merged
+    assert (updates[0]['id'], updates[0]['flight'], updates[0]['version']) == (lifter['id'], 'C', 3)
+
+
+def test_burst_of_batched_updates_is_one_list(client, add_lifter, connect, batched):
+    lifters = [add_lifter(number) for number in (1, 2)]
+    organizer = connect('role=organizer')
+
+    for lifter in lifters:
+        client.post(f"/lifters/{lifter['id']}/platform", json={'flight': 'B'})
+    batched()
+
+    updates = received(organizer, 'lifter_updated')
+    assert len(updates) == 1
+    assert sorted((update['id'], update['flight']) for update in updates[0]) == \
+        [(lifters[0]['id'], 'B'), (lifters[1]['id'], 'B')]
+
+
+@pytest.fixture
+def queued(app, monkeypatch):
+    """A fresh emit queue of size 3 whose sends are recorded; nothing runs in the background."""
+    sent = []
+    monkeypatch.setitem(app.config, 'SOCKETIO_EMIT_QUEUE_SIZE', 3)
+    monkeypatch.setattr(meet.socketio, 'emit', lambda event, data, to: sent.append((event, data)))
+    queue = meet.EmitQueue()
+    queue._sender_started = True # The test sends with flush() instead
+    return queue, sent
+
+
+def test_queued_emits_of_one_entity_merge_and_keep_order(queued):
+    queue, sent = queued
+    queue.put('lift_updated', {'id': 1, 'status': 'active'}, ['judge'])
+    queue.put('lift_updated', {'id': 2, 'status': 'active'}, ['judge'])
+    queue.put('lift_updated', {'id': 1, 'judge1_score': True}, ['judge'])
+    assert (queue.pending(), sent) == (2, [])
+
+    queue.flush()
+
+    # Lift 1 moved behind lift 2, so its newer state is never followed by an older one
+    assert sent == [('lift_updated', {'id': 2, 'status': 'active'}),
+                    ('lift_updated', {'id': 1, 'status': 'active', 'judge1_score': True})]
+
+
+def test_full_emit_queue_sends_oldest_from_the_caller(queued):
+    queue, sent = queued
+    for lift_id in (1, 2, 3):
+        queue.put('lift_updated', {'id': lift_id}, ['judge'])
+    assert sent == []
+
+    queue.put('records_rebuilt', None, ['organizer']) # No entity id: never merged
+
+    assert sent == [('lift_updated', {'id': 1})]
+    assert queue.pending() == 3
+    queue.flush()
+    assert [data and data['id'] for _, data in sent] == [1, 2, 3, None]
@@ -0,0 +1,51 @@
+"""Cache snapshots plus change-log replay give the same caches as loading from scratch."""
+import app as meet
+from conftest import reset_caches
+from test_query_counts import counted_queries
+
+JUDGE_PINS = ('1111', '2222', '3333')
+VIEWS = ('/next_lift_in_queue?limit=0', '/current_lift', '/meet_state', '/leaderboard')
+
+
+def views(client):
+    return {path: client.get(path).get_json() for path in VIEWS}
+
+
+def restore():
+    reset_caches()
+    with meet.app.app_context():
+        return meet.restore_caches()
+
+
+def test_snapshot_and_replay_match_a_full_load(client, add_lifter, monkeypatch):
+    first = add_lifter(1, opener_squat=140.0)
+    assert client.post('/cache_snapshots').status_code == 201
+    assert client.post('/cache_snapshots').get_json() == {'message': 'Latest snapshot is up to date'}
+
+    # Changes after the snapshot: a new lifter, a good lift and the next lift called
+    add_lifter(2, opener_squat=150.0)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    for pin in JUDGE_PINS:
+        client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': True})
+    client.post('/set_active_lift', json={})
+    reset_caches()
+    expected = views(client)
+    assert expected['/leaderboard'][0]['lifter_id'] == first['id']
+
+    assert restore() > 0
+    monkeypatch.setitem(meet.app.config, 'MEET_STATE_REVALIDATE_SECONDS', 3600)
+    with counted_queries() as statements:
+        assert views(client) == expected
+    # Queue and standings come from the snapshot: no pending-lift scan, no best-lift GROUP BY. (The
+    # platform's meet state re-reads its new active lift for the record flag, see apply_state_delta.)
+    assert [statement for statement in statements if 'lift.status = ' in statement or 'GROUP BY' in statement] == []
+
+
+def test_no_restore_without_snapshot_or_after_a_new_meet(client, add_lifter):
+    add_lifter(1)
+    assert restore() is None
+    client.post('/cache_snapshots')
+    client.post('/meets', json={'name': 'Meet 2'})
+
+    assert restore() is None
+    assert client.get('/next_lift_in_queue').get_json()['lifts'] == []
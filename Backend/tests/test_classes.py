@@ -0,0 +1,76 @@
+"""Weight and age class changes re-resolve the active meet's lifters in bulk, and
+classes are resolved from the shared class index."""
+import app as meet
+from test_query_counts import counted_queries
+
+
+def classes_of(client):
+    return {lifter['id']: (lifter['primary_weight_class_name'], lifter['primary_age_class_name'])
+            for lifter in client.get('/lifters').get_json()}
+
+
+def test_interval_table_bounds_and_overlaps():
+    table = meet.IntervalTable([(0, 59, 'a'), (59.01, 66, 'b'), (60, None, 'c')])
+
+    assert [table.lookup(value) for value in (-1, 0, 59, 59.005, 59.01, 66, 66.5, 500)] == \
+        [None, 'a', 'a', None, 'b', 'b', 'c', 'c'] # Overlap 60-66: the lowest lower bound wins
+
+
+def test_new_and_deleted_class_reassign_lifters(client, add_lifter, connect):
+    inside, outside = add_lifter(1, actual_weight=80.0), add_lifter(2, actual_weight=90.0)
+    assert classes_of(client)[inside['id']][0] == "Men's 83kg"
+    organizer = connect('role=organizer')
+
+    new_class = client.post('/weight_classes', json={'name': 'Men 74-81', 'min_weight': 74.005,
+                                                     'max_weight': 81, 'gender': 'Male'}).get_json()
+    assert classes_of(client) == {inside['id']: ('Men 74-81', 'Open'), outside['id']: ("Men's 93kg", 'Open')}
+    meet.socketio.sleep(0.1) # lifter_updated is batched
+    updates = [packet['args'][0] for packet in organizer.get_received() if packet['name'] == 'lifter_updated']
+    assert [(update['id'], update['primary_weight_class_id'], update['version']) for update in updates] == \
+        [(inside['id'], new_class['id'], 2)]
+
+    assert client.delete(f"/weight_classes/{new_class['id']}").status_code == 200
+    assert classes_of(client)[inside['id']] == ("Men's 83kg", 'Open')
+
+
+def test_age_class_change_reassigns_lifters(client, add_lifter):
+    lifter = add_lifter(1)
+    created = client.post('/age_classes', json={'name': 'Up to now', 'min_age': 0,
+                                                'max_age': lifter['age']}).get_json()
+
+    assert client.get('/lifters').get_json()[0]['primary_age_class_id'] == created['id']
+    client.delete(f"/age_classes/{created['id']}")
+    assert client.get('/lifters').get_json()[0]['primary_age_class_id'] == lifter['primary_age_class_id']
+
+
+def test_registration_resolves_classes_from_the_index(client, add_lifter):
+    add_lifter(1) # Builds the class index
+    with counted_queries() as statements:
+        add_lifter(2)
+    class_tables = [statement for statement in statements if 'lifter_additional' not in statement and
+                    ('FROM weight_class' in statement or 'FROM age_class' in statement)]
+    assert class_tables == []
+
+    created = client.post('/weight_classes', json={'name': 'Men 74-81', 'min_weight': 74.005,
+                                                   'max_weight': 81, 'gender': 'Male'}).get_json()
+    assert add_lifter(3)['primary_weight_class_id'] == created['id'] # The index was rebuilt
+
+
+def test_class_change_from_another_worker_rebuilds_the_index(client, add_lifter):
+    add_lifter(1)
+    with meet.app.app_context():
+        meet.db.session.add(meet.WeightClass(name='Men 74-81', min_weight=74.005, max_weight=81, gender='Male'))
+        meet.db.session.commit()
+    assert add_lifter(2)['primary_weight_class_name'] == "Men's 83kg" # Not known to this worker yet
+
+    meet.apply_foreign_class_change({'id': 0}, None)
+
+    assert add_lifter(3)['primary_weight_class_name'] == 'Men 74-81'
+
+
+def test_ages_follow_the_meet_date(client, add_lifter):
+    client.post('/meets', json={'name': 'Spring', 'meet_date': '2024-04-30'})
+    assert add_lifter(1, birth_date='2000-05-01')['age'] == 23
+
+    client.post('/meets', json={'name': 'Summer', 'meet_date': '2024-05-01'})
+    assert add_lifter(2, birth_date='2000-05-01')['age'] == 24
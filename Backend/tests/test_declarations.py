@@ -0,0 +1,78 @@
+"""Attempt declarations and change cards: POST /lifts/<id>/declare."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+import app as meet
+
+JUDGE_PINS = ('1111', '2222', '3333')
+
+
+def attempts(client, lifter_id, lift_type='squat'):
+    return {lift['attempt_number']: lift for lift in client.get('/lifts').get_json()
+            if lift['lifter_id'] == lifter_id and lift['lift_type'] == lift_type}
+
+
+def decide_opener(client, lifter, good):
+    opener = client.post('/set_active_lift', json={}).get_json()
+    for pin in JUDGE_PINS:
+        client.post(f"/lifts/{opener['id']}/score", json={'judge_pin': pin, 'score': good})
+    return attempts(client, lifter['id'])[2]
+
+
+def declare(client, lift, weight):
+    return client.post(f"/lifts/{lift['id']}/declare", json={'weight': weight})
+
+
+def test_declaration_then_limited_changes(client, add_lifter, connect):
+    lifter = add_lifter(1, opener_squat=150.0)
+    second = decide_opener(client, lifter, good=True)
+    display = connect('role=display&platform=1')
+
+    assert declare(client, second, 150).status_code == 400 # Must beat a good lift
+    assert declare(client, second, 153).status_code == 400 # Not a multiple of 2.5 kg
+    response = declare(client, second, 152.5)
+    assert response.status_code == 200
+    assert response.get_json()['declaration']['kind'] == 'declaration'
+    assert declare(client, second, 152.5).status_code == 400 # Unchanged
+    assert declare(client, second, 155).status_code == 200
+    assert declare(client, second, 160).status_code == 200
+    assert declare(client, second, 162.5).status_code == 409 # Both changes used
+
+    history = client.get(f"/lifts/{second['id']}/declarations").get_json()
+    assert [(item['kind'], item['previous_weight'], item['weight']) for item in history] == [
+        ('declaration', 155.0, 152.5), ('change', 152.5, 155.0), ('change', 155.0, 160.0)]
+    queue_updates = [packet['args'][0] for packet in display.get_received() if packet['name'] == 'queue_updated']
+    assert [(update['weight_lifted'], update['position']) for update in queue_updates] == \
+        [(152.5, 0), (155.0, 0), (160.0, 0)]
+
+
+def test_failed_attempt_may_be_repeated(client, add_lifter):
+    lifter = add_lifter(1, opener_squat=150.0)
+    second = decide_opener(client, lifter, good=False)
+
+    assert declare(client, second, 147.5).status_code == 400
+    assert declare(client, second, 150).status_code == 200
+
+
+def test_declaration_deadline(client, add_lifter, monkeypatch):
+    lifter = add_lifter(1, opener_squat=150.0)
+    second = decide_opener(client, lifter, good=True)
+    monkeypatch.setitem(meet.app.config, 'ATTEMPT_DECLARATION_SECONDS', 60)
+    with meet.app.app_context():
+        meet.db.session.execute(update(meet.Lift).where(meet.Lift.id == attempts(client, lifter['id'])[1]['id'])
+                                .values(decided_at=datetime.utcnow() - timedelta(seconds=61)))
+        meet.db.session.commit()
+
+    response = declare(client, second, 155)
+
+    assert response.status_code == 409
+    assert 'deadline' in response.get_json()['error']
+
+
+def test_called_attempt_cannot_be_changed(client, add_lifter):
+    lifter = add_lifter(1)
+    opener = client.post('/set_active_lift', json={}).get_json()
+
+    assert declare(client, opener, 155).status_code == 409
+    assert declare(client, attempts(client, lifter['id'])[2], 'x').status_code == 400
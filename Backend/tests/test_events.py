@@ -0,0 +1,33 @@
+"""GET /events: the unmerged change log, filtered and paged."""
+import pytest
+
+
+def test_events_of_one_entity_in_order(client, add_lifter):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': '1111', 'score': True})
+
+    body = client.get(f"/events?entity=lift&entity_id={lift['id']}").get_json()
+
+    assert [event['event'] for event in body['events']] == ['lift_created', 'lift_activated', 'judge_scored']
+    assert body['revision'] == body['events'][-1]['revision']
+    assert body['events'][-1]['changes']['judge1_score'] is True
+
+
+def test_events_pages_with_since_and_limit(client, add_lifter):
+    add_lifter(1)
+    first = client.get('/events?limit=4').get_json()
+    rest = client.get(f"/events?since={first['revision']}").get_json()
+
+    assert len(first['events']) == 4
+    revisions = [event['revision'] for event in first['events'] + rest['events']]
+    assert revisions == sorted(set(revisions))
+    assert client.get(f"/events?since={rest['revision']}").get_json() == {'revision': rest['revision'], 'events': []}
+
+
+@pytest.mark.parametrize('query', ['entity_id=abc', 'since=1.5', 'limit=all'])
+def test_events_rejects_non_integer_parameters(client, query):
+    response = client.get(f'/events?entity=lift&{query}')
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': f"{query.partition('=')[0]} must be an integer"}
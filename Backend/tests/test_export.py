@@ -0,0 +1,45 @@
+"""Streaming exports of lifters and lifts as CSV or NDJSON."""
+import csv
+import io
+import json
+
+
+def test_lifters_csv(client, add_lifter):
+    add_lifter(1, name='Smith, "Big" John')
+    add_lifter(2, gender='Female', actual_weight=60.0)
+
+    response = client.get('/export/lifters.csv')
+
+    assert response.mimetype == 'text/csv'
+    assert response.headers['Content-Disposition'] == 'attachment; filename="lifters.csv"'
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0][:3] == ['Lifter ID', 'Name', 'Gender']
+    assert [row[1] for row in rows[1:]] == ['Smith, "Big" John', 'Lifter 2']
+    assert rows[2][rows[0].index('Primary Weight Class')] == "Women's 63kg"
+
+
+def test_lifts_ndjson_with_results(client, add_lifter):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    for pin, score in (('1111', True), ('2222', False), ('3333', True)):
+        client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': score})
+
+    lines = client.get('/export/lifts.ndjson').get_data(as_text=True).splitlines()
+
+    rows = [json.loads(line) for line in lines]
+    assert len(rows) == 9
+    scored = next(row for row in rows if row['id'] == lift['id'])
+    assert (scored['judge1_score'], scored['judge2_score'], scored['judge3_score'], scored['overall_result']) == \
+        (True, False, True, True)
+
+
+def test_archived_meet_and_bad_requests(client, add_lifter):
+    old = add_lifter(1)
+    client.post('/meets', json={'name': 'Meet 2'})
+
+    assert client.get('/export/lifters.ndjson').get_data() == b''
+    archived = client.get(f"/export/lifters.ndjson?meet_id={old['meet_id']}").get_data(as_text=True)
+    assert json.loads(archived)['lifter_id_number'] == old['lifter_id_number']
+    assert client.get('/export/lifters.xml').status_code == 400
+    assert client.get('/export/judges.csv').status_code == 404
+    assert client.get('/export/lifts.csv?meet_id=999').status_code == 400
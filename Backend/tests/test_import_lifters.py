@@ -0,0 +1,41 @@
+"""POST /lifters/import with JSON and CSV bodies."""
+import csv
+import io
+
+import app as meet
+
+CSV_HEADER = b'name,gender,lifter_id_number,actual_weight,birth_date,opener_squat,opener_bench,opener_deadlift\n'
+
+
+def lifter_count():
+    with meet.app.app_context():
+        return meet.Lifter.query.count()
+
+
+def test_csv_import_reports_invalid_rows(client):
+    body = CSV_HEADER + b'Ana,Female,IM1,62.5,1994-02-03,120,70,140\nBo,Other,IM2,80,1990-01-01,150,100,200\n'
+    response = client.post('/lifters/import', data=body, content_type='text/csv')
+
+    assert response.status_code == 201
+    assert response.get_json()['imported'] == 1
+    assert response.get_json()['errors'] == [{'row': 2, 'error': "Invalid gender: 'Other'"}]
+
+
+def test_csv_that_is_not_utf8_is_rejected_with_its_row(client):
+    response = client.post('/lifters/import', data=b'name,gender\n\xff\xfe\xfa,Male\n', content_type='text/csv')
+
+    assert response.status_code == 400
+    assert response.get_json()['row'] == 1
+    assert lifter_count() == 0
+
+
+def test_unreadable_csv_upload_imports_nothing(client):
+    oversized_name = b'B' * (csv.field_size_limit() + 1) # csv.Error: field larger than field limit
+    body = (CSV_HEADER + b'Ana,Female,IM1,62.5,1994-02-03,120,70,140\n' +
+            oversized_name + b',Male,IM2,80,1990-01-01,150,100,200\n')
+    response = client.post('/lifters/import', data={'file': (io.BytesIO(body), 'lifters.csv')},
+                           content_type='multipart/form-data')
+
+    assert response.status_code == 400
+    assert response.get_json()['row'] == 2
+    assert lifter_count() == 0
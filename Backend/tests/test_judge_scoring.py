@@ -0,0 +1,110 @@
+"""Judges scoring through POST /lifts/<id>/score, batches of queued decisions and Socket.IO."""
+import threading
+
+import pytest
+
+import app as meet
+
+JUDGE_PINS = ('1111', '2222', '3333')
+
+
+@pytest.fixture
+def display(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'SOCKETIO_EMIT_QUEUE_SIZE', 0) # Emit inline: every broadcast is counted
+    client = meet.socketio.test_client(app, query_string='role=judge&platform=1')
+    client.get_received()
+    yield client
+    client.disconnect()
+
+
+@pytest.mark.parametrize('scores', [(True, True, True), (True, False, True), (False, False, True)])
+def test_concurrent_judges(client, add_lifter, display, scores):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    display.get_received()
+
+    start = threading.Barrier(len(JUDGE_PINS))
+    responses = {}
+
+    def judge(pin, score):
+        start.wait()
+        responses[pin] = client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': score})
+
+    threads = [threading.Thread(target=judge, args=(pin, score)) for pin, score in zip(JUDGE_PINS, scores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {pin: response.status_code for pin, response in responses.items()} == dict.fromkeys(JUDGE_PINS, 200)
+    with meet.app.app_context():
+        row = meet.db.session.get(meet.Lift, lift['id'])
+        assert (row.judge1_score, row.judge2_score, row.judge3_score) == scores
+        assert row.overall_result is (sum(scores) >= 2)
+        assert row.status == 'completed'
+        events = [change.event for change in meet.MeetChange.query.filter_by(entity='lift', entity_id=lift['id'])]
+    assert events.count('result_finalized') == 1 # The result was computed by exactly one vote
+
+    updates = [packet['args'][0] for packet in display.get_received() if packet['name'] == 'lift_updated']
+    assert len(updates) == len(JUDGE_PINS) # One compact event per decision, none repeated
+    assert sorted(column for update in updates for column in update if column.startswith('judge')) == \
+        ['judge1_score', 'judge2_score', 'judge3_score']
+    decided = [update for update in updates if 'decided_at' in update]
+    assert len(decided) == 1 # Exactly one lift_updated announces the result
+    assert decided[0]['overall_result'] is (sum(scores) >= 2)
+
+
+def test_socket_decision_retried_is_stored_once(client, add_lifter, connect, monkeypatch):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    warm_ups = []
+    monkeypatch.setattr(meet, '_warmed_up', False) # A worker whose first traffic is a judge's socket
+    monkeypatch.setattr(meet, 'warm_up', lambda: warm_ups.append(True))
+    judge = connect('role=judge&platform=1')
+    batch = {'judge_pin': '1111', 'batch_id': 'b1',
+             'decisions': [{'decision_id': 'tablet1-0001', 'lift_id': lift['id'], 'score': True}]}
+
+    first = judge.emit('score', batch, callback=True)
+    retry = judge.emit('score', batch, callback=True)
+
+    assert warm_ups
+    assert first['results'][0]['status'] == retry['results'][0]['status'] == 'applied'
+    assert retry['results'][0]['duplicate'] is True
+    with meet.app.app_context():
+        assert meet.JudgeDecision.query.filter_by(decision_id='tablet1-0001').count() == 1
+        assert meet.MeetChange.query.filter_by(entity='lift', entity_id=lift['id'], event='judge_scored').count() == 1
+
+
+def test_offline_batch_reports_each_decision(client, add_lifter):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    decisions = [
+        {'decision_id': 'tablet1-0002', 'lift_id': lift['id'], 'score': False, 'sequence': 2},
+        {'decision_id': 'tablet1-0001', 'lift_id': lift['id'], 'score': True, 'sequence': 1}, # Changed mind since
+        {'decision_id': 'tablet1-0003', 'lift_id': 999999, 'score': True},
+        {'decision_id': 'tablet1-0004', 'lift_id': 'squat', 'score': True},
+    ]
+
+    body = client.post('/scores', json={'judge_pin': '1111', 'batch_id': 'b1', 'decisions': decisions}).get_json()
+
+    assert body['batch_id'] == 'b1'
+    assert [(result['decision_id'], result['status']) for result in body['results']] == [
+        ('tablet1-0002', 'applied'), ('tablet1-0001', 'superseded'), ('tablet1-0003', 'not_found'),
+        ('tablet1-0004', 'invalid')]
+    assert body['results'][0]['lift']['judge1_score'] is False
+    for pin in ('2222', '3333'):
+        client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': True})
+    late = client.post('/scores', json={'judge_pin': '1111', 'decisions': [
+        {'decision_id': 'tablet1-0005', 'lift_id': lift['id'], 'score': True, 'sequence': 3}]}).get_json()
+    assert late['results'][0]['status'] == 'decided'
+    with meet.app.app_context():
+        row = meet.db.session.get(meet.Lift, lift['id'])
+        assert (row.judge1_score, row.overall_result) == (False, True)
+        assert meet.JudgeDecision.query.count() == 4 # The invalid one is not stored
+
+
+@pytest.mark.parametrize('body, status', [({'judge_pin': '9999', 'decisions': []}, 403),
+                                          ({'judge_pin': '1111', 'decisions': []}, 400),
+                                          ({'judge_pin': '1111', 'decisions': {}}, 400)])
+def test_offline_batch_rejected_as_a_whole(client, body, status):
+    assert client.post('/scores', json=body).status_code == status
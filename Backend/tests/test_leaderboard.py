@@ -0,0 +1,65 @@
+"""The leaderboard: best good lift per lift type, totals, coefficients and ranking."""
+import pytest
+
+import app as meet
+
+JUDGE_PINS = ('1111', '2222', '3333')
+
+
+def decide(client, lifter_id, lift_type, attempt, good, weight=None):
+    lift = next(lift for lift in client.get('/lifts').get_json() if lift['lifter_id'] == lifter_id
+                and lift['lift_type'] == lift_type and lift['attempt_number'] == attempt)
+    if weight is not None:
+        assert client.post(f"/lifts/{lift['id']}/declare", json={'weight': weight}).status_code == 200
+    client.post('/set_active_lift', json={'lift_id': lift['id']})
+    for pin in JUDGE_PINS:
+        client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': good})
+
+
+@pytest.mark.parametrize('score, total, bodyweight, gender, expected', [
+    (meet.dots_score, 700, 100, 'Male', 430.86),
+    (meet.wilks_score, 700, 100, 'Male', 426.01),
+    (meet.ipf_gl_score, 700, 100, 'Male', 88.43),
+    (meet.dots_score, 400, 60, 'Female', 443.42),
+    (meet.wilks_score, 400, 60, 'Female', 445.95),
+    (meet.ipf_gl_score, 400, 60, 'Female', 90.42),
+    (meet.dots_score, 700, 300, 'Male', 346.93), # Clamped to the 210 kg the formula was fitted on
+    (meet.dots_score, 0, 100, 'Male', None),
+])
+def test_coefficients(score, total, bodyweight, gender, expected):
+    assert score(total, bodyweight, gender) == expected
+
+
+def test_totals_count_best_good_lift_per_type(client, add_lifter):
+    lifter = add_lifter(1, actual_weight=100.0, opener_squat=250.0, opener_bench=150.0, opener_deadlift=300.0)
+    assert client.get('/leaderboard').get_json() == [] # Loaded now, updated per good lift from here
+    decide(client, lifter['id'], 'squat', 1, True)
+    decide(client, lifter['id'], 'squat', 2, False, weight=260)
+    decide(client, lifter['id'], 'bench', 1, True)
+    decide(client, lifter['id'], 'deadlift', 1, True)
+
+    entry = client.get('/leaderboard').get_json()[0]
+
+    assert (entry['best_squat'], entry['best_bench'], entry['best_deadlift'], entry['total_lift']) == \
+        (250.0, 150.0, 300.0, 700.0)
+    assert (entry['dots'], entry['wilks'], entry['ipf_gl']) == (430.86, 426.01, 88.43)
+    meet.leaderboard.invalidate() # Loading from the database gives the same standings
+    assert client.get('/leaderboard').get_json()[0] == entry
+
+
+def test_ranking_filters_and_sort(client, add_lifter):
+    heavy = add_lifter(1, actual_weight=120.0, opener_squat=300.0)
+    light = add_lifter(2, actual_weight=66.0, opener_squat=250.0)
+    woman = add_lifter(3, gender='Female', actual_weight=60.0, opener_squat=150.0)
+    for lifter in (heavy, light, woman):
+        decide(client, lifter['id'], 'squat', 1, True)
+
+    def ranked(query=''):
+        return [entry['lifter_id'] for entry in client.get(f'/leaderboard?{query}').get_json()]
+
+    assert ranked() == [heavy['id'], light['id'], woman['id']]
+    assert ranked('sort=dots') == [light['id'], heavy['id'], woman['id']]
+    assert ranked('gender=Female') == [woman['id']]
+    assert ranked(f"weight_class_id={light['primary_weight_class_id']}") == [light['id']]
+    assert ranked('limit=1') == [heavy['id']]
+    assert client.get('/leaderboard?sort=best').status_code == 400
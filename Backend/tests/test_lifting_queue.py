@@ -0,0 +1,33 @@
+"""GET /next_lift_in_queue serves the round's pending lifts in lifting order."""
+
+
+def queue(client, **params):
+    query = '&'.join(f'{key}={value}' for key, value in params.items())
+    return [(lift['lifter_id'], lift['weight_lifted']) for lift in
+            client.get(f'/next_lift_in_queue?{query}').get_json()['lifts']]
+
+
+def test_lightest_bar_first_then_lifter_id(client, add_lifter):
+    heavy, light, tied = (add_lifter(1, opener_squat=160.0), add_lifter(2, opener_squat=140.0),
+                          add_lifter(3, opener_squat=140.0))
+
+    assert queue(client) == [(light['id'], 140.0), (tied['id'], 140.0), (heavy['id'], 160.0)]
+    assert queue(client, limit=1) == [(light['id'], 140.0)]
+    assert queue(client, lift_type='bench', attempt_number=2) == \
+        [(heavy['id'], 105.0), (light['id'], 105.0), (tied['id'], 105.0)] # Same bar: lifter id order
+
+
+def test_queue_follows_activation_and_declarations(client, add_lifter):
+    first, second = add_lifter(1, opener_squat=140.0), add_lifter(2, opener_squat=150.0)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    assert lift['lifter_id'] == first['id']
+    assert queue(client) == [(second['id'], 150.0)]
+
+    for pin in ('1111', '2222', '3333'):
+        client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': pin, 'score': True})
+    second_attempt = next(lift for lift in client.get('/lifts').get_json() if lift['lifter_id'] == first['id']
+                          and lift['lift_type'] == 'squat' and lift['attempt_number'] == 2)
+    assert client.post(f"/lifts/{second_attempt['id']}/declare", json={'weight': 160}).status_code == 200
+
+    assert queue(client) == [(second['id'], 150.0)] # Still attempt 1
+    assert queue(client, attempt_number=2) == [(second['id'], 155.0), (first['id'], 160.0)]
@@ -0,0 +1,41 @@
+"""The meet state cache: write-through for this worker, revalidated for others' writes."""
+from sqlalchemy import update
+
+import app as meet
+from test_query_counts import counted_queries
+
+
+def write_behind_cache(lift_type):
+    """Changes platform 1's meet state the way another worker would."""
+    with meet.app.app_context():
+        meet.db.session.execute(update(meet.MeetState).where(meet.MeetState.platform == 1).values(
+            current_lift_type=lift_type, version=meet.MeetState.version + 1))
+        meet.db.session.commit()
+
+
+def test_own_writes_are_read_back_without_queries(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'MEET_STATE_REVALIDATE_SECONDS', 3600)
+    client.post('/meet_state', json={'current_lift_type': 'bench'})
+
+    with counted_queries() as statements:
+        state = client.get('/meet_state').get_json()
+        assert client.get('/current_lift').get_json() == {}
+    assert (state['current_lift_type'], state['version']) == ('bench', 2)
+    assert statements == []
+
+
+def test_other_workers_writes_show_after_revalidation(client, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'MEET_STATE_REVALIDATE_SECONDS', -1) # Never revalidate
+    assert client.get('/meet_state').get_json()['current_lift_type'] == 'squat'
+    write_behind_cache('deadlift')
+    assert client.get('/meet_state').get_json()['current_lift_type'] == 'squat'
+
+    monkeypatch.setitem(app.config, 'MEET_STATE_REVALIDATE_SECONDS', 0)
+    with counted_queries() as statements:
+        state = client.get('/meet_state').get_json()
+    assert (state['current_lift_type'], state['version']) == ('deadlift', 2)
+    assert len(statements) >= 2 # Version check, then the reload
+
+    with counted_queries() as statements:
+        client.get('/meet_state')
+    assert len(statements) == 1 # Still current: only the version check
@@ -0,0 +1,105 @@
+"""Starting a new meet scopes the lift and lifter routes to it; classes and records
+are shared across meets."""
+
+
+def test_lifts_of_an_earlier_meet_are_not_found(client, add_lifter):
+    add_lifter(1)
+    old_lifts = client.get('/lifts').get_json()
+    assert client.post('/meets', json={'name': 'Meet 2'}).status_code == 201
+    add_lifter(1)
+    new_lift = next(lift for lift in client.get('/lifts').get_json() if lift['lift_type'] == 'squat'
+                    and lift['attempt_number'] == 2)
+    old_lift = next(lift for lift in old_lifts if lift['lift_type'] == 'squat' and lift['attempt_number'] == 1)
+
+    response = client.post('/set_active_lift', json={'lift_id': old_lift['id']})
+    assert response.status_code == 404
+    response = client.post(f"/lifts/{old_lift['id']}/declare", json={'weight': 160})
+    assert response.status_code == 404
+    assert client.get('/current_lift').get_json() == {}
+
+    response = client.post(f"/lifts/{new_lift['id']}/declare", json={'weight': 160})
+    assert response.status_code == 409 # Found; attempt 1 is not decided yet
+    first = next(lift for lift in client.get('/lifts').get_json() if lift['lift_type'] == 'squat'
+                 and lift['attempt_number'] == 1)
+    assert client.post('/set_active_lift', json={'lift_id': first['id']}).get_json()['id'] == first['id']
+
+
+def test_class_of_an_archived_lifter_is_not_deleted(client, add_lifter):
+    lifter = add_lifter(1)
+    additional = client.get('/age_classes').get_json()[-1]['id']
+    response = client.post(f"/lifters/{lifter['id']}/add_additional_age_class", json={'age_class_id': additional})
+    assert response.status_code == 200
+    assert client.post('/meets', json={'name': 'Meet 2'}).status_code == 201
+
+    for path in (f"/weight_classes/{lifter['primary_weight_class_id']}",
+                 f"/age_classes/{lifter['primary_age_class_id']}", f'/age_classes/{additional}'):
+        response = client.delete(path)
+        assert response.status_code == 409, path
+        assert 'archived meet' in response.get_json()['error']
+
+    archived = client.get(f"/lifters?meet_id={lifter['meet_id']}").get_json()[0]
+    assert archived['primary_weight_class_id'] == lifter['primary_weight_class_id']
+    assert archived['additional_age_class_ids'] == [additional]
+    # A class no archived lifter uses is still deleted, moving the active meet's lifters off it
+    current = add_lifter(2)
+    response = client.post('/weight_classes', json={'name': 'Test 81', 'min_weight': 74.005, 'max_weight': 81.0,
+                                                    'gender': 'Male'})
+    new_class = response.get_json()['id']
+    assert client.get('/lifters').get_json()[0]['primary_weight_class_id'] == new_class
+    assert client.delete(f'/weight_classes/{new_class}').status_code == 200
+    assert client.get('/lifters').get_json()[0]['primary_weight_class_id'] == current['primary_weight_class_id']
+
+
+def test_lifters_of_an_earlier_meet_are_not_found(client, add_lifter):
+    old = add_lifter(1)
+    old_lift = client.get('/lifts').get_json()[0]
+    assert client.get(f"/lifts/{old_lift['id']}/declarations").status_code == 200
+    assert client.post('/meets', json={'name': 'Meet 2'}).status_code == 201
+    weight_class = client.get('/weight_classes').get_json()[0]['id']
+    age_class = client.get('/age_classes').get_json()[0]['id']
+    since = client.get('/sync').get_json()['revision']
+
+    requests = [('platform', {'platform': 1, 'flight': 'B'}),
+                ('add_additional_weight_class', {'weight_class_id': weight_class}),
+                ('remove_additional_weight_class', {'weight_class_id': weight_class}),
+                ('add_additional_age_class', {'age_class_id': age_class}),
+                ('remove_additional_age_class', {'age_class_id': age_class})]
+    for path, body in requests:
+        response = client.post(f"/lifters/{old['id']}/{path}", json=body)
+        assert response.status_code == 404, path
+        assert response.get_json() == {'error': 'Lifter not found'}
+    assert client.get(f"/lifts/{old_lift['id']}/declarations").status_code == 404
+
+    assert client.get('/sync').get_json()['revision'] == since # Nothing was logged
+    archived = client.get(f"/lifters?meet_id={old['meet_id']}").get_json()[0]
+    assert (archived['flight'], archived['additional_weight_class_ids']) == ('A', [])
+
+
+def good_lift(client, lift_id):
+    assert client.post('/set_active_lift', json={'lift_id': lift_id}).status_code == 200
+    for pin in ('1111', '2222', '3333'):
+        client.post(f'/lifts/{lift_id}/score', json={'judge_pin': pin, 'score': True})
+
+
+def squat_opener(client):
+    return next(lift for lift in client.get('/lifts').get_json() if lift['lift_type'] == 'squat'
+                and lift['attempt_number'] == 1)
+
+
+def test_records_carry_over_to_the_next_meet(client, add_lifter):
+    first = add_lifter(1, opener_squat=150.0)
+    good_lift(client, squat_opener(client)['id'])
+    assert client.post('/meets', json={'name': 'Meet 2'}).status_code == 201
+    second = add_lifter(1, opener_squat=155.0) # The same lifter, registered again
+    opener = squat_opener(client)
+
+    attempt = client.get(f"/lifts/{opener['id']}/records").get_json()
+    assert sorted(attempt['record_attempt']) == ['national', 'personal'] # No meet record in this meet yet
+    assert attempt['records']['personal']['record_meet_id'] == first['meet_id']
+    assert attempt['records']['meet'] is None
+
+    good_lift(client, opener['id'])
+    records = client.get('/records?lift_type=squat').get_json()
+    assert sorted((record['scope'], record['meet_id'], record['weight']) for record in records) == [
+        ('meet', first['meet_id'], 150.0), ('meet', second['meet_id'], 155.0), ('national', None, 155.0),
+        ('personal', None, 155.0)]
@@ -0,0 +1,179 @@
+"""Two app processes sharing Socket.IO events (and cache invalidations) through the
+PostgreSQL message queue. Needs a PostgreSQL database it may wipe: TEST_POSTGRES_URL,
+postgresql://postgres@localhost/meet_test by default; skipped if it is unreachable."""
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+import psycopg2
+import pytest
+import requests
+import socketio
+
+from conftest import BACKEND_DIR
+
+POSTGRES_URL = os.environ.get('TEST_POSTGRES_URL', 'postgresql://postgres@localhost/meet_test')
+JUDGE_PINS = ('1111', '2222', '3333')
+
+
+def postgres_available():
+    try:
+        psycopg2.connect(POSTGRES_URL, connect_timeout=3).close()
+    except psycopg2.Error:
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(not postgres_available(), reason=f"PostgreSQL is not reachable at {POSTGRES_URL}")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Worker exited with {process.returncode}")
+        try:
+            if requests.get(f'{url}/platforms', timeout=2).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Worker at {url} did not start")
+
+
+class EventRecorder:
+    """A Socket.IO client that keeps every event it receives."""
+
+    def __init__(self, url):
+        self.events = []
+        self._received = threading.Condition()
+        self.client = socketio.Client()
+        self.client.on('*', self._record)
+        self.client.connect(f'{url}?role=organizer', transports=['polling'])
+
+    def _record(self, event, data=None):
+        with self._received:
+            self.events.append((event, data))
+            self._received.notify_all()
+
+    def wait_for(self, event, match=lambda data: True, timeout=10):
+        def found():
+            return next((data for name, data in self.events if name == event and match(data)), None)
+        with self._received:
+            if not self._received.wait_for(lambda: found() is not None, timeout):
+                raise AssertionError(f"No {event!r} received; got {[name for name, _ in self.events]}")
+            return found()
+
+
+@pytest.fixture
+def workers():
+    """Base URLs of two freshly started app processes on the same database and queue."""
+    conn = psycopg2.connect(POSTGRES_URL)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("DROP SCHEMA public CASCADE; CREATE SCHEMA public")
+    conn.close()
+    env = {**os.environ, 'DATABASE_URL': POSTGRES_URL, 'SOCKETIO_MESSAGE_QUEUE': POSTGRES_URL,
+           'SOCKETIO_CHANNEL': f'meet-test-{uuid.uuid4().hex[:8]}', 'AUTO_INIT_DB': '0',
+           'CACHE_SNAPSHOT_SECONDS': '0', 'SOCKETIO_EMIT_QUEUE_SIZE': '1000', # Background sender, as deployed
+           # Never re-check the database: workers only learn of each other's writes from events
+           'MEET_STATE_REVALIDATE_SECONDS': '-1', 'RESPONSE_CACHE_REVALIDATE_SECONDS': '3600'}
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'init-db'], cwd=BACKEND_DIR, env=env,
+                   check=True, capture_output=True)
+    processes, urls = [], []
+    try:
+        for _ in range(2):
+            port = free_port()
+            processes.append(subprocess.Popen([sys.executable, 'app.py'], cwd=BACKEND_DIR,
+                                              env={**env, 'PORT': str(port)},
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            urls.append(f'http://127.0.0.1:{port}')
+        for url, process in zip(urls, processes):
+            wait_until_up(url, process)
+        yield urls
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(10)
+
+
+@pytest.fixture
+def recorders(workers):
+    recorders = [EventRecorder(url) for url in workers]
+    yield recorders
+    for recorder in recorders:
+        recorder.client.disconnect()
+
+
+def register(url, number):
+    response = requests.post(f'{url}/lifters', json={
+        'name': f'Lifter {number}', 'gender': 'Male', 'lifter_id_number': f'MQ{number:04d}', 'actual_weight': 82.5,
+        'birth_date': '1990-01-01', 'opener_squat': 150 + number, 'opener_bench': 100, 'opener_deadlift': 200})
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_event_from_one_worker_reaches_clients_of_both(workers, recorders):
+    lifter = register(workers[0], 1)
+
+    for recorder in recorders:
+        assert recorder.wait_for('lifter_added', lambda data: data['id'] == lifter['id'])['name'] == 'Lifter 1'
+
+
+def test_other_worker_caches_follow_events(workers, recorders):
+    first, second = workers
+    assert requests.get(f'{second}/next_lift_in_queue').json()['lifts'] == [] # Loads the second worker's queue
+    assert requests.get(f'{second}/current_lift').json() == {}
+    assert requests.get(f'{second}/leaderboard').json() == []
+
+    lifter = register(first, 1)
+    recorders[1].wait_for('lifter_added')
+    queue = requests.get(f'{second}/next_lift_in_queue').json()['lifts']
+    assert [(lift['lifter_id'], lift['lift_type'], lift['attempt_number']) for lift in queue] == \
+        [(lifter['id'], 'squat', 1)]
+
+    active = requests.post(f'{first}/set_active_lift', json={}).json()
+    recorders[1].wait_for('active_lift_changed', lambda data: data and data['id'] == active['id'])
+    assert requests.get(f'{second}/current_lift').json()['id'] == active['id']
+    assert requests.get(f'{second}/next_lift_in_queue').json()['lifts'] == []
+
+    for pin in JUDGE_PINS:
+        assert requests.post(f"{first}/lifts/{active['id']}/score", json={'judge_pin': pin, 'score': True}).ok
+    recorders[1].wait_for('lift_updated', lambda data: data.get('overall_result') is True)
+    current = requests.get(f'{second}/current_lift').json()
+    assert (current['status'], current['overall_result']) == ('completed', True)
+    standings = requests.get(f'{second}/leaderboard').json()
+    assert [(entry['lifter_id'], entry['best_squat']) for entry in standings] == [(lifter['id'], 151)]
+
+
+def test_records_rebuild_reaches_other_worker(workers, recorders):
+    first, second = workers
+    lifter = register(first, 1)
+    opener = requests.post(f'{first}/set_active_lift', json={}).json()
+    for pin in JUDGE_PINS:
+        assert requests.post(f"{first}/lifts/{opener['id']}/score", json={'judge_pin': pin, 'score': True}).ok
+    lifts = requests.get(f'{second}/lifts').json()
+    second_attempt = next(lift for lift in lifts if lift['lifter_id'] == lifter['id']
+                          and lift['lift_type'] == 'squat' and lift['attempt_number'] == 2)
+    assert 'personal' in requests.get(f"{second}/lifts/{second_attempt['id']}/records").json()['record_attempt']
+
+    # The opener's result is corrected to no lift, so the lifter holds no squat record anymore
+    conn = psycopg2.connect(POSTGRES_URL)
+    with conn, conn.cursor() as cursor:
+        cursor.execute("UPDATE lift SET overall_result = false WHERE id = %s", (opener['id'],))
+    conn.close()
+    assert requests.post(f'{first}/records/rebuild').ok
+    recorders[1].wait_for('records_rebuilt')
+
+    assert requests.get(f"{second}/lifts/{second_attempt['id']}/records").json()['record_attempt'] == []
@@ -0,0 +1,65 @@
+"""GET /metrics counts requests, SQL statements and emits; the slow-request profiler
+keeps the requests slower than its threshold."""
+import re
+
+import pytest
+
+import app as meet
+
+
+def sample(client, name, **labels):
+    """Value of one sample of GET /metrics (0 if it is not there yet)."""
+    text = client.get('/metrics').get_data(as_text=True)
+    wanted = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf'^{re.escape(name)}{re.escape("{" + wanted + "}" if wanted else "")} (\S+)$', text, re.M)
+    return float(match.group(1)) if match else 0
+
+
+def test_metrics_count_requests_queries_and_emits(client, add_lifter, connect):
+    connect('role=organizer')
+    route = {'method': 'GET', 'route': '/lifters'}
+    requests_before = sample(client, 'meet_http_requests_total', **route, status=200)
+    emits_before = sample(client, 'meet_socketio_emits_total', event='lifter_added')
+
+    add_lifter(1)
+    client.get('/lifters')
+    client.get('/lifters')
+
+    assert sample(client, 'meet_http_requests_total', **route, status=200) == requests_before + 2
+    assert sample(client, 'meet_http_request_queries_count', **route) >= 2
+    assert sample(client, 'meet_db_queries_total', route='/lifters') > 0
+    assert sample(client, 'meet_socketio_emits_total', event='lifter_added') == emits_before + 1
+    assert sample(client, 'meet_socketio_clients', role='organizer') == 1
+    assert client.get('/metrics').mimetype == 'text/plain'
+
+
+@pytest.fixture
+def profiler_settings(app, monkeypatch):
+    for setting in ('PROFILER_ENABLED', 'SLOW_REQUEST_MS', 'PROFILER_INTERVAL_MS'):
+        monkeypatch.setitem(app.config, setting, app.config[setting]) # Restored after the test
+    yield
+    meet.profiler.slow_requests.clear()
+
+
+def test_profiler_keeps_slow_requests(client, profiler_settings):
+    settings = client.post('/metrics/profiler', json={'enabled': True, 'slow_request_ms': 0.001,
+                                                      'interval_ms': 1}).get_json()
+    assert (settings['enabled'], settings['slow_request_ms'], settings['interval_ms']) == (True, 0.001, 1.0)
+
+    client.get('/lifts')
+
+    slow = client.get('/metrics/profiler').get_json()['slow_requests']
+    assert [(request['method'], request['route']) for request in slow] == [('GET', '/lifts')]
+    assert slow[0]['queries'] >= 1 and slow[0]['duration_ms'] > 0
+    assert client.post('/metrics/profiler', json={'enabled': False, 'clear': True}).get_json()['slow_requests'] == []
+
+
+@pytest.mark.parametrize('body', [{'slow_request_ms': 0}, {'slow_request_ms': -5}, {'interval_ms': 'fast'},
+                                  {'interval_ms': True}, {'enabled': 'yes'}])
+def test_profiler_rejects_invalid_settings(client, profiler_settings, body):
+    before = client.get('/metrics/profiler').get_json()
+
+    response = client.post('/metrics/profiler', json=body)
+
+    assert response.status_code == 400
+    assert client.get('/metrics/profiler').get_json() == before
@@ -0,0 +1,91 @@
+"""`flask init-db` upgrades a database created before migrations existed."""
+from datetime import date
+
+import pytest
+from sqlalchemy import (Boolean, Column, Date, Float, ForeignKey, Integer, MetaData, String, Table, inspect,
+                        insert)
+
+import app as meet
+from conftest import reset_caches
+
+# The tables as the first version of the app created them
+baseline = MetaData()
+Table('weight_class', baseline, Column('id', Integer, primary_key=True),
+      Column('name', String(100), unique=True, nullable=False), Column('min_weight', Float, nullable=False),
+      Column('max_weight', Float), Column('gender', String(10), nullable=False))
+Table('age_class', baseline, Column('id', Integer, primary_key=True),
+      Column('name', String(100), unique=True, nullable=False), Column('min_age', Integer, nullable=False),
+      Column('max_age', Integer))
+lifter = Table('lifter', baseline, Column('id', Integer, primary_key=True), Column('name', String(100), nullable=False),
+               Column('gender', String(10), nullable=False),
+               Column('lifter_id_number', String(50), unique=True, nullable=False),
+               Column('actual_weight', Float, nullable=False), Column('birth_date', Date, nullable=False),
+               Column('opener_squat', Float), Column('opener_bench', Float), Column('opener_deadlift', Float),
+               Column('primary_weight_class_id', Integer, ForeignKey('weight_class.id')),
+               Column('primary_age_class_id', Integer, ForeignKey('age_class.id')))
+Table('lifter_additional_weight_class', baseline,
+      Column('lifter_id', Integer, ForeignKey('lifter.id'), primary_key=True),
+      Column('weight_class_id', Integer, ForeignKey('weight_class.id'), primary_key=True))
+Table('lifter_additional_age_class', baseline,
+      Column('lifter_id', Integer, ForeignKey('lifter.id'), primary_key=True),
+      Column('age_class_id', Integer, ForeignKey('age_class.id'), primary_key=True))
+lift = Table('lift', baseline, Column('id', Integer, primary_key=True),
+             Column('lifter_id', Integer, ForeignKey('lifter.id'), nullable=False),
+             Column('lift_type', String(50), nullable=False), Column('attempt_number', Integer, nullable=False),
+             Column('weight_lifted', Float, nullable=False), Column('status', String(50)),
+             Column('judge1_score', Boolean), Column('judge2_score', Boolean), Column('judge3_score', Boolean),
+             Column('overall_result', Boolean))
+meet_state = Table('meet_state', baseline, Column('id', Integer, primary_key=True),
+                   Column('current_lift_type', String(50)), Column('current_attempt_number', Integer),
+                   Column('current_active_lift_id', Integer, ForeignKey('lift.id')))
+
+
+@pytest.fixture
+def baseline_database(app):
+    with app.app_context():
+        meet.db.drop_all()
+        with meet.db.engine.begin() as connection:
+            baseline.create_all(connection)
+            connection.execute(insert(lifter).values(id=1, name='Old Lifter', gender='Male', lifter_id_number='OLD1',
+                                                     actual_weight=80.0, birth_date=date(1990, 1, 1)))
+            connection.execute(insert(lift), [
+                {'id': n, 'lifter_id': 1, 'lift_type': 'squat', 'attempt_number': n, 'weight_lifted': 140.0 + 5 * n,
+                 'status': 'completed' if n == 1 else 'pending', 'overall_result': True if n == 1 else None}
+                for n in (1, 2, 3)])
+            connection.execute(insert(meet_state).values(id=1, current_lift_type='squat', current_attempt_number=1))
+    reset_caches()
+
+
+def init_db(app):
+    result = app.test_cli_runner().invoke(args=['init-db'])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_baseline_database_is_upgraded(app, client, baseline_database):
+    versions = [version for version, _, _ in meet.MIGRATIONS]
+    assert init_db(app) == f'Schema is at version {versions[-1]} (applied {versions})\n'
+    reset_caches()
+
+    with app.app_context():
+        inspector = inspect(meet.db.engine)
+        for model in (meet.Lifter, meet.Lift, meet.MeetState, meet.MeetChange):
+            table = model.__table__
+            assert {index.name for index in table.indexes} <= {index['name'] for index in
+                                                              inspector.get_indexes(table.name)}, table.name
+        recorded = [row.version for row in meet.SchemaMigration.query.order_by(meet.SchemaMigration.version)]
+    assert recorded == versions
+
+    lifters = client.get('/lifters').get_json()
+    assert [(lifter['lifter_id_number'], lifter['platform'], lifter['flight']) for lifter in lifters] == \
+        [('OLD1', 1, 'A')]
+    assert lifters[0]['meet_id'] == client.get('/meets').get_json()[0]['id']
+    assert [lift['weight_lifted'] for lift in client.get('/next_lift_in_queue?attempt_number=2').get_json()['lifts']] \
+        == [150.0]
+    assert client.get('/records?scope=personal').get_json()[0]['weight'] == 145.0 # Rebuilt from the old results
+
+
+def test_init_db_is_idempotent(app, baseline_database):
+    init_db(app)
+
+    assert init_db(app) == f'Schema is at version {meet.MIGRATIONS[-1][0]}\n'
@@ -0,0 +1,57 @@
+"""Platforms and flights: each platform has its own meet state, active lift and queue."""
+import pytest
+
+import app as meet
+
+
+@pytest.fixture
+def two_platforms(client, monkeypatch):
+    monkeypatch.setitem(meet.app.config, 'MEET_PLATFORMS', 2)
+    with meet.app.app_context():
+        meet.ensure_meet_states()
+
+
+def queue(client, query):
+    return [lift['lifter_id'] for lift in client.get(f'/next_lift_in_queue?{query}').get_json()['lifts']]
+
+
+def test_platforms_run_independently(client, add_lifter, two_platforms):
+    first = add_lifter(1, platform=1)
+    second = add_lifter(2, platform=2)
+
+    assert queue(client, 'platform=1') == [first['id']]
+    assert queue(client, 'platform=2') == [second['id']]
+    lift = client.post('/set_active_lift', json={'platform': 2}).get_json()
+    assert lift['lifter_id'] == second['id']
+    assert client.get('/current_lift?platform=1').get_json() == {}
+    assert client.get('/current_lift?platform=2').get_json()['id'] == lift['id']
+    client.post('/meet_state', json={'platform': 1, 'current_lift_type': 'bench'})
+    states = {state['platform']: state for state in client.get('/platforms').get_json()}
+    assert (states[1]['current_lift_type'], states[2]['current_lift_type']) == ('bench', 'squat')
+    assert states[2]['active_lift']['id'] == lift['id']
+
+
+def test_moving_a_lifter_moves_their_pending_lifts(client, add_lifter, two_platforms):
+    lifter = add_lifter(1, platform=1)
+    client.get('/next_lift_in_queue?platform=2') # Loads platform 2's (empty) queue
+
+    response = client.post(f"/lifters/{lifter['id']}/platform", json={'platform': 2, 'flight': 'b'})
+
+    assert (response.get_json()['platform'], response.get_json()['flight']) == (2, 'B')
+    assert queue(client, 'platform=1') == []
+    assert queue(client, 'platform=2&flight=A') == []
+    assert queue(client, 'platform=2&flight=B') == [lifter['id']]
+
+
+def test_flights_split_the_queue(client, add_lifter):
+    flight_a, flight_b = add_lifter(1, flight='A'), add_lifter(2, flight='B')
+
+    assert queue(client, '') == [flight_a['id'], flight_b['id']] # No current flight: the whole platform
+    client.post('/meet_state', json={'current_flight': 'B'})
+    assert queue(client, '') == [flight_b['id']]
+    assert client.post('/set_active_lift', json={}).get_json()['lifter_id'] == flight_b['id']
+
+
+@pytest.mark.parametrize('query', ['platform=0', 'platform=3', 'platform=x', 'flight=ABCDEFGHIJK'])
+def test_invalid_platform_or_flight(client, two_platforms, query):
+    assert client.get(f'/next_lift_in_queue?{query}').status_code == 400
@@ -0,0 +1,61 @@
+"""Automatic lift progression and the loaders' bar breakdown."""
+import pytest
+
+import app as meet
+
+JUDGE_PINS = ('1111', '2222', '3333')
+
+
+def decide(client, lift_id, good=True):
+    for pin in JUDGE_PINS:
+        client.post(f'/lifts/{lift_id}/score', json={'judge_pin': pin, 'score': good})
+
+
+def current(client):
+    lift = client.get('/current_lift').get_json()
+    return (lift['lifter_id'], lift['lift_type'], lift['attempt_number']) if lift else None
+
+
+@pytest.mark.parametrize('weight, plates, collars, unloaded', [
+    (152.5, (25.0, 25.0, 10.0, 2.5, 1.25), True, 0),
+    (151.0, (25.0, 25.0, 10.0, 2.5, 0.5), True, 0),
+    (23.0, (1.25, 0.25), False, 0),
+    (20.0, (), False, 0),
+    (25.3, (), True, 0.15),
+])
+def test_plate_loading(weight, plates, collars, unloaded):
+    assert meet.plate_loading(weight) == {'plates_per_side': plates, 'collars': collars, 'unloaded_per_side': unloaded}
+
+
+def test_auto_advance_calls_next_lift_and_round(client, add_lifter):
+    first, second = add_lifter(1, opener_squat=140.0), add_lifter(2, opener_squat=150.0)
+    client.post('/meet_state', json={'auto_advance': True})
+    lift = client.post('/set_active_lift', json={}).get_json()
+    assert current(client) == (first['id'], 'squat', 1)
+
+    decide(client, lift['id'])
+    assert current(client) == (second['id'], 'squat', 1)
+    decide(client, client.get('/current_lift').get_json()['id'], good=False)
+
+    assert current(client) == (first['id'], 'squat', 2) # Round done: attempt 2, lightest bar first
+    assert client.get('/meet_state').get_json()['current_attempt_number'] == 2
+
+
+def test_without_auto_advance_the_platform_waits(client, add_lifter):
+    add_lifter(1)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    decide(client, lift['id'])
+
+    assert client.get('/current_lift').get_json()['status'] == 'completed'
+    assert client.get('/meet_state').get_json()['current_attempt_number'] == 1
+
+
+def test_loading_shows_bar_and_next_lifts(client, add_lifter):
+    first, second = add_lifter(1, opener_squat=140.0), add_lifter(2, opener_squat=152.5)
+    client.post('/set_active_lift', json={})
+
+    loading = client.get('/loading?limit=2').get_json()
+
+    assert [(lift['lifter_id'], lift['attempt_number'], lift['weight_lifted']) for lift in loading['lifts']] == \
+        [(first['id'], 1, 140.0), (second['id'], 1, 152.5), (first['id'], 2, 145.0)] # The bar, then what follows
+    assert loading['lifts'][1]['plates_per_side'] == [25.0, 25.0, 10.0, 2.5, 1.25]
@@ -0,0 +1,66 @@
+"""GET /lifters and GET /lifts build their payloads in a constant number of queries."""
+from contextlib import contextmanager
+
+from sqlalchemy import event, insert
+
+import app as meet
+
+
+@contextmanager
+def counted_queries():
+    """Yields the list of SQL statements run inside the block."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with meet.app.app_context():
+        engine = meet.db.engine
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+
+def import_lifters(client, first, count):
+    rows = [{'name': f'Lifter {n}', 'gender': 'Male' if n % 2 else 'Female', 'lifter_id_number': f'QC{n:05d}',
+             'actual_weight': 50 + n % 70, 'birth_date': f'{1960 + n % 45}-03-01', 'opener_squat': 100 + n % 50,
+             'opener_bench': 60 + n % 40, 'opener_deadlift': 120 + n % 80} for n in range(first, first + count)]
+    response = client.post('/lifters/import', json=rows)
+    assert response.status_code == 201, response.get_json()['errors'][:3]
+    # Every tenth lifter also competes in an additional weight class and age class
+    with meet.app.app_context():
+        weight_class_id = meet.WeightClass.query.first().id
+        age_class_id = meet.AgeClass.query.first().id
+        lifter_ids = [lifter_id for (lifter_id,) in meet.db.session.query(meet.Lifter.id).filter(
+            meet.Lifter.lifter_id_number.in_([row['lifter_id_number'] for row in rows[::10]]))]
+        meet.db.session.execute(insert(meet.lifter_additional_weight_class),
+                                [{'lifter_id': i, 'weight_class_id': weight_class_id} for i in lifter_ids])
+        meet.db.session.execute(insert(meet.lifter_additional_age_class),
+                                [{'lifter_id': i, 'age_class_id': age_class_id} for i in lifter_ids])
+        meet.db.session.commit()
+    meet.response_cache = meet.ResponseCache() # Class rows added behind the change log's back
+
+
+def query_count(client, path):
+    meet.table_revisions.invalidate() # Count the revision check too, whichever path runs first
+    with counted_queries() as statements:
+        response = client.get(path)
+    assert response.status_code == 200
+    return len(statements), response.get_json()
+
+
+def test_list_queries_do_not_grow_with_lifters(client):
+    import_lifters(client, 1, 10)
+    small = {path: query_count(client, path) for path in ('/lifters', '/lifts')}
+    import_lifters(client, 11, 990)
+    large = {path: query_count(client, path) for path in ('/lifters', '/lifts')}
+
+    assert len(large['/lifters'][1]) == 1000
+    assert len(large['/lifts'][1]) == 9000
+    assert sum(bool(lifter['additional_weight_class_ids']) for lifter in large['/lifters'][1]) == 100
+    for path in ('/lifters', '/lifts'):
+        assert large[path][0] == small[path][0], path
+    # Lifters: revision check, lifters, both additional class lists. Lifts: revision check, lifts + lifters
+    assert {path: count for path, (count, _) in large.items()} == {'/lifters': 4, '/lifts': 2}
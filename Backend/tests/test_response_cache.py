@@ -0,0 +1,61 @@
+"""ETags and the response cache of read-heavy GETs follow every committed change."""
+import app as meet
+
+
+def late_weight_change(revision, weight):
+    """Changes every squat opener and logs it under `revision`, below the latest one,
+    as a transaction that took its revision early but committed late would."""
+    with meet.app.app_context():
+        lift = meet.Lift.query.filter_by(lift_type='squat', attempt_number=1).one()
+        lift.weight_lifted = weight
+        lift.version += 1
+        meet.db.session.add(meet.MeetChange(id=revision, entity='lift', entity_id=lift.id, event='lift_updated',
+                                            version=lift.version,
+                                            changes={'weight_lifted': weight, 'version': lift.version}))
+        meet.db.session.commit()
+
+
+def log_lift_change(revision):
+    with meet.app.app_context():
+        meet.db.session.add(meet.MeetChange(id=revision, entity='lift', entity_id=0, event='lift_updated'))
+        meet.db.session.commit()
+
+
+def squat_opener(lifts):
+    return next(lift['weight_lifted'] for lift in lifts if lift['lift_type'] == 'squat'
+                and lift['attempt_number'] == 1)
+
+
+def test_unchanged_response_is_not_modified(client, add_lifter):
+    add_lifter(1)
+    first = client.get('/lifts')
+    assert first.status_code == 200 and first.headers['Cache-Control'] == 'no-cache'
+
+    assert client.get('/lifts', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+    assert client.get('/lifters', headers={'If-None-Match': first.headers['ETag']}).status_code == 200
+
+
+def test_write_changes_etag_and_body(client, add_lifter):
+    add_lifter(1)
+    first = client.get('/lifters')
+    add_lifter(2)
+
+    second = client.get('/lifters', headers={'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    assert len(second.get_json()) == 2
+
+
+def test_change_committed_late_below_latest_revision(client, add_lifter):
+    add_lifter(1)
+    seen = client.get('/sync').get_json()['revision']
+    log_lift_change(seen + 2)
+    first = client.get('/lifts')
+    assert squat_opener(first.get_json()) == 150.0
+
+    late_weight_change(seen + 1, 999.0)
+    second = client.get('/lifts', headers={'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert squat_opener(second.get_json()) == 999.0
@@ -0,0 +1,54 @@
+"""GET /snapshot: the meet as compact columns, revalidated with the table revisions."""
+import gzip
+import json
+
+import pytest
+
+import app as meet
+from test_response_cache import late_weight_change, log_lift_change
+
+
+def test_snapshot_columns(client, add_lifter):
+    lifter = add_lifter(1, gender='Female', actual_weight=60.0)
+    lift = client.post('/set_active_lift', json={}).get_json()
+    client.post(f"/lifts/{lift['id']}/score", json={'judge_pin': '1111', 'score': True})
+
+    snapshot = client.get('/snapshot?format=json').get_json()
+
+    assert snapshot['revision'] == client.get('/sync').get_json()['revision']
+    assert snapshot['lifters']['id'] == [lifter['id']]
+    assert snapshot['lifters']['gender'] == [meet.SNAPSHOT_CODES['gender']['Female']]
+    assert len(snapshot['lifts']['id']) == 9
+    i = snapshot['lifts']['id'].index(lift['id'])
+    assert snapshot['lifts']['status'][i] == meet.SNAPSHOT_CODES['status']['active']
+    assert snapshot['lifts']['decisions'][i] == meet.pack_decisions(True, None, None, None) == 1
+
+
+@pytest.mark.parametrize('fmt', ['json', 'ndjson'])
+def test_snapshot_gzip_and_not_modified(client, add_lifter, fmt):
+    add_lifter(1)
+    response = client.get(f'/snapshot?format={fmt}', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    body = gzip.decompress(response.get_data()).decode('utf-8')
+    if fmt == 'ndjson':
+        header, *rows = [json.loads(line) for line in body.splitlines()]
+        assert header['revision'] > 0 and len(rows) > 0
+    else:
+        assert len(json.loads(body)['lifts']['id']) == 9
+
+    again = client.get(f'/snapshot?format={fmt}', headers={'Accept-Encoding': 'gzip',
+                                                            'If-None-Match': response.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_snapshot_change_committed_late_below_latest_revision(client, add_lifter):
+    add_lifter(1)
+    seen = client.get('/sync').get_json()['revision']
+    log_lift_change(seen + 2)
+    first = client.get('/snapshot?format=json')
+
+    late_weight_change(seen + 1, 999.0)
+    second = client.get('/snapshot?format=json', headers={'If-None-Match': first.headers['ETag']})
+
+    assert second.status_code == 200
+    assert 999.0 in second.get_json()['lifts']['weight_lifted']
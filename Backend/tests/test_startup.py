@@ -0,0 +1,54 @@
+"""Workers import without a database and warm up on their first request (or via init-db)."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import app as meet
+from conftest import BACKEND_DIR, reset_caches
+
+
+@pytest.fixture
+def cold_worker(app, monkeypatch):
+    """A worker that has not warmed up yet, on a database without any tables."""
+    with app.app_context():
+        meet.db.drop_all()
+    reset_caches()
+    monkeypatch.setattr(meet, '_warmed_up', False)
+    return app
+
+
+def test_import_does_not_connect_to_the_database():
+    env = {**os.environ, 'DATABASE_URL': 'postgresql://nobody@127.0.0.1:1/unreachable', 'WARM_UP_ON_START': '1'}
+    result = subprocess.run([sys.executable, '-c', 'import app; app.create_app()'], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_first_request_initialises_missing_schema(cold_worker, monkeypatch):
+    monkeypatch.setitem(cold_worker.config, 'AUTO_INIT_DB', True)
+
+    response = cold_worker.test_client().get('/weight_classes')
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 16
+    assert meet._warmed_up
+    with cold_worker.app_context():
+        assert meet.schema_is_current()
+
+
+def test_warm_up_refuses_missing_schema_without_auto_init(cold_worker, monkeypatch):
+    monkeypatch.setitem(cold_worker.config, 'AUTO_INIT_DB', False)
+
+    with pytest.raises(RuntimeError, match='init-db'):
+        meet.warm_up()
+    assert not meet._warmed_up
+
+    result = cold_worker.test_cli_runner().invoke(args=['init-db', '--no-seed'])
+    assert result.exit_code == 0, result.output
+    meet.warm_up()
+    assert meet._warmed_up
+    with cold_worker.app_context():
+        assert meet.WeightClass.query.count() == 0 # --no-seed leaves the class tables empty
@@ -0,0 +1,55 @@
+"""GET /sync returns the changes after a client's revision, including late commits."""
+import app as meet
+
+
+def log_change(entity_id, changes, revision=None):
+    with meet.app.app_context():
+        change = meet.MeetChange(id=revision, entity='lift', entity_id=entity_id, event='lift_updated',
+                                 version=changes['version'], changes=changes)
+        meet.db.session.add(change)
+        meet.db.session.commit()
+        return change.id
+
+
+def test_sync_merges_changes_per_entity(client):
+    since = client.get('/sync').get_json()['revision']
+    log_change(1, {'status': 'active', 'version': 2})
+    log_change(1, {'judge1_score': True, 'version': 3})
+    revision = log_change(2, {'weight_lifted': 102.5, 'version': 2})
+
+    body = client.get(f'/sync?since={since}').get_json()
+
+    assert body['revision'] == revision
+    assert sorted(body['changes']['lift'], key=lambda lift: lift['id']) == [
+        {'id': 1, 'status': 'active', 'judge1_score': True, 'version': 3},
+        {'id': 2, 'weight_lifted': 102.5, 'version': 2},
+    ]
+
+
+def test_sync_returns_change_committed_late_below_since(client):
+    seen = client.get('/sync').get_json()['revision']
+    # A transaction took revision seen + 1 but commits only after one that took seen + 2
+    late = seen + 1
+    since = log_change(1, {'status': 'active', 'version': 2}, revision=seen + 2)
+    assert client.get(f'/sync?since={since}').get_json()['revision'] == since
+    log_change(2, {'weight_lifted': 105.0, 'version': 2}, revision=late)
+
+    body = client.get(f'/sync?since={since}').get_json()
+
+    assert body['revision'] == since
+    assert {'id': 2, 'weight_lifted': 105.0, 'version': 2} in body['changes']['lift']
+
+
+def test_meet_state_broadcast_carries_its_own_revision(client, add_lifter, connect):
+    add_lifter(1)
+    organizer = connect('role=organizer&platform=1')
+
+    client.post('/meet_state', json={'current_lift_type': 'bench'})
+    client.post('/meet_state', json={'current_lift_type': 'bench'}) # No change: nothing logged or sent
+
+    updates = [packet['args'][0] for packet in organizer.get_received() if packet['name'] == 'meet_state_updated']
+    with meet.app.app_context():
+        logged = [change.id for change in
+                  meet.MeetChange.query.filter_by(entity='meet_state', event='meet_state_updated')]
+    assert [(update['current_lift_type'], update['revision']) for update in updates] == [('bench', logged[0])]
+    assert len(logged) == 1